@@ -0,0 +1,98 @@
+"""
+Micro-benchmark for the module dependency graph (generators/module_graph.py).
+
+Times ModuleGraph on synthetic configurations (reference chains, so the graph
+is as deep as it is wide) against the previous recursive dependency order,
+which hits the recursion limit on long chains:
+
+    python benchmarks/graph_benchmark.py
+    python benchmarks/graph_benchmark.py --sizes 500,5000,20000 --cycle
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from benchmarks.synthetic_config import build_config, module_name
+from generators.module_graph import ModuleGraph
+
+
+def legacy_dependency_order(modules_config):
+    """Dependency order before ModuleGraph (recursive DFS, graph rebuilt on every call)"""
+    dependency_graph = {}
+    for module in modules_config:
+        dependency_graph[module.get('name')] = [field.get('reference') for field in module.get('fields', [])
+                                                if field.get('type') == 'reference' and field.get('reference')]
+
+    visited, temp_visited, result = set(), set(), []
+
+    def visit(module):
+        if module in temp_visited:
+            return False
+        if module in visited:
+            return True
+        temp_visited.add(module)
+        for dependency in dependency_graph.get(module, []):
+            if not visit(dependency):
+                return False
+        temp_visited.remove(module)
+        visited.add(module)
+        result.append(module)
+        return True
+
+    # Como antes: módulos visitados na ordem de um set
+    for module in set(dependency_graph):
+        if module not in visited and not visit(module):
+            return [m.get('name') for m in modules_config]
+    return result
+
+
+def _timed(func, repeat):
+    """Median wall time of `func` over `repeat` runs (seconds), or None when it raises RecursionError"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            func()
+        except RecursionError:
+            return None
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the FAC module dependency graph')
+    parser.add_argument('--sizes', default='500,5000', help='Comma-separated module counts (default: 500,5000)')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per measurement (default: 5)')
+    parser.add_argument('--cycle', action='store_true',
+                        help='Make the first module reference the last one (one cycle through every module)')
+    args = parser.parse_args(argv)
+
+    for size in [int(size) for size in args.sizes.split(',') if size.strip()]:
+        modules = build_config(modules=size, fields=2)['modules']
+        if args.cycle:
+            modules[0]['fields'].append({'name': 'lastId', 'type': 'reference', 'reference': module_name(size - 1)})
+
+        graph = ModuleGraph(modules)
+        legacy = _timed(lambda: legacy_dependency_order(modules), args.repeat)
+        current = _timed(lambda: ModuleGraph(modules), args.repeat)
+
+        print(f"⏱️ {size} modules: {graph}")
+        print(f"  {'legacy recursive order':<26} " +
+              (f"{legacy * 1000:9.2f} ms" if legacy is not None else "  RecursionError"))
+        print(f"  {'ModuleGraph (build once)':<26} {current * 1000:9.2f} ms")
+        for cycle in graph.cycles:
+            shown = cycle if len(cycle) <= 6 else cycle[:3] + ['...'] + cycle[-2:]
+            print(f"  cycle ({len(cycle) - 1} modules): {graph.format_cycle(shown)}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,191 @@
+"""
+Micro-benchmarks for the naming service (utils/case_converter.py, utils/word_processor.py).
+
+Builds the identifiers of a synthetic configuration (module names, field
+names and reverse relationship names) and times their case conversions and
+inflections with the previous per-call implementation, with the memoized
+service on a cold cache and on a warm cache, and through the batch API:
+
+    python benchmarks/naming_benchmark.py
+    python benchmarks/naming_benchmark.py --modules 1000 --passes 10
+"""
+
+import re
+import os
+import sys
+import time
+import argparse
+import statistics
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from benchmarks.synthetic_config import build_config
+from utils.case_converter import CaseConverter
+from utils.word_processor import WordProcessor, _engine
+from generators.config_compiler import compile_config, clear_compiled_cache
+
+CASES = ('snake', 'camel', 'pascal', 'kebab')
+
+
+def legacy_snake_case(text):
+    """to_snake_case before the naming service (six re.sub passes per call)"""
+    text = re.sub(r'([a-z])([A-Z])', r'\1_\2', text)
+    text = re.sub(r'([A-Z]+)([A-Z][a-z])', r'\1_\2', text)
+    text = re.sub(r'[^a-zA-Z0-9\s_]', '', text)
+    text = re.sub(r'\s+', '_', text)
+    text = text.lower()
+    text = re.sub(r'_+', '_', text)
+    text = text.strip('_')
+    if text and text[0].isdigit():
+        text = 'app_' + text
+    return text
+
+
+def legacy_convert(case, text):
+    """Case conversion before the naming service (every case goes through legacy_snake_case)"""
+    snake = legacy_snake_case(text)
+    if case == 'snake':
+        return snake
+    if case == 'kebab':
+        return snake.replace('_', '-')
+    components = snake.split('_')
+    if case == 'camel':
+        return components[0] + ''.join(x.title() for x in components[1:])
+    return ''.join(x.title() for x in components)
+
+
+def identifiers(config):
+    """Module, field and reverse relationship names of a configuration"""
+    names = []
+    for module in config['modules']:
+        names.append(module['name'])
+        for field in module.get('fields', []):
+            names.append(field['name'])
+            if field.get('type') == 'reference':
+                base_name = field['name'].replace('Id', '')
+                names.append(f"{module['name'].lower()}ListAs{base_name.capitalize()}")
+    return names
+
+
+def _timed(func, repeat):
+    """Median wall time of `func` over `repeat` runs (seconds)"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def bench_cases(names, passes, repeat):
+    """Case conversions: legacy vs memoized (cold and warm) vs batch"""
+    converter = CaseConverter()
+    methods = {case: getattr(converter, f'to_{case}_case') for case in CASES}
+
+    def legacy():
+        for _ in range(passes):
+            for case in CASES:
+                for name in names:
+                    legacy_convert(case, name)
+
+    def memoized():
+        for _ in range(passes):
+            for case in CASES:
+                convert = methods[case]
+                for name in names:
+                    convert(name)
+
+    def cold():
+        CaseConverter.clear_cache()
+        memoized()
+
+    def batch():
+        for _ in range(passes):
+            for case in CASES:
+                converter.convert_many(names, case)
+
+    results = {'legacy': _timed(legacy, repeat), 'memoized (cold cache)': _timed(cold, repeat)}
+    memoized()
+    results['memoized (warm cache)'] = _timed(memoized, repeat)
+    results['convert_many (warm cache)'] = _timed(batch, repeat)
+    return results
+
+
+def bench_inflection(words, passes, repeat):
+    """Pluralization: new engine and uncached calls per processor vs the shared memoized service"""
+    processor = WordProcessor('en')
+
+    def legacy():
+        import inflect
+        engine = inflect.engine()
+        for _ in range(passes):
+            for word in words:
+                engine.plural(word)
+
+    def cold():
+        WordProcessor.clear_cache()
+        for _ in range(passes):
+            for word in words:
+                processor.pluralize(word)
+
+    def warm():
+        for _ in range(passes):
+            processor.pluralize_many(words)
+
+    results = {'legacy': _timed(legacy, repeat)}
+    _engine('en')
+    results['memoized (cold cache)'] = _timed(cold, repeat)
+    warm()
+    results['pluralize_many (warm cache)'] = _timed(warm, repeat)
+    return results
+
+
+def bench_compile(config, repeat):
+    """compile_config with cold and warm naming caches (the IR memo is cleared before each run)"""
+    def compile_copy():
+        clear_compiled_cache()
+        compile_config(config)
+
+    def cold():
+        CaseConverter.clear_cache()
+        compile_copy()
+
+    results = {'cold naming cache': _timed(cold, repeat)}
+    compile_copy()
+    results['warm naming cache'] = _timed(compile_copy, repeat)
+    return results
+
+
+def _print(title, results):
+    baseline = next(iter(results.values()))
+    print(f"\n{title}")
+    for label, seconds in results.items():
+        speedup = baseline / seconds if seconds else float('inf')
+        print(f"  {label:<30} {seconds * 1000:9.2f} ms  x{speedup:6.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the FAC naming service')
+    parser.add_argument('--modules', type=int, default=500, help='Synthetic modules (default: 500)')
+    parser.add_argument('--fields', type=int, default=8, help='Scalar fields per module (default: 8)')
+    parser.add_argument('--passes', type=int, default=5,
+                        help='Times each name is converted, as by several templates (default: 5)')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per measurement (default: 5)')
+    args = parser.parse_args(argv)
+
+    config = build_config(modules=args.modules, fields=args.fields)
+    names = identifiers(config)
+    module_names = [module['name'] for module in config['modules']]
+    print(f"⏱️ {args.modules} modules, {len(names)} identifiers ({len(set(names))} distinct), "
+          f"{args.passes} pass(es), median of {args.repeat}")
+
+    _print('Case conversions (snake, camel, pascal, kebab)', bench_cases(names, args.passes, args.repeat))
+    _print('Pluralization of module names (en)', bench_inflection(module_names, args.passes, args.repeat))
+    _print('compile_config', bench_compile(config, args.repeat))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,216 @@
+"""
+Benchmark suite for the FAC generator.
+
+Generates synthetic configurations (see synthetic_config.py) and times config
+loading, config compilation, template rendering per generator and file
+emission, with FlutterCLI stubbed out. Results are written as JSON so they can
+be compared across commits:
+
+    python benchmarks/run_benchmarks.py --sizes 10,100,500
+    python benchmarks/run_benchmarks.py --compare benchmarks/results/<previous>.json
+"""
+
+import os
+import io
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+from contextlib import redirect_stdout
+from datetime import datetime
+
+import yaml
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from benchmarks.synthetic_config import build_config
+from benchmarks.stub_flutter import StubFlutterCLI
+from generators.app_generator import AppGenerator
+from generators.model_generator import ModelGenerator
+from generators.config_compiler import compile_config, clear_compiled_cache
+
+RESULTS_DIR = os.path.join(ROOT_DIR, 'benchmarks', 'results')
+
+
+def _timed(func):
+    """Run `func` and return (elapsed seconds, result)"""
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def run_once(config_path, config, output_dir, jobs):
+    """
+    Time every stage of one generation of `config`.
+
+    Returns:
+        tuple: (stage -> seconds, files written, bytes written)
+    """
+    stages = {}
+    generator = AppGenerator(config_path=config_path, output_dir=output_dir, jobs=jobs,
+                             require_flutter=False, use_skeleton_cache=False)
+
+    stages['config_load'], _ = _timed(generator._load_config)
+
+    clear_compiled_cache()
+    stages['config_compile'], _ = _timed(lambda: compile_config(config))
+    model_generator = ModelGenerator(output_dir, config)
+    stages['dependency_order'], _ = _timed(model_generator.get_dependency_order)
+
+    stub = StubFlutterCLI()
+    stub.profiler = generator.profiler
+    generator.flutter_cli = stub
+    generator.dependency_manager.flutter_cli = stub
+
+    with redirect_stdout(io.StringIO()):
+        stages['generate_total'], _ = _timed(generator.generate)
+
+    for row in generator.profiler.summary():
+        if row['category'] != 'phase':
+            continue
+        prefix = 'emit' if row['name'] == 'flush' else 'render'
+        stages[f"{prefix}.{row['name']}"] = row['wall']
+
+    return stages, generator.file_manager.stats['written'], generator.file_manager.stats['bytes']
+
+
+def bench_size(modules, fields, repeat, jobs, work_dir):
+    """Benchmark one synthetic configuration size"""
+    config = build_config(modules=modules, fields=fields)
+    config_path = os.path.join(work_dir, f"bench_{modules}.yaml")
+    with open(config_path, 'w', encoding='utf-8') as f:
+        yaml.safe_dump(config, f, sort_keys=False)
+
+    samples = {}
+    files = total_bytes = 0
+    for _ in range(repeat):
+        output_dir = os.path.join(work_dir, f"out_{modules}")
+        shutil.rmtree(output_dir, ignore_errors=True)
+        os.makedirs(output_dir)
+
+        stages, files, total_bytes = run_once(config_path, config, output_dir, jobs)
+        for stage, seconds in stages.items():
+            samples.setdefault(stage, []).append(seconds)
+
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+    return {
+        'modules': modules,
+        'fields': fields,
+        'jobs': jobs,
+        'repeat': repeat,
+        'files': files,
+        'bytes': total_bytes,
+        'stages': {
+            stage: {
+                'min': min(values),
+                'median': statistics.median(values),
+                'max': max(values),
+            }
+            for stage, values in samples.items()
+        },
+    }
+
+
+def _git_commit():
+    """Current commit of the repository, if available"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR, check=True,
+                              capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline, threshold, min_delta):
+    """
+    Print the median of every stage against a baseline results file.
+
+    Returns:
+        int: Number of stages slower than `threshold` x baseline (and by more than `min_delta` seconds).
+    """
+    regressions = 0
+    previous = {(r['modules'], r['fields']): r for r in baseline.get('results', [])}
+
+    print(f"\nComparison with {baseline.get('git_commit') or 'baseline'} ({baseline.get('timestamp')}):")
+    for result in results:
+        base = previous.get((result['modules'], result['fields']))
+        if not base:
+            continue
+
+        print(f"  {result['modules']} modules x {result['fields']} fields")
+        for stage, values in result['stages'].items():
+            if stage not in base['stages']:
+                continue
+            old = base['stages'][stage]['median']
+            new = values['median']
+            ratio = new / old if old else float('inf')
+            slower = ratio > threshold and new - old > min_delta
+            regressions += slower
+            print(f"    {stage:<28} {old:>9.4f}s -> {new:>9.4f}s  x{ratio:5.2f}{'  ⚠️ regression' if slower else ''}")
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the FAC generator with synthetic configurations')
+    parser.add_argument('--sizes', default='10,100,500', help='Comma-separated module counts (default: 10,100,500)')
+    parser.add_argument('--fields', type=int, default=8, help='Scalar fields per module (default: 8)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per size (default: 3)')
+    parser.add_argument('--jobs', type=int, default=1, help='Parallel module generation (default: 1)')
+    parser.add_argument('--output', help='Results file (default: benchmarks/results/<commit>-<timestamp>.json)')
+    parser.add_argument('--compare', help='Previous results file to compare against')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='Slowdown ratio reported as a regression (default: 1.25)')
+    parser.add_argument('--min-delta', type=float, default=0.005,
+                        help='Ignore slowdowns smaller than this many seconds (default: 0.005)')
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    commit = _git_commit()
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix='fac-bench-') as work_dir:
+        for modules in sizes:
+            print(f"⏱️ {modules} modules x {args.fields} fields ({args.repeat} run(s))...")
+            result = bench_size(modules, args.fields, args.repeat, args.jobs, work_dir)
+            results.append(result)
+
+            stages = result['stages']
+            print(f"  {result['files']} files, {result['bytes']} bytes, "
+                  f"generate {stages['generate_total']['median']:.3f}s (median)")
+            for stage, values in stages.items():
+                print(f"    {stage:<28} {values['median']:.4f}s")
+
+    report = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'git_commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"{commit or 'nocommit'}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n📊 Results written to {output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold, args.min_delta):
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""
+Upgrade-path check for the versioned SQLite schema (generators/sqlite_schema_compiler.py).
+
+Creates a database with the schema of a configuration, inserts a row, adds
+optional and required fields of every type to the module and runs the
+migration compiled from the diff. The row that existed before the migration
+is then read back the way the generated fromJson reads it: every column of a
+non-nullable Dart type must have a value of that type. Exits with 1 otherwise:
+
+    python benchmarks/schema_upgrade_check.py
+"""
+
+import os
+import sys
+import sqlite3
+import argparse
+from datetime import datetime
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from generators.sqlite_schema_compiler import build_schema, column_defaults, diff_schema
+from generators.sqlite_schema_generator import get_column_name
+
+# Fields added by the new configuration version: (name, type, required)
+ADDED_FIELDS = [
+    ('colorCode', 'String', False),
+    ('position', 'int', False),
+    ('weight', 'double', False),
+    ('active', 'bool', False),
+    ('startsAt', 'DateTime', False),
+    ('notes', 'String?', False),
+    ('tags', 'List<String>', False),
+    ('teamId', 'reference', False),
+    ('code', 'String', True),
+    ('closesAt', 'DateTime', True),
+]
+
+
+def _modules(extra_fields=()):
+    """Team and Category modules; Category gets `extra_fields`"""
+    fields = [{'name': 'name', 'type': 'String', 'required': True}]
+    for name, field_type, required in extra_fields:
+        field = {'name': name, 'type': field_type, 'required': required}
+        if field_type == 'reference':
+            field['reference'] = 'Team'
+        fields.append(field)
+    return [
+        {'name': 'Team', 'fields': [{'name': 'name', 'type': 'String', 'required': True}]},
+        {'name': 'Category', 'fields': fields},
+    ]
+
+
+def _read_error(field_type, value):
+    """What fromJson would fail on when reading `value` as `field_type` (None when it reads fine)"""
+    if field_type.endswith('?') or field_type.startswith('List') or field_type == 'reference':
+        return None
+    if value is None:
+        return 'NULL'
+    expected = {'String': str, 'int': int, 'bool': int, 'double': float, 'DateTime': str}.get(field_type)
+    if expected is not None and not isinstance(value, expected):
+        return f"{type(value).__name__} {value!r}"
+    if field_type == 'DateTime':
+        try:
+            datetime.fromisoformat(value)
+        except ValueError:
+            return f"unparseable date {value!r}"
+    return None
+
+
+def check_upgrade():
+    """Run the upgrade on an in-memory database; returns the failures"""
+    old_modules = _modules()
+    new_modules = _modules(ADDED_FIELDS)
+    old, new = build_schema(old_modules), build_schema(new_modules)
+    statements, _, warnings = diff_schema(old, new, column_defaults(new_modules))
+
+    db = sqlite3.connect(':memory:')
+    for definition in old['tables'].values():
+        db.execute(definition['create'])
+    now = datetime.now().isoformat()
+    db.execute("INSERT INTO category (id, name, createdAt, updatedAt) VALUES ('1', 'Open', ?, ?)", (now, now))
+
+    for statement in statements:
+        print(f"  {statement}")
+        db.execute(statement)
+    for warning in warnings:
+        print(f"  ⚠️ {warning}")
+
+    db.row_factory = sqlite3.Row
+    row = db.execute("SELECT * FROM category WHERE id = '1'").fetchone()
+    failures = []
+    for name, field_type, _ in ADDED_FIELDS:
+        error = _read_error(field_type, row[get_column_name({'name': name, 'type': field_type})])
+        if error is not None:
+            failures.append(f"category.{name} ({field_type}) reads {error} on a row created before the upgrade")
+    return failures
+
+
+def main(argv=None):
+    argparse.ArgumentParser(description='Check the SQLite upgrade path of added columns').parse_args(argv)
+
+    print("🧬 Upgrading a database after adding columns to Category:")
+    failures = check_upgrade()
+    for failure in failures:
+        print(f"  ❌ {failure}")
+    if not failures:
+        print(f"  ✅ Existing rows read every added column ({len(ADDED_FIELDS)} fields)")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""
+Startup-time check for the `fac` CLI.
+
+Runs CLI invocations that must stay cheap (`fac --help`, `fac firebase --help`,
+...) under `python -X importtime` and fails when one of them imports a heavy
+module (the generators, Jinja2, PyYAML, inflect) or when its total import
+time goes over the budget:
+
+    python benchmarks/startup_time.py
+    python benchmarks/startup_time.py --budget-ms 80 --repeat 10
+
+It also checks that the short help registered for every lazy subcommand in
+main.py matches the docstring of the command it loads.
+"""
+
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+# Invocations that only need click and the command definitions
+INVOCATIONS = [
+    ['--help'],
+    ['new', '--help'],
+    ['generate', '--help'],
+    ['firebase', '--help'],
+    ['regenerate', '--help'],
+    ['deps', '--help'],
+    ['plan', '--help'],
+]
+
+# Modules that must not be imported by those invocations (prefix match)
+FORBIDDEN_MODULES = ('generators', 'jinja2', 'yaml', 'inflect', 'utils.flutter_cli', 'utils.file_manager')
+
+DEFAULT_BUDGET_MS = 150
+
+
+def measure(args):
+    """
+    Run `main.py <args>` under -X importtime.
+
+    Returns:
+        tuple: (total import time of the top-level imports in ms, imported module names)
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', os.path.join(ROOT_DIR, 'main.py'), *args],
+                            cwd=ROOT_DIR, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"fac {' '.join(args)} failed:\n{result.stderr}")
+
+    total_us = 0
+    modules = []
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        modules.append(name.strip())
+        if not name[1:].startswith(' '):
+            # Só as importações de primeiro nível: o acumulado já inclui as aninhadas
+            total_us += int(cumulative)
+
+    return total_us / 1000, modules
+
+
+def check_lazy_help():
+    """Short help of every lazy subcommand against its command docstring (returns the mismatches)"""
+    import importlib
+    from main import COMMANDS
+
+    mismatches = []
+    for name, (import_path, short_help) in COMMANDS.items():
+        module_name, attribute = import_path.split(':')
+        command = getattr(importlib.import_module(module_name), attribute)
+        expected = (command.help or '').strip().split('\n')[0]
+        if expected != short_help:
+            mismatches.append(f"{name}: main.py has '{short_help}', the command says '{expected}'")
+    return mismatches
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Check the import time of cheap fac invocations')
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                        help=f'Maximum median import time per invocation (default: {DEFAULT_BUDGET_MS} ms)')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per invocation (default: 5)')
+    args = parser.parse_args(argv)
+
+    failures = 0
+    for invocation in INVOCATIONS:
+        samples = []
+        forbidden = set()
+        for _ in range(args.repeat):
+            total_ms, modules = measure(invocation)
+            samples.append(total_ms)
+            forbidden.update(m for m in modules
+                             if any(m == prefix or m.startswith(prefix + '.') for prefix in FORBIDDEN_MODULES))
+
+        median = statistics.median(samples)
+        status = '✅'
+        if median > args.budget_ms:
+            status = f'⚠️ over budget ({args.budget_ms:.0f} ms)'
+            failures += 1
+        if forbidden:
+            status = f"⚠️ imports {', '.join(sorted(forbidden))}"
+            failures += 1
+        print(f"  fac {' '.join(invocation):<20} {median:8.1f} ms (median of {args.repeat})  {status}")
+
+    for mismatch in check_lazy_help():
+        print(f"  ⚠️ Lazy help out of date - {mismatch}")
+        failures += 1
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
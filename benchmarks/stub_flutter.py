@@ -0,0 +1,34 @@
+"""
+FlutterCLI replacement for benchmarks: no Flutter SDK and no subprocesses.
+"""
+
+import os
+import subprocess
+from utils.flutter_cli import FlutterCLI
+
+
+class StubFlutterCLI(FlutterCLI):
+    """
+    FlutterCLI whose subprocess calls are recorded instead of executed.
+
+    `flutter create` produces a minimal project (just a pubspec.yaml) so the
+    generators have something to patch; every other command succeeds with no
+    output.
+    """
+
+    def __init__(self):
+        self.flutter_path = 'flutter'
+        self.profiler = None
+        self.commands = []
+
+    def _run(self, cmd, **kwargs):
+        self.commands.append(' '.join(cmd))
+
+        if cmd[1:2] == ['create']:
+            project_dir = cmd[-1]
+            name = cmd[cmd.index('--project-name') + 1]
+            os.makedirs(project_dir, exist_ok=True)
+            with open(os.path.join(project_dir, 'pubspec.yaml'), 'w', encoding='utf-8') as f:
+                f.write(f"name: {name}\nversion: 1.0.0+1\nenvironment:\n  sdk: ^3.5.0\n")
+
+        return subprocess.CompletedProcess(cmd, 0, stdout='', stderr='')
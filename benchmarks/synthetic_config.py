@@ -0,0 +1,107 @@
+"""
+Synthetic FAC configurations for benchmarks.
+
+Builds configs with N modules and M fields per module, where every module
+references the previous ones (reference chains) and some modules hold
+many-to-many lists, so relationship analysis and the relationship templates
+are exercised like in a real app.
+"""
+
+FIELD_TYPES = ['String', 'int', 'double', 'bool', 'DateTime']
+
+
+def module_name(index):
+    """Name of the synthetic module at `index` (Module0001, Module0002, ...)"""
+    return f"Module{index:04d}"
+
+
+def build_module(index, fields=8, references=2, many_to_many_every=5):
+    """
+    Build one synthetic module.
+
+    Args:
+        index (int): Position of the module (its references point to earlier modules).
+        fields (int): Number of scalar fields.
+        references (int): Number of reference fields (chain to the previous modules).
+        many_to_many_every (int): Every Nth module gets a many-to-many list (0 disables).
+
+    Returns:
+        dict: Module configuration.
+    """
+    name = module_name(index)
+    module_fields = [{'name': 'title', 'type': 'String', 'required': True}]
+
+    for field_index in range(1, fields):
+        module_fields.append({
+            'name': f"field{field_index}",
+            'type': FIELD_TYPES[field_index % len(FIELD_TYPES)],
+            'required': field_index % 2 == 0,
+        })
+
+    for depth in range(1, references + 1):
+        if index - depth < 0:
+            break
+        module_fields.append({
+            'name': f"parent{depth}Id",
+            'type': 'reference',
+            'reference': module_name(index - depth),
+            'required': depth == 1,
+        })
+
+    if many_to_many_every and index and index % many_to_many_every == 0:
+        module_fields.append({
+            'name': 'tags',
+            'type': 'List',
+            'itemType': 'reference',
+            'reference': module_name(index // 2),
+        })
+
+    return {
+        'name': name,
+        'title': 'title',
+        'icon': 'folder',
+        'gender': 'he',
+        'translations': {
+            'singular': {'en': name, 'pt': name},
+            'plural': {'en': f"{name}s", 'pt': f"{name}s"},
+        },
+        'fields': module_fields,
+        'soft_delete': index % 2 == 0,
+        'export': {'csv': True, 'xlsx': index % 3 == 0, 'pdf': index % 4 == 0},
+    }
+
+
+def build_config(modules=10, fields=8, references=2, many_to_many_every=5):
+    """
+    Build a complete synthetic configuration.
+
+    Args:
+        modules (int): Number of modules.
+        fields (int): Scalar fields per module.
+        references (int): Reference fields per module.
+        many_to_many_every (int): Every Nth module gets a many-to-many list.
+
+    Returns:
+        dict: Configuration in the same format as the YAML files.
+    """
+    return {
+        'app': {
+            'name': f"Bench App {modules}",
+            'package': 'com.example.bench',
+            'description': f"Synthetic benchmark app with {modules} modules",
+        },
+        'default_locale': 'en',
+        'theme': {
+            'primary_color': '#1E88E5',
+            'secondary_color': '#424242',
+            'accent_color': '#FF8F00',
+            'font_family': 'Roboto',
+        },
+        'auth': {'enabled': False},
+        'persistence': {'enabled': True, 'provider': 'sqlite'},
+        'dashboard': {'enabled': True},
+        'modules': [
+            build_module(index, fields, references, many_to_many_every)
+            for index in range(modules)
+        ],
+    }
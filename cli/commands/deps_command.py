@@ -0,0 +1,44 @@
+import click
+
+
+@click.group()
+def deps():
+    """Dependency profile commands"""
+    pass
+
+
+@deps.command()
+@click.option('--app-dir', default='.', type=click.Path(exists=True, file_okay=False),
+              help='Directory of a generated Flutter app (with pubspec.lock)')
+@click.option('--name', required=True, help='Name of the profile to create or overwrite')
+def lock(app_dir, name):
+    """Capture the resolved dependency versions of an app into a profile"""
+    from utils.deps_profile import DepsProfile
+
+    try:
+        profile = DepsProfile.from_project(name, app_dir)
+        path = profile.save()
+    except (FileNotFoundError, ValueError) as e:
+        raise click.ClickException(str(e))
+
+    click.echo(f"📌 {len(profile.packages)} direct dependencies pinned:")
+    for package, version in profile.packages.items():
+        click.echo(f"  {package}: {version}")
+
+    click.echo(click.style(f"✅ Dependency profile '{name}' saved to {path}", fg="green"))
+    click.echo(f"Use it with: fac new --config <file> --deps-profile {name}")
+
+
+@deps.command(name='list')
+def list_profiles():
+    """List the saved dependency profiles"""
+    from utils.deps_profile import DepsProfile
+
+    profiles = DepsProfile.list_profiles()
+    if not profiles:
+        click.echo("No dependency profiles found. Create one with 'fac deps lock'.")
+        return
+
+    for name in profiles:
+        profile = DepsProfile.load(name)
+        click.echo(f"  {name} ({len(profile.packages)} packages, created {profile.created_at})")
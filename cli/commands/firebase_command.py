@@ -1,5 +1,4 @@
 import click
-from generators.firebase_generator import FirebaseGenerator
 
 
 @click.group()
@@ -12,6 +11,8 @@ def firebase():
 @click.option('--app-dir', default='.', help='Directory of the Flutter app')
 def setup(app_dir):
     """Set up Firebase for the Flutter app"""
+    from generators.firebase_generator import FirebaseGenerator
+
     click.echo("Setting up Firebase...")
 
     generator = FirebaseGenerator(app_dir=app_dir)
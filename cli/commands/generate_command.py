@@ -1,5 +1,4 @@
 import click
-from generators.model_generator import ModelGenerator
 
 
 @click.group()
@@ -9,11 +8,47 @@ def generate():
 
 
 @generate.command()
-@click.option('--name', required=True, help='Name of the module to generate')
-@click.option('--fields', required=True, help='Comma-separated list of field:type pairs (e.g., "name:String,age:int")')
+@click.option('--name', required=True,
+              help='Name of the module to generate. With --config, a comma-separated list of names or "all"')
+@click.option('--fields', help='Comma-separated list of field:type pairs (e.g., "name:String,age:int")')
+@click.option('--config', type=click.Path(exists=True),
+              help='YAML configuration to read the module definitions (and relationships) from')
 @click.option('--app-dir', default='.', help='Directory of the Flutter app')
-def module(name, fields, app_dir):
+@click.option('--jobs', '-j', default=1, type=click.IntRange(min=1),
+              help='Number of modules to generate in parallel')
+def module(name, fields, config, app_dir, jobs):
     """Generate a new module with the specified fields"""
+    # Importados na execução: a ajuda dos comandos não carrega os geradores
+    import yaml
+    from generators.model_generator import ModelGenerator
+
+    if config:
+        with open(config, 'r', encoding='utf-8') as f:
+            app_config = yaml.safe_load(f)
+
+        modules = app_config.get('modules', [])
+        if name != 'all':
+            names = [n.strip() for n in name.split(',') if n.strip()]
+            unknown = [n for n in names if n not in {m.get('name') for m in modules}]
+            if unknown:
+                raise click.BadParameter(f"Module(s) not found in {config}: {', '.join(unknown)}",
+                                         param_hint='--name')
+            modules = [m for m in modules if m.get('name') in names]
+
+        click.echo(f"Generating {len(modules)} module(s) from configuration: {config}")
+
+        generator = ModelGenerator(app_dir=app_dir, config=app_config)
+        errors = generator.generate_modules(modules, jobs=jobs)
+
+        if errors:
+            click.echo(click.style(f"⚠️ Modules generated with errors in: {', '.join(errors)}", fg="yellow"))
+        else:
+            click.echo(click.style("✅ Modules generated successfully!", fg="green"))
+        return
+
+    if not fields:
+        raise click.UsageError("Missing option '--fields' (required unless --config is given).")
+
     click.echo(f"Generating module '{name}' with fields: {fields}")
 
     # Parse fields
@@ -40,6 +75,6 @@ def module(name, fields, app_dir):
 
     # Generate module and screens
     generator = ModelGenerator(app_dir=app_dir)
-    generator.generate_module(module_config)
+    generator.generate_modules([module_config], jobs=jobs)
 
     click.echo(click.style(f"✅ Module '{name}' generated successfully!", fg="green"))
\ No newline at end of file
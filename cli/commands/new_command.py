@@ -1,20 +1,49 @@
 import click
 import os
-from generators.app_generator import AppGenerator
 
 
 @click.command()
 @click.option('--config', required=True, type=click.Path(exists=True), help='Path to the configuration YAML file')
 @click.option('--output-dir', default='.', help='Directory where the Flutter app will be created')
+@click.option('--jobs', '-j', default=1, type=click.IntRange(min=1),
+              help='Number of modules to generate in parallel')
+@click.option('--no-skeleton-cache', is_flag=True, default=False,
+              help="Always run 'flutter create' instead of copying the cached project skeleton")
+@click.option('--deps-profile', default=None,
+              help="Pin dependencies to a profile saved with 'fac deps lock' and resolve offline")
+@click.option('--dry-run', is_flag=True, default=False,
+              help='Render everything in memory and print a plan, without writing files or running Flutter')
+@click.option('--profile', 'profile_path', default=None, type=click.Path(dir_okay=False),
+              help='Write per-phase/subprocess timings as a JSON Chrome trace to this file')
+@click.option('--cprofile', 'cprofile_path', default=None, type=click.Path(dir_okay=False),
+              help='Dump cProfile statistics (pstats) of the Python side to this file')
 
-def new(config, output_dir):
+def new(config, output_dir, jobs, no_skeleton_cache, deps_profile, dry_run, profile_path, cprofile_path):
     """Create a new Flutter application based on a YAML configuration"""
+    # Importados na execução: `fac --help` e `fac new --help` não carregam os geradores
+    from generators.app_generator import AppGenerator
+    from utils.profiler import run_profiled
+    from utils.deps_profile import DepsProfile
+
+    if deps_profile:
+        try:
+            DepsProfile.load(deps_profile)
+        except (FileNotFoundError, ValueError) as e:
+            raise click.BadParameter(str(e), param_hint='--deps-profile')
+
+    if dry_run:
+        generator = AppGenerator(config_path=config, output_dir=output_dir, jobs=jobs, require_flutter=False,
+                                 use_skeleton_cache=not no_skeleton_cache, deps_profile=deps_profile)
+        generator.plan()
+        return
+
     click.echo(f"Creating new Flutter application from configuration: {config}")
 
     # Create app generator with the config file
-    generator = AppGenerator(config_path=config, output_dir=output_dir)
+    generator = AppGenerator(config_path=config, output_dir=output_dir, jobs=jobs,
+                             use_skeleton_cache=not no_skeleton_cache, deps_profile=deps_profile)
 
     # Generate the application
-    generator.generate()
+    run_profiled(generator.generate, generator.profiler, profile_path, cprofile_path)
 
     click.echo(click.style(f"✅ Flutter application created successfully!", fg="green"))
\ No newline at end of file
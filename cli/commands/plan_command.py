@@ -0,0 +1,24 @@
+import click
+
+
+@click.command()
+@click.option('--config', required=True, type=click.Path(exists=True), help='Path to the configuration YAML file')
+@click.option('--output-dir', default='.', help='Directory where the Flutter app would be created')
+@click.option('--jobs', '-j', default=1, type=click.IntRange(min=1),
+              help='Number of modules to render in parallel')
+@click.option('--deps-profile', default=None, help="Plan with the versions of a profile saved with 'fac deps lock'")
+
+def plan(config, output_dir, jobs, deps_profile):
+    """Show what 'fac new' would generate, without writing files or running Flutter"""
+    from generators.app_generator import AppGenerator
+    from utils.deps_profile import DepsProfile
+
+    if deps_profile:
+        try:
+            DepsProfile.load(deps_profile)
+        except (FileNotFoundError, ValueError) as e:
+            raise click.BadParameter(str(e), param_hint='--deps-profile')
+
+    generator = AppGenerator(config_path=config, output_dir=output_dir, jobs=jobs, require_flutter=False,
+                             deps_profile=deps_profile)
+    generator.plan()
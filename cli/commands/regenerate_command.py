@@ -0,0 +1,28 @@
+import click
+
+
+@click.command()
+@click.option('--config', required=True, type=click.Path(exists=True), help='Path to the configuration YAML file')
+@click.option('--output-dir', default='.', help='Directory where the Flutter app was created')
+@click.option('--jobs', '-j', default=1, type=click.IntRange(min=1),
+              help='Number of modules to generate in parallel')
+@click.option('--profile', 'profile_path', default=None, type=click.Path(dir_okay=False),
+              help='Write per-phase/subprocess timings as a JSON Chrome trace to this file')
+@click.option('--cprofile', 'cprofile_path', default=None, type=click.Path(dir_okay=False),
+              help='Dump cProfile statistics (pstats) of the Python side to this file')
+
+def regenerate(config, output_dir, jobs, profile_path, cprofile_path):
+    """Re-render an existing application, touching only outputs whose inputs changed"""
+    from generators.app_generator import AppGenerator
+    from utils.profiler import run_profiled
+
+    click.echo(f"Regenerating Flutter application from configuration: {config}")
+
+    generator = AppGenerator(config_path=config, output_dir=output_dir, jobs=jobs, require_flutter=False)
+
+    try:
+        run_profiled(generator.regenerate, generator.profiler, profile_path, cprofile_path)
+    except FileNotFoundError as e:
+        raise click.ClickException(f"{e}. Run 'fac new' first.")
+
+    click.echo(click.style(f"✅ Flutter application regenerated successfully!", fg="green"))
@@ -0,0 +1,53 @@
+import importlib
+
+import click
+from click.utils import make_default_short_help
+
+
+class LazyGroup(click.Group):
+    """
+    Click group whose subcommands are imported only when they are invoked.
+
+    `lazy_subcommands` maps a command name to (import path, short help), the
+    import path being "package.module:attribute". `fac --help` lists the
+    commands from the short help alone, so neither the command modules nor
+    the generators they use (Jinja2, PyYAML, inflect...) are imported.
+    """
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            self.add_command(self._load(cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx, formatter):
+        names = [name for name in self.list_commands(ctx)
+                 if name not in self.commands or not self.commands[name].hidden]
+        if not names:
+            return
+
+        # Mesmo limite de largura que click.Group.format_commands
+        limit = formatter.width - 6 - max(len(name) for name in names)
+        rows = []
+        for name in names:
+            if name in self.commands:
+                rows.append((name, self.commands[name].get_short_help_str(limit)))
+            else:
+                rows.append((name, make_default_short_help(self.lazy_subcommands[name][1], limit)))
+
+        with formatter.section('Commands'):
+            formatter.write_dl(rows)
+
+    def _load(self, cmd_name):
+        import_path = self.lazy_subcommands[cmd_name][0]
+        module_name, attribute = import_path.split(':')
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"Lazy command '{cmd_name}' ({import_path}) is not a click command")
+        return command
@@ -2,43 +2,66 @@ import os
 import re
 import yaml
 import shutil
+import threading
 import subprocess
-from jinja2 import Environment, FileSystemLoader
 from utils.case_converter import CaseConverter
-from utils.file_manager import FileManager
+from utils.file_manager import FileManager, thread_bytes_written
+from utils.manifest import Manifest
+from utils.deps_profile import DepsProfile
+from utils.profiler import Profiler
 from utils.flutter_cli import FlutterCLI
 from utils.dependency_manager import DependencyManager
+from utils.template_registry import get_jinja_env
 from generators.theme_generator import ThemeGenerator
 from generators.auth_generator import AuthGenerator
 from generators.model_generator import ModelGenerator
 from generators.firebase_generator import FirebaseGenerator
 from generators.dashboard_generator import DashboardGenerator
 from generators.sqlite_generator import SQLiteGenerator
+from generators.config_compiler import compile_config
+from generators.sqlite_schema_compiler import SCHEMA_DIR
+from utils.task_scheduler import Task, TaskScheduler, FAIL, SUBPROCESS
 
 
 class AppGenerator:
-    def __init__(self, config_path, output_dir='.', flutter_path=None):
+    def __init__(self, config_path, output_dir='.', flutter_path=None, jobs=1, require_flutter=True,
+                 use_skeleton_cache=True, deps_profile=None):
         self.config_path = config_path
         self.output_dir = output_dir
+        self.jobs = jobs
+        self.use_skeleton_cache = use_skeleton_cache
+        self.deps_profile = deps_profile
         self.config = self._load_config()
+        # Configuração compilada uma vez e compartilhada por todos os geradores
+        self.ir = compile_config(self.config)
         self.case_converter = CaseConverter()
         self.file_manager = FileManager()
+        # FileManagers of the tasks that write their files themselves (merged by the flush task)
+        self._side_file_managers = []
+
+        # Per-phase and per-subprocess instrumentation (see `fac new --profile`)
+        self.profiler = Profiler(thread_bytes_written)
 
         # Initialize Flutter CLI with optional path
         try:
             self.flutter_cli = FlutterCLI(flutter_path)
         except FileNotFoundError as e:
-            print(f"ERROR: {e}")
-            print("You need to have Flutter installed and available in your PATH to use this tool.")
-            print("You can download Flutter from https://flutter.dev/docs/get-started/install")
-            raise
+            if not require_flutter:
+                self.flutter_cli = None
+            else:
+                print(f"ERROR: {e}")
+                print("You need to have Flutter installed and available in your PATH to use this tool.")
+                print("You can download Flutter from https://flutter.dev/docs/get-started/install")
+                raise
+
+        if self.flutter_cli is not None:
+            self.flutter_cli.profiler = self.profiler
 
         # Initialize Dependency Manager
         self.dependency_manager = DependencyManager(self.flutter_cli, self.config)
 
-        # Set up Jinja2 environment
-        template_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'templates')
-        self.jinja_env = Environment(loader=FileSystemLoader(template_dir))
+        # Shared Jinja2 environment (templates are compiled once per process)
+        self.jinja_env = get_jinja_env()
 
     def _load_config(self):
         """Load the YAML configuration file"""
@@ -64,14 +87,9 @@ class AppGenerator:
             print(f"Error reading config file: {e}")
             raise
 
-    def generate(self):
-        """Generate the Flutter application"""
+    def _get_safe_name(self):
+        """Return the Dart package name derived from the app name"""
         app_name = self.config['app']['name']
-        package_name = self.config['app']['package']
-
-        print(f"Generating Flutter app with name: {app_name}")
-
-        # Create Flutter project using CLI
         safe_name = self.case_converter.to_snake_case(app_name)
 
         # Validate the name - it should not contain spaces or special characters
@@ -82,148 +100,409 @@ class AppGenerator:
                 safe_name = "flutter_app"
                 print(f"Using fallback name '{safe_name}' as the converted name is still invalid")
 
+        return safe_name
+
+    def _is_firebase_used(self):
+        """Check if Firebase is used for authentication or persistence"""
+        return self.ir.firebase_enabled
+
+    def generate(self):
+        """
+        Generate the Flutter application.
+
+        The phases are tasks of a TaskScheduler: once the project structure is
+        rendered, the other generators render while `flutter pub get` and the
+        Firebase setup run, and the files are written when everything finished.
+        """
+        app_name = self.config['app']['name']
+        package_name = self.config['app']['package']
+
+        print(f"Generating Flutter app with name: {app_name}")
+
+        # Create Flutter project using CLI
+        safe_name = self._get_safe_name()
+
         app_dir = os.path.join(self.output_dir, safe_name)
         print(f"App directory will be: {app_dir}")
 
-        # Create base Flutter project
-        print("📱 Creating base Flutter project...")
-        try:
-            self.flutter_cli.create_project(
-                name=safe_name,
-                org=package_name,
-                output_dir=self.output_dir
-            )
-            print("✅ Base Flutter project created successfully.")
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Failed to create Flutter project. Details: {e}")
-            print("Make sure you have Flutter installed and that the name and organization are valid.")
-            raise
+        tasks = [
+            Task('create', lambda: self._create_project(safe_name, package_name), resource=SUBPROCESS,
+                 on_failure=FAIL, error="❌ Failed to create Flutter project. Details: {error}",
+                 hints=["Make sure you have Flutter installed and that the name and organization are valid."]),
+            Task('structure', lambda: self._generate_structure(app_dir, new_manifest=True), deps=['create'],
+                 on_failure=FAIL, error="❌ Error generating project structure: {error}"),
+            # Plan every dependency up front and resolve them once (in parallel with the rendering)
+            Task('deps', lambda: self._run_with_own_file_manager(self._resolve_dependencies, app_dir),
+                 deps=['structure'], resource=SUBPROCESS,
+                 error="⚠️ Warning: Error resolving dependencies: {error}",
+                 hints=["You may need to run 'flutter pub get' manually later."]),
+        ]
 
-        # Generate project structure
-        print("🏗️ Generating project structure...")
-        try:
-            self._generate_project_structure(app_dir)
-            print("✅ Project structure generated successfully.")
-        except Exception as e:
-            print(f"❌ Error generating project structure: {e}")
-            raise
+        # Setup Firebase BEFORE authentication if Firebase is used
+        if self._is_firebase_used():
+            tasks.append(Task('firebase', lambda: self._run_with_own_file_manager(self._setup_firebase, app_dir),
+                              deps=['deps'], resource=SUBPROCESS, error="❌ Error setting up Firebase: {error}",
+                              hints=["⚠️ You may need to configure Firebase manually later."]))
 
-        # Install dependencies FIRST using the new dependency manager
-        print("📦 Installing dependencies...")
-        try:
-            self.dependency_manager.install_dependencies(app_dir)
-            print("✅ Dependencies installed successfully.")
-        except Exception as e:
-            print(f"⚠️ Warning: Error installing dependencies: {e}")
-            print("You may need to run 'flutter pub get' manually later.")
+        render_tasks = self._render_tasks(app_dir, after='structure')
+        tasks += render_tasks
+        tasks.append(Task('flush', self._flush_files, deps=['deps', 'firebase'] + [t.name for t in render_tasks],
+                          on_failure=FAIL, error="❌ Error writing generated files: {error}"))
 
-        # Generate theme
-        if 'theme' in self.config:
-            print("🎨 Generating theme...")
-            try:
-                theme_generator = ThemeGenerator(app_dir, self.config)
-                theme_generator.generate()
-                print("✅ Theme generated successfully.")
-            except Exception as e:
-                print(f"❌ Error generating theme: {e}")
+        # Generate localization classes (dependencies are already resolved)
+        if self.ir.translations_enabled:
+            tasks.append(Task('gen-l10n', lambda: self._run_flutter_genl10n(app_dir), deps=['flush'],
+                              resource=SUBPROCESS))
 
-        # Setup Firebase BEFORE authentication if Firebase is used
-        firebase_used = (
-                self.config.get('auth', {}).get('provider') == 'firebase' or
-                self.config.get('persistence', {}).get('provider') == 'firebase'
-        )
+        self._run_tasks(tasks)
+        self._save_manifest()
 
-        if firebase_used:
-            print("🔥 Setting up Firebase...")
-            try:
-                firebase_generator = FirebaseGenerator(app_dir, self.config, self.dependency_manager)
-                firebase_generator.setup_firebase()
-                print("✅ Firebase setup completed.")
+        print(f"\n🎉 Flutter application '{app_name}' created successfully!")
+        print(f"📁 Location: {app_dir}")
 
-                # Show Firebase configuration info
-                firebase_info = firebase_generator.get_firebase_config_info()
-                print(f"📋 Firebase Info:")
-                print(f"  Project ID: {firebase_info['project_id']}")
-                print(f"  Platforms: {', '.join(firebase_info['configured_platforms'])}")
-                print(f"  firebase_options.dart: {'✅' if firebase_info['firebase_options_exists'] else '❌'}")
+        # Show dependency verification
+        with self._phase('status'):
+            self._show_final_status(app_dir)
 
-            except Exception as e:
-                print(f"❌ Error setting up Firebase: {e}")
-                print("⚠️ You may need to configure Firebase manually later.")
+    def regenerate(self):
+        """
+        Re-render an existing application from the configuration.
 
-        # Generate authentication if enabled
-        if self.config.get('auth', {}).get('enabled', False):
-            print("🔐 Generating authentication...")
-            try:
-                auth_generator = AuthGenerator(app_dir, self.config)
-                auth_generator.generate()
-                print("✅ Authentication generated successfully.")
-            except Exception as e:
-                print(f"❌ Error generating authentication: {e}")
+        Only outputs whose inputs (template source, config slice, generator version)
+        changed since the last run recorded in `.fac/manifest.json` are rendered,
+        and files whose bytes did not change are not rewritten. Flutter is not invoked.
+        """
+        app_dir = os.path.join(self.output_dir, self._get_safe_name())
+        if not os.path.isdir(app_dir):
+            raise FileNotFoundError(f"Application directory not found: {app_dir}")
+
+        manifest = Manifest(app_dir)
+        if not manifest.entries:
+            print("⚠️ No manifest found (or generator version changed): every output will be rendered.")
+
+        self.file_manager = FileManager(manifest, buffered=True)
+
+        print(f"♻️ Regenerating '{self.config['app']['name']}' in {app_dir}")
+
+        render_tasks = self._render_tasks(app_dir, after='pubspec')
+        self._run_tasks([
+            Task('structure', lambda: self._generate_structure(app_dir), on_failure=FAIL,
+                 error="❌ Error generating project structure: {error}"),
+            # Keep pubspec.yaml in sync with the configuration (run 'flutter pub get' afterwards if it changed)
+            Task('pubspec', lambda: self._write_pubspec(app_dir), deps=['structure'], on_failure=FAIL,
+                 error="❌ Error updating pubspec.yaml: {error}"),
+            *render_tasks,
+            Task('flush', self._flush_files, deps=[t.name for t in render_tasks], on_failure=FAIL,
+                 error="❌ Error writing generated files: {error}"),
+        ])
+
+        stale = manifest.stale_outputs()
+        self._save_manifest()
+
+        stats = self.file_manager.stats
+        print(f"\n📋 Regeneration summary:")
+        print(f"  Rendered: {stats['rendered']}")
+        print(f"  Skipped (inputs unchanged): {stats['skipped']}")
+        print(f"  Written: {stats['written']}")
+        print(f"  Identical output (not rewritten): {stats['unchanged']}")
+        if stale:
+            print(f"  ⚠️ {len(stale)} output(s) from a previous run were not generated again:")
+            for path in stale:
+                print(f"    - {path}")
+
+        return stats
+
+    def plan(self):
+        """
+        Render the whole application in memory without touching the disk or running Flutter.
 
-        # Configure persistence (SQLite or Firebase)
-        persistence_provider = self.config.get('persistence', {}).get('provider', 'sqlite')
+        Every generator runs against a buffered FileManager that is never flushed,
+        so the result is what `generate` would write. A summary with the files that
+        would be created or changed, their size, the render time of each generator
+        and the subprocesses that would have been run is printed and returned.
 
-        # Generate SQLite infrastructure if SQLite is the provider
-        if persistence_provider == 'sqlite':
-            print("🗃️ Setting up SQLite persistence...")
-            try:
-                sqlite_generator = SQLiteGenerator(app_dir, self.config)
-                sqlite_generator.generate()
-                print("✅ SQLite persistence setup completed.")
-            except Exception as e:
-                print(f"❌ Error setting up SQLite persistence: {e}")
+        Returns:
+            Dict: 'created' and 'changed' (relative path -> bytes), 'metadata'
+                (fac's own files under .fac/, relative path -> bytes), 'unchanged',
+                'total_bytes', 'phase_times' and 'subprocesses'.
+        """
+        safe_name = self._get_safe_name()
+        app_dir = os.path.join(self.output_dir, safe_name)
 
-        # Generate localizations
-        if self.config.get('translations', {}).get('enabled', True):
-            print("🌍 Generating localizations...")
-            self._generate_localizations(app_dir)
+        print(f"🧪 Planning '{self.config['app']['name']}' (dry run, nothing will be written)")
+
+        self.file_manager = FileManager(buffered=True)
+
+        self._run_tasks([
+            Task('structure', lambda: self._generate_structure(app_dir), on_failure=FAIL,
+                 error="❌ Error generating project structure: {error}"),
+            Task('pubspec', lambda: self._write_pubspec(app_dir, planning=True), deps=['structure'], on_failure=FAIL,
+                 error="❌ Error planning pubspec.yaml: {error}"),
+            *self._render_tasks(app_dir, after='pubspec'),
+        ])
+
+        created = {}
+        changed = {}
+        # Snapshots do schema (.fac/) são metadados do fac, não arquivos do projeto
+        metadata = {}
+        for path, data in sorted(self.file_manager.pending.items()):
+            key = os.path.relpath(path, os.path.abspath(app_dir)).replace(os.sep, '/')
+            if key.startswith(f"{SCHEMA_DIR}/"):
+                metadata[key] = len(data)
+            else:
+                (changed if os.path.exists(path) else created)[key] = len(data)
+
+        plan = {
+            'app_dir': app_dir,
+            'created': created,
+            'changed': changed,
+            'metadata': metadata,
+            'unchanged': self.file_manager.stats['unchanged'],
+            'total_bytes': sum(created.values()) + sum(changed.values()),
+            'phase_times': self.profiler.phase_totals(),
+            'subprocesses': self._planned_subprocesses(safe_name),
+        }
+        self._print_plan(plan)
+        return plan
 
-        # Generate modules
-        if 'modules' in self.config:
-            print("🧩 Generating modules...")
-            try:
-                model_generator = ModelGenerator(app_dir, self.config)
-                for module_config in self.config['modules']:
-                    module_name = module_config.get('name', 'Unknown')
-                    print(f"📄 Generating module: {module_name}")
-                    model_generator.generate_module(module_config)
-                print("✅ Modules generated successfully.")
-            except Exception as e:
-                print(f"❌ Error generating modules: {e}")
+    def _planned_subprocesses(self, safe_name):
+        """Commands `generate` would run for this configuration"""
+        flutter = 'flutter'
+        commands = []
 
-        # Generate dashboard if enabled
-        if self.config.get('dashboard', {}).get('enabled', False):
-            print("📊 Generating dashboard...")
-            try:
-                dashboard_generator = DashboardGenerator(app_dir, self.config)
-                dashboard_generator.generate()
-                print("✅ Dashboard generated successfully.")
-            except Exception as e:
-                print(f"❌ Error generating dashboard: {e}")
+        create = f"{flutter} create --org {self.config['app']['package']} --project-name {safe_name}"
+        commands.append(f"{create} (skipped when the skeleton cache is warm)" if self.use_skeleton_cache else create)
 
-        # Final pub get to ensure everything is working
-        print("🔄 Running final 'flutter pub get'...")
-        try:
-            self.flutter_cli.pub_get(app_dir)
-            print("✅ Final dependencies check completed.")
-        except subprocess.CalledProcessError as e:
-            print(f"⚠️ Warning: Failed to run final 'flutter pub get'. Details: {e}")
+        commands.append(f"{flutter} pub get --offline" if self.deps_profile else f"{flutter} pub get")
+
+        if self._is_firebase_used():
+            commands.append("firebase projects:list (and projects:create if the project is missing)")
+            commands.append(f"flutterfire configure --project={self._get_firebase_app_id()}")
+
+        if self.ir.translations_enabled:
+            commands.append(f"{flutter} gen-l10n")
+
+        commands.append(f"{flutter} pub deps")
+        return commands
+
+    def _print_plan(self, plan):
+        """Print the summary produced by plan()"""
+        print(f"\n📋 Generation plan for {plan['app_dir']} (nothing was written):")
+
+        for label, files, marker in (('created', plan['created'], '+'), ('changed', plan['changed'], '~')):
+            if files:
+                print(f"\n  Files to be {label} ({len(files)}):")
+                for path, size in files.items():
+                    print(f"    {marker} {path} ({size} bytes)")
+
+        if plan['metadata']:
+            print(f"\n  fac metadata ({len(plan['metadata'])}):")
+            for path, size in plan['metadata'].items():
+                print(f"    * {path} ({size} bytes)")
+
+        print(f"\n  Created: {len(plan['created'])}  Changed: {len(plan['changed'])}  "
+              f"Unchanged: {plan['unchanged']}  Total: {plan['total_bytes']} bytes")
+
+        print(f"\n⏱️ Render time per generator:")
+        for phase, seconds in plan['phase_times'].items():
+            print(f"  {phase:<15} {seconds:.3f}s")
+        print(f"  {'total':<15} {sum(plan['phase_times'].values()):.3f}s")
 
-        # Update pubspec.yaml with custom template (for metadata and assets)
-        print("📝 Updating pubspec.yaml with template...")
+        print(f"\n🐚 Subprocesses that would be run ({len(plan['subprocesses'])}):")
+        for command in plan['subprocesses']:
+            print(f"  $ {command}")
+
+    def _phase(self, name):
+        """Record a generation phase (wall time, CPU time and bytes written) in the profiler"""
+        return self.profiler.phase(name)
+
+    def _resolve_dependencies(self, app_dir, file_manager):
+        """
+        Write the complete pubspec.yaml and run a single dependency resolution.
+
+        Previously each step resolved on its own: `pub add` for dependencies and
+        dev dependencies, `pub add` for Firebase, a final `pub get` and another
+        one after `gen-l10n`.
+        """
+        print("📦 Resolving dependencies...")
+        firebase_dependencies = self._get_firebase_dependencies(app_dir)
+
+        profile = None
+        if self.deps_profile:
+            profile = DepsProfile.load(self.deps_profile)
+            print(f"📌 Using dependency profile '{profile.name}' (offline resolution)")
+
+        # Conta as chamadas do Flutter registradas no profiler por esta thread
+        # (outras fases podem rodar subprocessos em paralelo)
+        first_event = len(self.profiler.events)
+        self.dependency_manager.resolve_dependencies(
+            app_dir, file_manager, extra_dependencies=firebase_dependencies, profile=profile)
+
+        subprocesses = self.profiler.count('subprocess', since=first_event, thread=threading.get_ident())
+        print(f"⚡ Dependencies resolved with {subprocesses} Flutter subprocess(es)")
+        print("✅ Dependencies resolved successfully.")
+
+    def _get_firebase_dependencies(self, app_dir):
+        """Firebase packages to add to the dependency plan, if Firebase is used"""
+        if not self._is_firebase_used():
+            return []
+        return FirebaseGenerator(app_dir, self.config).get_firebase_dependencies()
+
+    def _save_manifest(self):
+        """Persist the manifest of the current FileManager, if any"""
+        if self.file_manager.manifest is None:
+            return
         try:
-            self._update_pubspec_template(app_dir)
-            self._run_flutter_genl10n(app_dir)
-            print("✅ pubspec.yaml updated successfully.")
-        except Exception as e:
-            print(f"❌ Error updating pubspec.yaml: {e}")
+            self.file_manager.manifest.save()
+        except OSError as e:
+            print(f"⚠️ Could not write generation manifest: {e}")
 
-        print(f"\n🎉 Flutter application '{app_name}' created successfully!")
-        print(f"📁 Location: {app_dir}")
+    def _run_tasks(self, tasks):
+        """
+        Run generation tasks with the scheduler (phases are recorded in the profiler).
 
-        # Show dependency verification
-        self._show_final_status(app_dir)
+        Under `--cprofile` the tasks run sequentially on this thread, the only one cProfile traces.
+        """
+        return TaskScheduler(tasks, profiler=self.profiler, inline=self.profiler.python_profiling).run()
+
+    def _create_project(self, safe_name, package_name):
+        """Create the base Flutter project"""
+        print("📱 Creating base Flutter project...")
+        self.flutter_cli.create_project(
+            name=safe_name,
+            org=package_name,
+            output_dir=self.output_dir,
+            use_skeleton_cache=self.use_skeleton_cache
+        )
+        print("✅ Base Flutter project created successfully.")
+
+    def _generate_structure(self, app_dir, new_manifest=False):
+        """Generate the project structure (with `new_manifest`, outputs are collected in a new buffered FileManager)"""
+        if new_manifest:
+            # Collect the outputs in memory (flushed in batches) and record them
+            # in the manifest used by `fac regenerate`
+            self.file_manager = FileManager(Manifest(app_dir), buffered=True)
+
+        print("🏗️ Generating project structure...")
+        self._generate_project_structure(app_dir)
+        print("✅ Project structure generated successfully.")
+
+    def _write_pubspec(self, app_dir, planning=False):
+        """Write pubspec.yaml from the dependency plan, without resolving it"""
+        profile = None
+        if planning:
+            print("📦 Planning pubspec.yaml...")
+            profile = DepsProfile.load(self.deps_profile) if self.deps_profile else None
+        else:
+            print("📦 Updating pubspec.yaml...")
+
+        self.dependency_manager.write_pubspec(
+            app_dir,
+            self.file_manager,
+            self.dependency_manager.plan_dependencies(self._get_firebase_dependencies(app_dir)),
+            profile.packages if profile else None,
+            exact=profile is not None
+        )
+
+    def _run_with_own_file_manager(self, func, app_dir):
+        """
+        Run a subprocess task with its own FileManager.
+
+        The task writes and flushes its files (pubspec.yaml, firebase_options.dart)
+        while the render tasks fill the main FileManager. Both share the manifest;
+        the counters are merged by the flush task.
+        """
+        file_manager = FileManager(self.file_manager.manifest, buffered=True)
+        self._side_file_managers.append(file_manager)
+        func(app_dir, file_manager)
+
+    def _flush_files(self):
+        """Write every generated file to disk"""
+        for file_manager in self._side_file_managers:
+            self.file_manager.merge_state({'stats': file_manager.stats})
+        self._side_file_managers = []
+
+        print("💾 Writing generated files...")
+        self.file_manager.flush()
+
+    def _setup_firebase(self, app_dir, file_manager):
+        """Create/configure the Firebase project and write firebase_options.dart"""
+        print("🔥 Setting up Firebase...")
+        firebase_generator = FirebaseGenerator(app_dir, self.config, self.dependency_manager, file_manager)
+        firebase_generator.setup_firebase(install_dependencies=False)
+        file_manager.flush()
+        print("✅ Firebase setup completed.")
+
+        # Show Firebase configuration info
+        firebase_info = firebase_generator.get_firebase_config_info()
+        print(f"📋 Firebase Info:")
+        print(f"  Project ID: {firebase_info['project_id']}")
+        print(f"  Platforms: {', '.join(firebase_info['configured_platforms'])}")
+        print(f"  firebase_options.dart: {'✅' if firebase_info['firebase_options_exists'] else '❌'}")
+
+    def _render_tasks(self, app_dir, after):
+        """
+        Tasks of the generators enabled in the configuration.
+
+        Each one renders into its own directories, so they only depend on
+        `after` (the project structure); a failure is reported and the others
+        still run.
+        """
+        tasks = []
+        if 'theme' in self.config:
+            tasks.append(Task('theme', lambda: self._generate_theme(app_dir), deps=[after],
+                              error="❌ Error generating theme: {error}"))
+        if self.ir.has_auth:
+            tasks.append(Task('auth', lambda: self._generate_auth(app_dir), deps=[after],
+                              error="❌ Error generating authentication: {error}"))
+        # Generate SQLite infrastructure if SQLite is the provider
+        if self.ir.persistence_provider == 'sqlite':
+            tasks.append(Task('sqlite', lambda: self._generate_sqlite(app_dir), deps=[after],
+                              error="❌ Error setting up SQLite persistence: {error}"))
+        if self.ir.translations_enabled:
+            # _generate_localizations reports its own errors
+            tasks.append(Task('localizations', lambda: self._generate_localizations(app_dir), deps=[after]))
+        if 'modules' in self.config:
+            tasks.append(Task('modules', lambda: self._generate_modules(app_dir), deps=[after],
+                              error="❌ Error generating modules: {error}"))
+        if self.ir.has_dashboard:
+            tasks.append(Task('dashboard', lambda: self._generate_dashboard(app_dir), deps=[after],
+                              error="❌ Error generating dashboard: {error}"))
+        return tasks
+
+    def _generate_theme(self, app_dir):
+        """Generate the theme files"""
+        print("🎨 Generating theme...")
+        ThemeGenerator(app_dir, self.config, self.file_manager).generate()
+        print("✅ Theme generated successfully.")
+
+    def _generate_auth(self, app_dir):
+        """Generate authentication"""
+        print("🔐 Generating authentication...")
+        AuthGenerator(app_dir, self.config, self.file_manager).generate()
+        print("✅ Authentication generated successfully.")
+
+    def _generate_sqlite(self, app_dir):
+        """Generate the SQLite infrastructure"""
+        print("🗃️ Setting up SQLite persistence...")
+        SQLiteGenerator(app_dir, self.config, self.file_manager).generate()
+        print("✅ SQLite persistence setup completed.")
+
+    def _generate_modules(self, app_dir):
+        """Generate every configured module"""
+        print("🧩 Generating modules...")
+        model_generator = ModelGenerator(app_dir, self.config, self.file_manager)
+        module_errors = model_generator.generate_modules(self.config['modules'], jobs=self.jobs)
+        if module_errors:
+            print(f"⚠️ Modules generated with errors in: {', '.join(module_errors)}")
+        else:
+            print("✅ Modules generated successfully.")
+
+    def _generate_dashboard(self, app_dir):
+        """Generate the dashboard"""
+        print("📊 Generating dashboard...")
+        DashboardGenerator(app_dir, self.config, self.file_manager).generate()
+        print("✅ Dashboard generated successfully.")
 
     def _show_final_status(self, app_dir: str):
         """Show final status of the generated application"""
@@ -238,8 +517,7 @@ class AppGenerator:
         }
 
         # Add Firebase-specific files if Firebase is used
-        if (self.config.get('auth', {}).get('provider') == 'firebase' or
-                self.config.get('persistence', {}).get('provider') == 'firebase'):
+        if self.ir.firebase_enabled:
             key_files['lib/firebase_options.dart'] = 'Firebase configuration'
 
         print("\n📄 Key Files:")
@@ -273,8 +551,7 @@ class AppGenerator:
         print(f"  2. flutter run")
 
         # Firebase-specific next steps
-        if (self.config.get('auth', {}).get('provider') == 'firebase' or
-                self.config.get('persistence', {}).get('provider') == 'firebase'):
+        if self.ir.firebase_enabled:
             print(f"\n🔥 Firebase Setup:")
             print(f"  • If firebase_options.dart contains placeholders, run:")
             print(f"    flutterfire configure --project={self._get_firebase_app_id()}")
@@ -310,6 +587,7 @@ class AppGenerator:
             'lib/app/theme',
             'lib/core/constants',
             'lib/core/errors',
+            'lib/core/models',
             'lib/core/services',
             'lib/core/widgets',
             'lib/core/data/datasources',
@@ -331,7 +609,7 @@ class AppGenerator:
 
         for dir_path in dirs:
             full_path = os.path.join(app_dir, dir_path)
-            os.makedirs(full_path, exist_ok=True)
+            self.file_manager.create_directory(full_path)
 
         # Generate base files
         self._generate_app_files(app_dir)
@@ -342,6 +620,12 @@ class AppGenerator:
         # Generate core error handlers
         self._generate_error_handlers(app_dir)
 
+        # Generate core models
+        self._generate_core_models(app_dir)
+
+        # Generate core services
+        self._generate_core_services(app_dir)
+
         # Generate flutter commands
         self.app_dir = app_dir
 
@@ -366,92 +650,58 @@ class AppGenerator:
 
             # Generate main.dart
             try:
-                template = self.jinja_env.get_template('app/main.dart.jinja')
-                output = template.render(
-                    app_name=self.config['app']['name'],
-                    has_auth=self.config.get('auth', {}).get('enabled', False),
-                    auth_provider=self.config.get('auth', {}).get('provider', 'firebase'),
-                    persistence_provider=self.config.get('persistence', {}).get('provider', 'sqlite'),
-                    modules=self.config.get('modules', []),
-                    firebase_enabled=(
-                            self.config.get('auth', {}).get('provider') == 'firebase' or
-                            self.config.get('persistence', {}).get('provider') == 'firebase'
-                    )
-                )
-
                 main_dart_path = os.path.join(app_dir, 'lib', 'main.dart')
-                os.makedirs(os.path.dirname(main_dart_path), exist_ok=True)
-                with open(main_dart_path, 'w', encoding='utf-8', newline='\n') as f:
-                    f.write(output)
+                self.file_manager.render_template(
+                    'app/main.dart.jinja',
+                    main_dart_path,
+                    app_name=self.ir.app_name,
+                    has_auth=self.ir.has_auth,
+                    auth_provider=self.ir.auth_provider,
+                    persistence_provider=self.ir.persistence_provider,
+                    modules=self.ir.modules,
+                    firebase_enabled=self.ir.firebase_enabled
+                )
             except Exception as e:
                 print(f"❌ Erro ao gerar main.dart: {e}")
 
-            modules = self.config.get('modules', [])
-            c = CaseConverter()
-
-            for module in modules:
-                if 'name' in module:
-                    module['camel_name'] = c.to_camel_case(module['name'])
-                    module['snake_name'] = c.to_snake_case(module['name'])
-                    module['pascal_name'] = c.to_pascal_case(module['name'])
-
             # Generate app.dart
             try:
-                template = self.jinja_env.get_template('app/app.dart.jinja')
-                output = template.render(
-                    app_name=self.config['app']['name'],
-                    has_auth=self.config.get('auth', {}).get('enabled', False),
-                    persistence_provider=self.config.get('persistence', {}).get('provider', 'sqlite'),
-                    modules=modules,
-                    firebase_enabled=(
-                            self.config.get('auth', {}).get('provider') == 'firebase' or
-                            self.config.get('persistence', {}).get('provider') == 'firebase'
-                    )
-                )
-
                 app_dart_path = os.path.join(app_dir, 'lib', 'app', 'app.dart')
-                os.makedirs(os.path.dirname(app_dart_path), exist_ok=True)
-                with open(app_dart_path, 'w', encoding='utf-8', newline='\n') as f:
-                    f.write(output)
+                self.file_manager.render_template(
+                    'app/app.dart.jinja',
+                    app_dart_path,
+                    app_name=self.ir.app_name,
+                    has_auth=self.ir.has_auth,
+                    persistence_provider=self.ir.persistence_provider,
+                    modules=self.ir.modules,
+                    firebase_enabled=self.ir.firebase_enabled
+                )
             except Exception as e:
                 print(f"❌ Erro ao gerar app.dart: {e}")
 
-            # Processar relacionamentos reversos com nomes únicos
-            modules = []
-            for m in self.config.get('modules', []):
-                mc = m.copy()
-                mc['snake_name'] = self.case_converter.to_snake_case(m['name'])
-                modules.append(mc)
-
             # Generate routes.dart
             try:
-                template = self.jinja_env.get_template('app/routes.dart.jinja')
-                output = template.render(
-                    modules=modules,
-                    has_auth=self.config.get('auth', {}).get('enabled', False),
-                    has_dashboard=self.config.get('dashboard', {}).get('enabled', False)
-                )
-
                 routes_dart_path = os.path.join(app_dir, 'lib', 'app', 'routes.dart')
-                os.makedirs(os.path.dirname(routes_dart_path), exist_ok=True)
-                with open(routes_dart_path, 'w', encoding='utf-8', newline='\n') as f:
-                    f.write(output)
+                self.file_manager.render_template(
+                    'app/routes.dart.jinja',
+                    routes_dart_path,
+                    modules=self.ir.modules,
+                    has_auth=self.ir.has_auth,
+                    has_dashboard=self.ir.has_dashboard
+                )
             except Exception as e:
                 print(f"❌ Erro ao gerar routes.dart: {e}")
 
             # Generate dependency_injection.dart if SQLite is enabled
-            if self.config.get('persistence', {}).get('provider') == 'sqlite':
+            if self.ir.use_sqlite:
                 try:
-                    template = self.jinja_env.get_template('app/dependency_injection.dart.jinja')
-                    output = template.render(
-                        app_name=self.config['app']['name'],
-                        modules=self.config.get('modules', [])
-                    )
-
                     di_path = os.path.join(app_dir, 'lib', 'app', 'dependency_injection.dart')
-                    os.makedirs(os.path.dirname(di_path), exist_ok=True)
-                    with open(di_path, 'w', encoding='utf-8', newline='\n') as f:
-                        f.write(output)
+                    self.file_manager.render_template(
+                        'app/dependency_injection.dart.jinja',
+                        di_path,
+                        app_name=self.ir.app_name,
+                        modules=self.ir.modules
+                    )
                 except Exception as e:
                     print(f"❌ Erro ao gerar dependency_injection.dart: {e}")
 
@@ -462,62 +712,31 @@ class AppGenerator:
     def _generate_core_widgets(self, app_dir):
         """Generate core widgets used in the application"""
         try:
-            modules = self.config.get('modules', [])
-            c = CaseConverter()
-
-            for module in modules:
-                if 'name' in module:
-                    module['camel_name'] = c.to_camel_case(module['name'])
-                    module['snake_name'] = c.to_snake_case(module['name'])
-                    module['pascal_name'] = c.to_pascal_case(module['name'])
-
             # Generate loading indicator
-            template = self.jinja_env.get_template('core/widgets/loading_indicator.dart.jinja')
-            output = template.render()
-
             output_path = os.path.join(app_dir, 'lib', 'core', 'widgets', 'loading_indicator.dart')
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-                f.write(output)
+            self.file_manager.render_template('core/widgets/loading_indicator.dart.jinja', output_path)
 
             # Generate error message widget
-            template = self.jinja_env.get_template('core/widgets/error_message.dart.jinja')
-            output = template.render()
-
             output_path = os.path.join(app_dir, 'lib', 'core', 'widgets', 'error_message.dart')
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-                f.write(output)
+            self.file_manager.render_template('core/widgets/error_message.dart.jinja', output_path)
 
             # Generate empty list widget
-            template = self.jinja_env.get_template('core/widgets/empty_list.dart.jinja')
-            output = template.render()
-
             output_path = os.path.join(app_dir, 'lib', 'core', 'widgets', 'empty_list.dart')
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-                f.write(output)
+            self.file_manager.render_template('core/widgets/empty_list.dart.jinja', output_path)
 
             # Generate confirmation dialog widget
-            template = self.jinja_env.get_template('core/widgets/confirmation_dialog.dart.jinja')
-            output = template.render()
-
             output_path = os.path.join(app_dir, 'lib', 'core', 'widgets', 'confirmation_dialog.dart')
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-                f.write(output)
+            self.file_manager.render_template('core/widgets/confirmation_dialog.dart.jinja', output_path)
 
             # Generate base screen
-            template = self.jinja_env.get_template('core/screens/responsive_base_screen.dart.jinja')
-            output = template.render(
-                app_name=self.config['app']['name'],
-                has_auth=self.config.get('auth', {}).get('enabled', False),
-                modules=self.config.get('modules', [])
-            )
             output_path = os.path.join(app_dir, 'lib', 'core', 'screens', 'responsive_base_screen.dart')
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-                f.write(output)
+            self.file_manager.render_template(
+                'core/screens/responsive_base_screen.dart.jinja',
+                output_path,
+                app_name=self.ir.app_name,
+                has_auth=self.ir.has_auth,
+                modules=self.ir.modules
+            )
 
         except Exception as e:
             print(f"❌ Error generating core widgets: {e}")
@@ -527,94 +746,39 @@ class AppGenerator:
         """Generate error handling classes"""
         try:
             # Generate app exception class
-            template = self.jinja_env.get_template('core/errors/app_exception.dart.jinja')
-            output = template.render()
-
             output_path = os.path.join(app_dir, 'lib', 'core', 'errors', 'app_exception.dart')
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-                f.write(output)
+            self.file_manager.render_template('core/errors/app_exception.dart.jinja', output_path)
 
             # Generate network exception class
-            template = self.jinja_env.get_template('core/errors/network_exception.dart.jinja')
-            output = template.render()
-
             output_path = os.path.join(app_dir, 'lib', 'core', 'errors', 'network_exception.dart')
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-                f.write(output)
+            self.file_manager.render_template('core/errors/network_exception.dart.jinja', output_path)
 
         except Exception as e:
             print(f"❌ Error generating error handlers: {e}")
             raise
 
-    def _update_pubspec_template(self, app_dir):
-        """
-        Atualiza o pubspec.yaml usando o template Jinja2 para metadados e assets.
-        As dependências já foram instaladas pelo DependencyManager.
-        """
+    def _generate_core_models(self, app_dir):
+        """Generate the models shared by all modules"""
+        try:
+            # Generate keyset pagination page/cursor
+            output_path = os.path.join(app_dir, 'lib', 'core', 'models', 'page_result.dart')
+            self.file_manager.render_template('core/models/page_result.dart.jinja', output_path)
+
+        except Exception as e:
+            print(f"❌ Error generating core models: {e}")
+            raise
+
+    def _generate_core_services(self, app_dir):
+        """Generate the services shared by all modules"""
         try:
-            pubspec_path = os.path.join(app_dir, 'pubspec.yaml')
-
-            # Le o pubspec atual
-            with open(pubspec_path, 'r') as f:
-                pubspec_content = f.read()
-
-            lines = pubspec_content.split('\n')
-
-            # Encontra onde termina a última dependência e onde começa flutter
-            last_dep_line = -1
-            flutter_start = -1
-
-            deps_block_start = -1
-
-            for i, line in enumerate(lines):
-                if line.startswith('dependencies:'):
-                    deps_block_start = i
-                elif line.startswith('dev_dependencies:'):
-                    last_dep_line = i - 1
-                elif line.startswith('flutter:'):
-                    flutter_start = i
-                    break
-
-            print(lines[deps_block_start])
-            print(lines[last_dep_line+1])
-
-            if last_dep_line != -1 and flutter_start != -1:
-                result_lines = []
-
-                # Adiciona tudo até a última dependência
-                result_lines.extend(lines[:last_dep_line])
-
-                # Adiciona flutter_localizations
-                result_lines.append('  flutter_localizations:')
-                result_lines.append('      sdk: flutter')
-                result_lines.append('  intl: any')
-                result_lines.append('')
-
-                # Pula dev_dependencies até flutter
-                result_lines.extend(lines[last_dep_line + 1:flutter_start])
-
-                # Adiciona nova flutter section
-                sqlite_enabled = self.config.get('persistence', {}).get('provider') == 'sqlite'
-                result_lines.append('flutter:')
-                result_lines.append('')
-                result_lines.append('  uses-material-design: true')
-                result_lines.append('  generate: true')
-                result_lines.append('')
-                result_lines.append('  # Assets do projeto')
-                result_lines.append('  assets:')
-                # result_lines.append('    - assets/images/')
-                # result_lines.append('    - assets/icons/')
-                if sqlite_enabled:
-                    result_lines.append('    - assets/db/')
-
-                # Escreve o resultado
-                with open(pubspec_path, 'w', encoding='utf-8', newline='\n') as f:
-                    f.write('\n'.join(result_lines))
+            # Generate the background worker isolate (modules with isolate_threshold)
+            if self.ir.uses_background_worker:
+                output_path = os.path.join(app_dir, 'lib', 'core', 'services', 'background_worker.dart')
+                self.file_manager.render_template('core/services/background_worker.dart.jinja', output_path)
 
         except Exception as e:
-            print(f"❌ Error updating pubspec template: {e}")
+            print(f"❌ Error generating core services: {e}")
+            raise
 
     # Método para atualizar dependências posteriormente
     def update_dependencies(self, app_dir: str):
@@ -649,59 +813,39 @@ class AppGenerator:
 
     def _generate_localizations(self, app_dir):
         """Generate .arb translation files"""
+        print("🌍 Generating localizations...")
         try:
             l10n_dir = os.path.join(app_dir, 'lib', 'l10n')
-            os.makedirs(l10n_dir, exist_ok=True)
+            self.file_manager.create_directory(l10n_dir)
 
             #Render yaml
-            template = self.jinja_env.get_template('l10n/l10n.yaml.jinja')
-            output = template.render()
-            with open(os.path.join(app_dir, 'l10n.yaml'), 'w', encoding='utf-8') as f:
-                f.write(output)
+            self.file_manager.render_template('l10n/l10n.yaml.jinja', os.path.join(app_dir, 'l10n.yaml'))
 
             # Render en
-            template = self.jinja_env.get_template('l10n/app_en.arb.jinja')
-            output = template.render(
-                app_name=self.config['app']['name'],
-                modules=self._process_modules()
+            self.file_manager.render_template(
+                'l10n/app_en.arb.jinja',
+                os.path.join(l10n_dir, 'app_en.arb'),
+                app_name=self.ir.app_name,
+                modules=self.ir.modules
             )
-            with open(os.path.join(l10n_dir, 'app_en.arb'), 'w', encoding='utf-8') as f:
-                f.write(output)
 
             # Render pt
-            template = self.jinja_env.get_template('l10n/app_pt.arb.jinja')
-            output = template.render(
-                app_name=self.config['app']['name'],
-                modules=self._process_modules()
+            self.file_manager.render_template(
+                'l10n/app_pt.arb.jinja',
+                os.path.join(l10n_dir, 'app_pt.arb'),
+                app_name=self.ir.app_name,
+                modules=self.ir.modules
             )
-            with open(os.path.join(l10n_dir, 'app_pt.arb'), 'w', encoding='utf-8') as f:
-                f.write(output)
 
         except Exception as e:
             print(f"Erro ao gerar arquivos de tradução: {e}")
 
     def _run_flutter_genl10n(self, app_dir):
         """Run `flutter gen-l10n` to generate localization files."""
+        print("🌍 Running 'flutter gen-l10n'...")
         try:
             # print("🔄 Running `flutter gen-l10n`...")
             self.flutter_cli.pub_genl10n(app_dir)
-            self.flutter_cli.pub_get(app_dir)
             # print("✅ `flutter gen-l10n` completed successfully")
         except subprocess.CalledProcessError as e:
             print(f"❌ Error running `flutter gen-l10n`: {e}")
-
-    def _process_modules(self):
-        """Processa módulos e campos do YAML para templates de tradução"""
-        modules = []
-        c = CaseConverter()
-
-        for module_config in self.config.get('modules', []):
-            module = module_config.copy()
-
-            # Nomes do módulo
-            module['snake_name'] = c.to_snake_case(module['name'])
-            module['camel_name'] = c.to_camel_case(module['name'])
-            module['pascal_name'] = c.to_pascal_case(module['name'])
-            modules.append(module)
-
-        return modules
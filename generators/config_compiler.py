@@ -0,0 +1,354 @@
+"""
+Compiled configuration for Flutter App Creator.
+
+The YAML configuration is compiled once into an immutable intermediate
+representation (IR): every name derived from a module or field (snake, camel
+and Pascal case, table, columns), the module dependency graph
+(generators/module_graph.py), the relationship edges in both directions,
+the per-module options (pagination, search, cache, isolate threshold) and the
+app feature flags. Generators read the IR instead of re-walking the raw dicts,
+so building a template context is an attribute or dictionary lookup.
+
+IR nodes use `__slots__` and reject assignment. They still answer `node[key]`,
+`node.get(key)` and `key in node` for the raw YAML keys (nested mappings are
+read-only views), so templates written against the YAML dicts keep working.
+"""
+
+import json
+import hashlib
+from types import MappingProxyType
+
+from utils.case_converter import CaseConverter
+from utils.module_options import get_pagination_options, get_search_options, get_isolate_threshold, \
+    get_cache_options
+from generators.sqlite_schema_generator import get_column_name
+from generators.module_graph import ModuleGraph
+
+_EMPTY = MappingProxyType({})
+
+
+def freeze(value):
+    """Read-only copy of a YAML value (mappings become MappingProxyType, lists become tuples)"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value):
+    """Plain dict/list copy of a frozen value or IR node (used to hash render contexts)"""
+    if isinstance(value, _Node):
+        return value.as_dict()
+    if isinstance(value, MappingProxyType):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+def _view(values):
+    """Read-only mapping (relationship views handed to templates)"""
+    return MappingProxyType(values)
+
+
+class _Node:
+    """Immutable IR node: derived values in slots, raw YAML keys through the mapping protocol"""
+
+    __slots__ = ('_raw',)
+
+    # Nomes dos valores derivados (todos os slots da hierarquia, exceto _raw)
+    _derived = ()
+    _derived_set = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._derived = tuple(name for klass in reversed(cls.__mro__)
+                             for name in klass.__dict__.get('__slots__', ()) if name != '_raw')
+        cls._derived_set = frozenset(cls._derived)
+
+    def __init__(self, raw=None, **values):
+        object.__setattr__(self, '_raw', freeze(raw) if raw is not None else _EMPTY)
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __getitem__(self, key):
+        if key in self._derived_set:
+            return getattr(self, key)
+        return self._raw[key]
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        return key in self._raw or key in self._derived_set
+
+    @property
+    def raw(self):
+        """Read-only view of the YAML mapping the node was compiled from"""
+        return self._raw
+
+    def as_dict(self):
+        """Plain dict with the raw keys and the derived values"""
+        values = thaw(self._raw)
+        for name in self._derived:
+            values[name] = thaw(getattr(self, name))
+        return values
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.get('name')!r})"
+
+
+class FieldIR(_Node):
+    """A module field: the YAML keys plus its column and case names"""
+
+    __slots__ = ('column', 'snake_name', 'camel_name', 'pascal_name')
+
+
+class ModuleIR(_Node):
+    """A module: derived names, fields, relationship views and options"""
+
+    __slots__ = ('name', 'snake_name', 'camel_name', 'pascal_name', 'table', 'title_field', 'soft_delete',
+                 'fields', 'relationships', 'relationship_views', 'has_relationships', 'related_imports',
+                 'includes', 'pagination_options', 'search_options', 'cache_options', 'isolate_threshold')
+
+
+class ConfigIR(_Node):
+    """The whole configuration: modules (in config order) and the app feature flags"""
+
+    __slots__ = ('app_name', 'package', 'modules', 'modules_by_name', 'graph', 'persistence_provider', 'use_sqlite',
+                 'has_auth', 'auth_provider', 'firebase_enabled', 'has_dashboard', 'translations_enabled',
+                 'uses_background_worker')
+
+    def module(self, name):
+        """Compiled module by name, or None"""
+        return self.modules_by_name.get(name)
+
+    def module_for(self, module_config):
+        """
+        Compiled module of a module configuration.
+
+        Modules that are not part of this configuration (`fac generate module
+        --fields ...`) are compiled on their own, without relationships.
+        """
+        module = self.modules_by_name.get(module_config.get('name'))
+        if module is not None:
+            return module
+        return _compile_modules([module_config], CaseConverter())[0]
+
+
+def _direct_edges(module_config, converter):
+    """Reference fields of a module (the relationship this module owns)"""
+    edges = []
+    for field in module_config.get('fields', []):
+        if field.get('type') == 'reference' and field.get('reference'):
+            base_name = field['name'].replace('Id', '')
+            edges.append(_view({
+                'to_module': field['reference'],
+                'field_name': field['name'],
+                'pascal_name': converter.to_pascal_case(base_name),
+                'camel_name': converter.to_camel_case(base_name),
+                'required': field.get('required', False),
+            }))
+    return edges
+
+
+def _reverse_views(edge, converter):
+    """
+    Views of a reverse relationship, by consumer.
+
+    Each template family historically received the same relationship with
+    different keys (`camel_name` is the source module in the analysis and in
+    the screens, the reverse property elsewhere); they are all built here once.
+    """
+    base = {
+        'from_module': edge['from_module'],
+        'field_name': edge['field_name'],
+        'camel_name': converter.to_camel_case(edge['from_module']),
+        'reverse_name': edge['reverse_name'],
+        'required': edge['required'],
+    }
+    property_pascal = converter.to_pascal_case(edge['reverse_name'])
+    property_camel = converter.to_camel_case(edge['reverse_name'])
+    from_snake = converter.to_snake_case(edge['from_module'])
+
+    return {
+        'analysis': _view(base),
+        'entity': _view({**base, 'property_name': property_pascal, 'camel_name': property_camel}),
+        'repository': _view({**base, 'pascal_name': property_pascal, 'camel_name': property_camel}),
+        'screen': _view({**base, 'property_name': property_pascal, 'camel_property': property_camel,
+                         'snake_name': from_snake}),
+        'service': _view({**base, 'pascal_name': property_pascal, 'camel_name': property_camel,
+                          'snake_name': from_snake}),
+        'queries': _view({**base, 'query_name': f"get{edge['reverse_name'].capitalize()}",
+                          'property_name': property_pascal, 'camel_name': property_camel}),
+    }
+
+
+RELATIONSHIP_VIEWS = ('analysis', 'entity', 'repository', 'screen', 'service', 'queries')
+
+
+def _compile_modules(module_configs, converter, graph=None):
+    """Compile module configurations (relationships are resolved among these modules only)"""
+    configs = [module for module in module_configs if module.get('name')]
+    by_name = {module['name']: module for module in configs}
+    graph = graph or ModuleGraph(configs)
+
+    direct = {module['name']: _direct_edges(module, converter) for module in configs}
+    reverse = {name: [] for name in direct}
+    for target, dependents in graph.dependents.items():
+        for module_name, field in dependents:
+            # Nome único do relacionamento reverso, baseado no campo
+            base_name = field['name'].replace('Id', '')
+            reverse[target].append({
+                'from_module': module_name,
+                'field_name': field['name'],
+                'reverse_name': f"{module_name.lower()}ListAs{base_name.capitalize()}",
+                'required': field.get('required', False),
+            })
+
+    compiled = []
+    for module_config in configs:
+        name = module_config['name']
+        direct_edges = tuple(direct[name])
+        reverse_views = [_reverse_views(edge, converter) for edge in reverse[name]]
+        views = _view({
+            view: _view({'direct': direct_edges, 'reverse': tuple(r[view] for r in reverse_views)})
+            for view in RELATIONSHIP_VIEWS
+        })
+
+        related_imports = []
+        for related in [edge['to_module'] for edge in direct_edges] + [edge['from_module'] for edge in reverse[name]]:
+            line = f"import '../../../{converter.to_snake_case(related)}/domain/entities/" \
+                   f"{converter.to_snake_case(related)}_entity.dart';"
+            if line not in related_imports:
+                related_imports.append(line)
+
+        includes = []
+        for edge in direct_edges:
+            includes.append(_view({
+                'name': edge['field_name'].replace('Id', '').lower(),
+                'kind': 'direct',
+                'table': edge['to_module'].lower(),
+                'column': get_column_name({'name': edge['field_name'], 'type': 'reference'}),
+                'soft_delete': by_name.get(edge['to_module'], {}).get('soft_delete', False),
+            }))
+        for edge in reverse[name]:
+            includes.append(_view({
+                'name': converter.to_camel_case(edge['reverse_name']),
+                'kind': 'reverse',
+                'table': edge['from_module'].lower(),
+                'column': get_column_name({'name': edge['field_name'], 'type': 'reference'}),
+                'soft_delete': by_name.get(edge['from_module'], {}).get('soft_delete', False),
+            }))
+
+        field_configs = [field for field in module_config.get('fields', []) if field.get('name')]
+        field_names = [field['name'] for field in field_configs]
+        fields = tuple(
+            FieldIR(field, column=get_column_name(field), snake_name=snake, camel_name=camel, pascal_name=pascal)
+            for field, snake, camel, pascal in zip(field_configs,
+                                                   converter.convert_many(field_names, 'snake'),
+                                                   converter.convert_many(field_names, 'camel'),
+                                                   converter.convert_many(field_names, 'pascal'))
+        )
+
+        pagination = get_pagination_options(module_config)
+        compiled.append(ModuleIR(
+            module_config,
+            name=name,
+            snake_name=converter.to_snake_case(name),
+            camel_name=converter.to_camel_case(name),
+            pascal_name=converter.to_pascal_case(name),
+            table=name.lower(),
+            title_field=module_config.get('title', 'name'),
+            soft_delete=bool(module_config.get('soft_delete', False)),
+            fields=fields,
+            relationships=views['analysis'],
+            relationship_views=views,
+            has_relationships=bool(direct_edges or reverse[name]),
+            related_imports=tuple(related_imports),
+            includes=tuple(includes),
+            pagination_options=freeze(pagination),
+            search_options=freeze(get_search_options(module_config)),
+            cache_options=freeze(get_cache_options(module_config)),
+            isolate_threshold=get_isolate_threshold(module_config),
+        ))
+
+    return compiled
+
+
+def compile_config(config):
+    """
+    Compile a configuration into its IR.
+
+    The last compiled configuration is memoized by content, so every
+    generator built from the same configuration shares one IR, and a config
+    dict changed in place (`fac generate module --fields`) is compiled again.
+
+    Args:
+        config (dict): Configuration loaded from the YAML file (or None).
+
+    Returns:
+        ConfigIR: The compiled configuration.
+    """
+    global _last_compiled
+    config = config or {}
+    key = config_fingerprint(config)
+    if key is not None and _last_compiled is not None and _last_compiled[0] == key:
+        return _last_compiled[1]
+
+    converter = CaseConverter()
+    module_configs = config.get('modules') or []
+    graph = ModuleGraph(module_configs)
+    modules = tuple(_compile_modules(module_configs, converter, graph))
+
+    app = config.get('app') or {}
+    persistence_provider = (config.get('persistence') or {}).get('provider', 'sqlite')
+    auth = config.get('auth') or {}
+    ir = ConfigIR(
+        config,
+        app_name=app.get('name'),
+        package=app.get('package'),
+        modules=modules,
+        modules_by_name=_view({module.name: module for module in modules}),
+        graph=graph,
+        persistence_provider=persistence_provider,
+        use_sqlite=(config.get('persistence') or {}).get('provider') == 'sqlite',
+        has_auth=bool(auth.get('enabled', False)),
+        auth_provider=auth.get('provider', 'firebase'),
+        firebase_enabled=auth.get('provider') == 'firebase' or persistence_provider == 'firebase',
+        has_dashboard=bool((config.get('dashboard') or {}).get('enabled', False)),
+        translations_enabled=bool((config.get('translations') or {}).get('enabled', True)),
+        uses_background_worker=any(module.isolate_threshold for module in modules),
+    )
+
+    _last_compiled = (key, ir) if key is not None else None
+    return ir
+
+
+def config_fingerprint(config):
+    """Hash of the configuration content (None when it cannot be serialized, e.g. mixed key types)"""
+    try:
+        data = json.dumps(config, sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def clear_compiled_cache():
+    """Forget the memoized IR (the next compile_config call compiles from scratch)"""
+    global _last_compiled
+    _last_compiled = None
+
+
+# Última configuração compilada: (hash do conteúdo, ConfigIR)
+_last_compiled = None
@@ -1,15 +1,17 @@
 import os
-from jinja2 import Environment, FileSystemLoader
+from generators.dashboard_query_compiler import compile_dashboard_queries
+from utils.file_manager import FileManager
+from utils.template_registry import get_jinja_env
 
 
 class DashboardGenerator:
-    def __init__(self, app_dir, config):
+    def __init__(self, app_dir, config, file_manager=None):
         self.app_dir = app_dir
         self.config = config
+        self.file_manager = file_manager or FileManager()
 
-        # Set up Jinja2 environment
-        template_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'templates')
-        self.jinja_env = Environment(loader=FileSystemLoader(template_dir))
+        # Shared Jinja2 environment (templates are compiled once per process)
+        self.jinja_env = get_jinja_env()
 
     def generate(self):
         """Generate dashboard files for the Flutter app"""
@@ -19,13 +21,20 @@ class DashboardGenerator:
 
         # Create dashboard directories
         dashboard_dir = os.path.join(self.app_dir, 'lib', 'features', 'dashboard')
-        os.makedirs(os.path.join(dashboard_dir, 'presentation', 'screens'), exist_ok=True)
-        os.makedirs(os.path.join(dashboard_dir, 'presentation', 'widgets'), exist_ok=True)
+        self.file_manager.create_directory(os.path.join(dashboard_dir, 'presentation', 'screens'))
+        self.file_manager.create_directory(os.path.join(dashboard_dir, 'presentation', 'widgets'))
+        self.file_manager.create_directory(os.path.join(dashboard_dir, 'data', 'repositories'))
 
-        # Get dashboard widgets from config
-        widgets = self.config.get('dashboard', {}).get('widgets', [])
+        if self.config.get('persistence', {}).get('provider') != 'sqlite':
+            print("⚠️ Dashboard widgets read aggregate queries from SQLite; set persistence.provider to 'sqlite'")
 
-        # Generate dashboard screen
+        # Compila cada widget em uma consulta agregada (os que não compilam são ignorados)
+        compiled = compile_dashboard_queries(self.config.get('dashboard', {}).get('widgets', []),
+                                             self.config.get('modules', []))
+        widgets = [{**widget, 'query_key': query['key']} for widget, query in compiled]
+
+        # Generate the repository that runs the queries, and the dashboard screen
+        self._generate_dashboard_repository(dashboard_dir, [query for _, query in compiled])
         self._generate_dashboard_screen(dashboard_dir, widgets)
 
         # Generate chart widgets
@@ -39,10 +48,21 @@ class DashboardGenerator:
             elif widget.get('type') == 'kpi':
                 self._generate_kpi_widget(dashboard_dir, widget)
 
+    def _generate_dashboard_repository(self, dashboard_dir, queries):
+        """Generate the repository with the compiled aggregate queries of the widgets"""
+        output_path = os.path.join(dashboard_dir, 'data', 'repositories', 'dashboard_repository.dart')
+        self.file_manager.render_template(
+            'dashboard/dashboard_repository.dart.jinja',
+            output_path,
+            queries=queries,
+        )
+
     def _generate_dashboard_screen(self, dashboard_dir, widgets):
         """Generate the main dashboard screen"""
-        template = self.jinja_env.get_template('dashboard/dashboard_screen.dart.jinja')
-        output = template.render(
+        output_path = os.path.join(dashboard_dir, 'presentation', 'screens', 'dashboard_screen.dart')
+        self.file_manager.render_template(
+            'dashboard/dashboard_screen.dart.jinja',
+            output_path,
             widgets=widgets,
             has_bar_chart=any(w.get('type') == 'bar_chart' for w in widgets),
             has_pie_chart=any(w.get('type') == 'pie_chart' for w in widgets),
@@ -50,50 +70,38 @@ class DashboardGenerator:
             has_kpi=any(w.get('type') == 'kpi' for w in widgets),
         )
 
-        output_path = os.path.join(dashboard_dir, 'presentation', 'screens', 'dashboard_screen.dart')
-        with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-            f.write(output)
-
     def _generate_bar_chart_widget(self, dashboard_dir, widget_config):
         """Generate a bar chart widget"""
-        template = self.jinja_env.get_template('dashboard/bar_chart_widget.dart.jinja')
-        output = template.render(
+        output_path = os.path.join(dashboard_dir, 'presentation', 'widgets', 'bar_chart_widget.dart')
+        self.file_manager.render_template(
+            'dashboard/bar_chart_widget.dart.jinja',
+            output_path,
             widget_config=widget_config,
         )
 
-        output_path = os.path.join(dashboard_dir, 'presentation', 'widgets', 'bar_chart_widget.dart')
-        with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-            f.write(output)
-
     def _generate_pie_chart_widget(self, dashboard_dir, widget_config):
         """Generate a pie chart widget"""
-        template = self.jinja_env.get_template('dashboard/pie_chart_widget.dart.jinja')
-        output = template.render(
+        output_path = os.path.join(dashboard_dir, 'presentation', 'widgets', 'pie_chart_widget.dart')
+        self.file_manager.render_template(
+            'dashboard/pie_chart_widget.dart.jinja',
+            output_path,
             widget_config=widget_config,
         )
 
-        output_path = os.path.join(dashboard_dir, 'presentation', 'widgets', 'pie_chart_widget.dart')
-        with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-            f.write(output)
-
     def _generate_line_chart_widget(self, dashboard_dir, widget_config):
         """Generate a line chart widget"""
-        template = self.jinja_env.get_template('dashboard/line_chart_widget.dart.jinja')
-        output = template.render(
+        output_path = os.path.join(dashboard_dir, 'presentation', 'widgets', 'line_chart_widget.dart')
+        self.file_manager.render_template(
+            'dashboard/line_chart_widget.dart.jinja',
+            output_path,
             widget_config=widget_config,
         )
 
-        output_path = os.path.join(dashboard_dir, 'presentation', 'widgets', 'line_chart_widget.dart')
-        with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-            f.write(output)
-
     def _generate_kpi_widget(self, dashboard_dir, widget_config):
         """Generate a KPI widget"""
-        template = self.jinja_env.get_template('dashboard/kpi_widget.dart.jinja')
-        output = template.render(
-            widget_config=widget_config,
-        )
-
         output_path = os.path.join(dashboard_dir, 'presentation', 'widgets', 'kpi_widget.dart')
-        with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-            f.write(output)
\ No newline at end of file
+        self.file_manager.render_template(
+            'dashboard/kpi_widget.dart.jinja',
+            output_path,
+            widget_config=widget_config,
+        )
\ No newline at end of file
@@ -0,0 +1,203 @@
+"""
+Dashboard aggregate queries for Flutter App Creator.
+
+Every dashboard widget is compiled at generation time into one aggregate SQL
+statement over the module tables (COUNT/SUM/AVG/MIN/MAX, GROUP BY a field or
+a `strftime` date bucket). Identifiers come from the configuration and are
+validated against the modules; everything else (date formats, limits) is
+passed as arguments. The generated DashboardRepository runs the statements
+of all widgets in one batch and keeps the results until one of the tables a
+widget reads is written again.
+
+Example (dashboard YAML):
+
+    dashboard:
+      enabled: true
+      widgets:
+        - type: kpi
+          title: "Events"
+          source: Event
+          operation: count
+        - type: bar_chart
+          title: "Results by month"
+          source: Result
+          operation: avg
+          field: points
+          group_by: createdAt
+          date_bucket: month
+"""
+
+from generators.sqlite_schema_generator import get_column_name
+
+# operation -> SQL aggregate
+OPERATIONS = {
+    'count': 'COUNT',
+    'sum': 'SUM',
+    'avg': 'AVG',
+    'average': 'AVG',
+    'min': 'MIN',
+    'max': 'MAX',
+}
+
+# date_bucket -> strftime format (dates are stored as ISO8601 text)
+DATE_BUCKETS = {
+    'day': '%Y-%m-%d',
+    'week': '%Y-W%W',
+    'month': '%Y-%m',
+    'year': '%Y',
+}
+
+NUMERIC_TYPES = ('int', 'double')
+DATE_COLUMNS = ('createdAt', 'updatedAt')
+SERIES_TYPES = ('bar_chart', 'pie_chart', 'line_chart')
+
+# Categories shown by a chart grouped by a field (the largest ones)
+DEFAULT_SERIES_LIMIT = 12
+
+
+def _warn(widget, message):
+    print(f"⚠️ Dashboard widget '{widget.get('title', widget.get('type', '?'))}': {message}")
+
+
+def compile_widget_query(widget, modules_by_name, index):
+    """
+    Compile one dashboard widget into an aggregate query.
+
+    Args:
+        widget (dict): Widget configuration (type, source, operation, field, group_by, date_bucket, limit).
+        modules_by_name (dict): Module configurations by name.
+        index (int): Position of the widget, used for its default key.
+
+    Returns:
+        dict or None: key, sql, args, tables and series (True when the query
+                      returns label/value rows instead of a single value).
+                      None when the widget cannot be compiled.
+    """
+    widget_type = widget.get('type')
+    source = widget.get('source') or widget.get('data_source')
+    module = modules_by_name.get(source)
+    if module is None:
+        _warn(widget, f"unknown source module '{source}', widget skipped")
+        return None
+
+    operation = str(widget.get('operation', 'count')).lower()
+    if operation not in OPERATIONS:
+        _warn(widget, f"unknown operation '{operation}', widget skipped")
+        return None
+
+    table = module['name'].lower()
+    fields = {field['name']: field for field in module.get('fields', []) if 'name' in field}
+    tables = [table]
+
+    field_name = widget.get('field')
+    if operation == 'count':
+        value = f"COUNT(t.{get_column_name(fields[field_name])})" if field_name in fields else "COUNT(*)"
+    else:
+        field = fields.get(field_name)
+        if field is None or (operation in ('sum', 'avg', 'average') and field.get('type') not in NUMERIC_TYPES):
+            _warn(widget, f"'{operation}' needs a numeric field of {source}, got '{field_name}'; widget skipped")
+            return None
+        value = f"{OPERATIONS[operation]}(t.{field_name})"
+        if operation == 'sum':
+            # SUM of no rows is NULL; the dashboard shows 0
+            value = f"COALESCE({value}, 0)"
+
+    where = []
+    if module.get('soft_delete', False):
+        where.append("t.deletedAt IS NULL")
+
+    series = widget_type in SERIES_TYPES
+    group_by = widget.get('group_by')
+    date_bucket = widget.get('date_bucket')
+    if widget_type == 'kpi' and (group_by or date_bucket):
+        _warn(widget, "KPIs show a single value, group_by/date_bucket ignored")
+    elif series and not (group_by or date_bucket):
+        _warn(widget, "charts need a group_by or a date_bucket, widget skipped")
+        return None
+
+    args = []
+    if not series:
+        sql = f"SELECT {value} AS value FROM {table} t"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+    elif date_bucket:
+        bucket_format = DATE_BUCKETS.get(date_bucket)
+        if bucket_format is None:
+            _warn(widget, f"unknown date_bucket '{date_bucket}' (use {', '.join(DATE_BUCKETS)}), widget skipped")
+            return None
+
+        column = group_by or 'createdAt'
+        if column not in DATE_COLUMNS and fields.get(column, {}).get('type') != 'DateTime':
+            _warn(widget, f"date_bucket needs a DateTime field, '{column}' is not one; widget skipped")
+            return None
+
+        where.append(f"t.{column} IS NOT NULL")
+        sql = (f"SELECT strftime(?, t.{column}) AS label, {value} AS value FROM {table} t "
+               f"WHERE {' AND '.join(where)} GROUP BY label")
+        args.append(bucket_format)
+
+        limit = widget.get('limit')
+        if limit:
+            # Os N períodos mais recentes, em ordem cronológica
+            sql = f"SELECT * FROM ({sql} ORDER BY label DESC LIMIT ?) ORDER BY label"
+            args.append(int(limit))
+        else:
+            sql += " ORDER BY label"
+    else:
+        field = fields.get(group_by)
+        if field is None and group_by not in DATE_COLUMNS:
+            _warn(widget, f"unknown group_by field '{group_by}' of {source}, widget skipped")
+            return None
+
+        column = get_column_name(field) if field else group_by
+        label = f"t.{column}"
+        joins = ""
+        target = modules_by_name.get(field.get('reference')) if field and field.get('type') == 'reference' else None
+        if target is not None:
+            # Rótulo legível: o título do módulo referenciado em vez do id
+            target_table = target['name'].lower()
+            label = f"COALESCE(r.{target.get('title', 'name')}, t.{column})"
+            joins = f" LEFT JOIN {target_table} r ON r.id = t.{column}"
+            tables.append(target_table)
+
+        sql = f"SELECT {label} AS label, {value} AS value FROM {table} t{joins}"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" GROUP BY t.{column} ORDER BY value DESC LIMIT ?"
+        args.append(int(widget.get('limit') or DEFAULT_SERIES_LIMIT))
+
+    return {
+        'key': str(widget.get('id') or f"{widget_type}_{index}"),
+        'sql': sql,
+        'args': args,
+        'tables': tables,
+        'series': series,
+    }
+
+
+def compile_dashboard_queries(widgets, modules):
+    """
+    Compile the dashboard widgets into aggregate queries.
+
+    Args:
+        widgets (list): Widget configurations.
+        modules (list): Module configurations.
+
+    Returns:
+        list: (widget, query) pairs of the widgets that compiled, in order.
+    """
+    modules_by_name = {module['name']: module for module in modules if 'name' in module}
+    compiled = []
+    keys = set()
+
+    for index, widget in enumerate(widgets):
+        query = compile_widget_query(widget, modules_by_name, index)
+        if query is None:
+            continue
+        if query['key'] in keys:
+            _warn(widget, f"duplicate id '{query['key']}', widget skipped")
+            continue
+        keys.add(query['key'])
+        compiled.append((widget, query))
+
+    return compiled
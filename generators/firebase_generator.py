@@ -3,21 +3,28 @@ import re
 import json
 import subprocess
 from typing import Optional, Dict, List
-from jinja2 import Environment, FileSystemLoader
+from utils.file_manager import FileManager
+from utils.template_registry import get_jinja_env
 
 
 class FirebaseGenerator:
-    def __init__(self, app_dir: str, config: Dict, dependency_manager=None):
+    def __init__(self, app_dir: str, config: Dict, dependency_manager=None, file_manager=None):
         self.app_dir = app_dir
         self.config = config
         self.dependency_manager = dependency_manager
+        self.file_manager = file_manager or FileManager()
 
-        # Set up Jinja2 environment
-        template_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'templates')
-        self.jinja_env = Environment(loader=FileSystemLoader(template_dir))
+        # Shared Jinja2 environment (templates are compiled once per process)
+        self.jinja_env = get_jinja_env()
 
-    def setup_firebase(self):
-        """Setup Firebase for the Flutter app"""
+    def setup_firebase(self, install_dependencies=True):
+        """
+        Setup Firebase for the Flutter app
+
+        Args:
+            install_dependencies (bool): Add the Firebase packages with `flutter pub add`.
+                Disable when they were already planned into pubspec.yaml (see get_firebase_dependencies).
+        """
         print("🔥 Setting up Firebase...")
 
         # Get Firebase project ID
@@ -40,7 +47,7 @@ class FirebaseGenerator:
         self._configure_firebase_for_flutter(project_id)
 
         # Add Firebase dependencies using DependencyManager
-        if self.dependency_manager:
+        if install_dependencies and self.dependency_manager:
             self._add_firebase_dependencies()
 
         print("✅ Firebase setup completed successfully!")
@@ -283,32 +290,22 @@ class FirebaseGenerator:
     def _generate_placeholder_firebase_options(self):
         """Generate placeholder firebase_options.dart file"""
         try:
-            template = self.jinja_env.get_template('firebase/firebase_options.dart.jinja')
-            output = template.render(
+            firebase_options_path = os.path.join(self.app_dir, 'lib', 'firebase_options.dart')
+            self.file_manager.render_template(
+                'firebase/firebase_options.dart.jinja',
+                firebase_options_path,
                 project_id=self._get_firebase_app_id(),
                 app_name=self.config.get('app', {}).get('name', 'Flutter App')
             )
 
-            firebase_options_path = os.path.join(self.app_dir, 'lib', 'firebase_options.dart')
-            os.makedirs(os.path.dirname(firebase_options_path), exist_ok=True)
-
-            with open(firebase_options_path, 'w', encoding='utf-8', newline='\n') as f:
-                f.write(output)
-
             print("📄 Placeholder firebase_options.dart generated")
             print("⚠️ Please run 'flutterfire configure' manually to set up real Firebase configuration")
 
         except Exception as e:
             print(f"❌ Failed to generate placeholder firebase_options.dart: {e}")
 
-    def _add_firebase_dependencies(self):
-        """Add Firebase dependencies using DependencyManager"""
-        if not self.dependency_manager:
-            print("⚠️ DependencyManager not available, skipping Firebase dependency installation")
-            return
-
-        print("📦 Adding Firebase dependencies...")
-
+    def get_firebase_dependencies(self) -> List[str]:
+        """Return the Firebase packages required by the configuration"""
         firebase_packages = []
 
         # Always add core Firebase
@@ -335,6 +332,18 @@ class FirebaseGenerator:
         if self.config.get('firebase', {}).get('analytics', True):
             firebase_packages.append('firebase_analytics')
 
+        return firebase_packages
+
+    def _add_firebase_dependencies(self):
+        """Add Firebase dependencies using DependencyManager"""
+        if not self.dependency_manager:
+            print("⚠️ DependencyManager not available, skipping Firebase dependency installation")
+            return
+
+        print("📦 Adding Firebase dependencies...")
+
+        firebase_packages = self.get_firebase_dependencies()
+
         # Install the packages
         try:
             # Use the dependency manager's flutter_cli to add packages
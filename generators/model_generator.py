@@ -1,143 +1,101 @@
 import os
-from jinja2 import Environment, FileSystemLoader, exceptions as jinja2_exceptions
+import multiprocessing
+from pickle import PicklingError
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from jinja2 import exceptions as jinja2_exceptions
 from utils.case_converter import CaseConverter
+from utils.file_manager import FileManager
+from utils.manifest import Manifest
+from utils.template_registry import get_jinja_env
+from utils.task_scheduler import detach_output
+from generators.config_compiler import compile_config
 
 
 class ModelGenerator:
-    def __init__(self, app_dir, config=None):
+    def __init__(self, app_dir, config=None, file_manager=None):
         self.app_dir = app_dir
         self.case_converter = CaseConverter()
         self.config = config
+        self.file_manager = file_manager or FileManager()
 
-        # Set up Jinja2 environment
-        template_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'templates')
-        self.jinja_env = Environment(loader=FileSystemLoader(template_dir))
+        # Shared Jinja2 environment (templates are compiled once per process)
+        self.jinja_env = get_jinja_env()
 
-        # Check if SQLite is being used
-        self.use_sqlite = config and config.get('persistence', {}).get('provider') == 'sqlite' if config else False
-
-        # Analyze relationships from all modules
+        # Configuração compilada (nomes, relacionamentos e opções de cada módulo), compartilhada entre geradores
+        self.ir = compile_config(config)
+        self.use_sqlite = self.ir.use_sqlite
         self.modules_config = config.get('modules', []) if config else []
-        self.relationships = self._analyze_relationships()
-
-    def _analyze_relationships(self):
-        """Analisa os módulos e identifica relacionamentos"""
-        relationships = {}
 
-        for module in self.modules_config:
-            module_name = module.get('name')
-            relationships[module_name] = {
-                'direct': [],  # Relacionamentos que este módulo possui (FK)
-                'reverse': []  # Relacionamentos onde este módulo é referenciado
-            }
-
-            # Analisar campos de referência
-            for field in module.get('fields', []):
-                if field.get('type') == 'reference':
-                    reference_module = field.get('reference')
-                    if reference_module:
-                        relationships[module_name]['direct'].append({
-                            'to_module': reference_module,
-                            'field_name': field.get('name'),
-                            'pascal_name': self.case_converter.to_pascal_case(field.get('name').replace('Id', '')),
-                            'camel_name': self.case_converter.to_camel_case(field.get('name').replace('Id', '')),
-                            'required': field.get('required', False)
-                        })
-
-        # Encontrar relacionamentos reversos
-        for module_name, module_rels in relationships.items():
-            for rel in module_rels['direct']:
-                target_module = rel['to_module']
-                if target_module in relationships:
-                    # Criar um nome único para o relacionamento reverso baseado no campo
-                    field_base_name = rel['field_name'].replace('Id', '')
-
-                    # Adicionar o relacionamento reverso com nome único
-                    relationships[target_module]['reverse'].append({
-                        'from_module': module_name,
-                        'field_name': rel['field_name'],
-                        'camel_name': self.case_converter.to_camel_case(module_name),
-                        'reverse_name': f"{module_name.lower()}ListAs{field_base_name.capitalize()}",
-                        'required': rel['required']
-                    })
-
-        return relationships
-
-    def get_module_relationships(self, module_name):
-        """Retorna os relacionamentos de um módulo específico"""
-        return self.relationships.get(module_name, {'direct': [], 'reverse': []})
+        # Created lazily and reused for every module's repository
+        self._sqlite_generator = None
+        self._cycles_reported = False
+
+        # Erros por módulo (nome do módulo -> lista de mensagens)
+        self.errors = {}
+
+    def _report_error(self, module_name, message):
+        """Print an error and keep it in the per-module error report"""
+        print(message)
+        self.errors.setdefault(module_name, []).append(message)
+
+    def _get_sqlite_generator(self):
+        """Return the SQLiteGenerator shared by every module of this generator"""
+        if self._sqlite_generator is None:
+            from generators.sqlite_generator import SQLiteGenerator
+            self._sqlite_generator = SQLiteGenerator(self.app_dir, self.config, self.file_manager)
+        return self._sqlite_generator
+
+    def get_module_relationships(self, module_name, view='analysis'):
+        """
+        Retorna os relacionamentos de um módulo específico.
+
+        `view` selects the keys of the reverse relationships handed to a
+        template family (see config_compiler.RELATIONSHIP_VIEWS).
+        """
+        module = self.ir.module(module_name)
+        if module is None:
+            return {'direct': (), 'reverse': ()}
+        return module.relationship_views[view]
+
+    def get_module_includes(self, module_name):
+        """
+        Relationships the repository of a module can load in batch (`getAll(include: [...])`).
+
+        Each include has the key read by the model's fromJson (`name`), the
+        related table, the foreign key column and whether the related table
+        has soft delete. Direct relationships are matched by id, reverse ones
+        by the foreign key of the other module.
+        """
+        module = self.ir.module(module_name)
+        return list(module.includes) if module is not None else []
 
     def get_dependency_order(self):
-        """Retorna a ordem de criação baseada nas dependências"""
-        dependency_graph = {}
-        all_modules = set()
+        """
+        Retorna a ordem de criação baseada nas dependências.
+
+        Dependencies come first (see ModuleGraph: topological levels, config
+        order inside each level). Circular references are reported once and
+        broken in config order.
+        """
+        self._report_cycles()
+        return list(self.ir.graph.order)
+
+    def _report_cycles(self):
+        """Print the circular references of the configuration (once per generator)"""
+        if self._cycles_reported:
+            return
+        self._cycles_reported = True
 
-        # Construir grafo de dependências
-        for module in self.modules_config:
-            module_name = module.get('name')
-            all_modules.add(module_name)
-            dependency_graph[module_name] = []
-
-            for field in module.get('fields', []):
-                if field.get('type') == 'reference':
-                    reference = field.get('reference')
-                    if reference:
-                        dependency_graph[module_name].append(reference)
-
-        # Ordenação topológica
-        visited = set()
-        temp_visited = set()
-        result = []
-
-        def visit(module):
-            if module in temp_visited:
-                return False  # Dependência circular
-            if module in visited:
-                return True
-
-            temp_visited.add(module)
-
-            for dependency in dependency_graph.get(module, []):
-                if not visit(dependency):
-                    return False
-
-            temp_visited.remove(module)
-            visited.add(module)
-            result.append(module)
-            return True
-
-        # Processar todos os módulos
-        for module in all_modules:
-            if module not in visited:
-                if not visit(module):
-                    print(f"Warning: Circular dependency detected involving {module}")
-                    # Em caso de dependência circular, usar ordem original
-                    result = [m.get('name') for m in self.modules_config]
-                    break
-
-        return result
+        graph = self.ir.graph
+        for cycle in graph.cycles:
+            print(f"⚠️ Circular dependency: {graph.format_cycle(cycle)}")
+        for module_name, dependency in graph.broken_edges:
+            print(f"  ↳ {module_name} is generated before its dependency {dependency} (config order)")
 
     def generate_relationship_imports(self, module_name):
-        relationships = self.get_module_relationships(module_name)
-        imports = []
-        imported_modules = set()
-
-        for rel in relationships['direct']:
-            related_module = rel['to_module']
-            if related_module not in imported_modules:
-                snake_case = self.case_converter.to_snake_case(related_module)
-                imports.append(f"import '../../../{snake_case}/domain/entities/{snake_case}_entity.dart';")
-                imported_modules.add(related_module)
-
-        # Para relacionamentos reversos, também precisamos dos imports
-        for rel in relationships['reverse']:
-            related_module = rel['from_module']
-            if related_module not in imported_modules:
-                snake_case = self.case_converter.to_snake_case(related_module)
-                imports.append(f"import '../../../{snake_case}/domain/entities/{snake_case}_entity.dart';")
-                imported_modules.add(related_module)
-
-        return imports
+        module = self.ir.module(module_name)
+        return list(module.related_imports) if module is not None else []
 
     def print_relationships_summary(self):
         """Imprime um resumo dos relacionamentos identificados"""
@@ -160,17 +118,99 @@ class ModelGenerator:
         print(f"\nDependency Order: {' → '.join(dependency_order)}")
         print("=" * 30)
 
-    def generate_all_modules(self):
+    def generate_all_modules(self, jobs=1):
         """Gera todos os módulos na ordem correta de dependências"""
         self.print_relationships_summary()
 
-        dependency_order = self.get_dependency_order()
-        modules_dict = {module.get('name'): module for module in self.modules_config}
+        return self.generate_modules(self.modules_config, jobs=jobs)
+
+    def _order_modules(self, module_configs):
+        """Sort module configs by dependency order, keeping unknown modules at the end"""
+        position = {name: i for i, name in enumerate(self.get_dependency_order())}
+        indexed = list(enumerate(module_configs))
+        indexed.sort(key=lambda item: (position.get(item[1].get('name'), len(position)), item[0]))
+        return [module_config for _, module_config in indexed]
+
+    def generate_modules(self, module_configs=None, jobs=1):
+        """
+        Generate several modules, optionally in parallel.
+
+        Modules are submitted in dependency order and their results are
+        collected in that same order, so logs and error reports stay
+        deterministic regardless of the number of workers.
 
-        for module_name in dependency_order:
-            if module_name in modules_dict:
-                module_config = modules_dict[module_name]
+        Args:
+            module_configs (list, optional): Modules to generate. Defaults to every configured module.
+            jobs (int): Number of worker processes. 1 generates sequentially in this process.
+
+        Returns:
+            dict: Module name -> list of error messages, for modules that reported errors.
+        """
+        if module_configs is None:
+            module_configs = self.modules_config
+
+        ordered = self._order_modules(module_configs)
+        jobs = max(1, min(jobs or 1, len(ordered)))
+
+        if jobs == 1:
+            for module_config in ordered:
+                print(f"📄 Generating module: {module_config.get('name', 'Unknown')}")
+                self.generate_module(module_config)
+        else:
+            print(f"⚙️ Generating {len(ordered)} modules with {jobs} workers...")
+            for module_name, errors in self._generate_in_pool(ordered, jobs):
+                print(f"📄 Generated module: {module_name}")
+                if errors:
+                    self.errors.setdefault(module_name, []).extend(errors)
+
+        self._print_error_report()
+        return self.errors
+
+    def _generate_in_pool(self, ordered, jobs):
+        """
+        Render modules on a process pool.
+
+        When processes are unavailable or the pool breaks (a worker killed, a
+        config that cannot be pickled, fork forbidden by a sandbox), the
+        modules whose results were not collected yet are generated
+        sequentially in this process.
+        """
+        use_manifest = self.file_manager.manifest is not None
+        buffered = self.file_manager.buffered
+        collected = 0
+        try:
+            with ProcessPoolExecutor(max_workers=jobs, mp_context=_pool_context(), initializer=_init_module_worker,
+                                     initargs=(self.app_dir, self.config, use_manifest, buffered)) as executor:
+                futures = [executor.submit(_generate_module_in_worker, module_config) for module_config in ordered]
+                for module_config, future in zip(ordered, futures):
+                    module_name = module_config.get('name', 'Unknown')
+                    try:
+                        module_name, errors, file_state = future.result()
+                        self.file_manager.merge_state(file_state)
+                    except (BrokenProcessPool, PicklingError):
+                        raise
+                    except Exception as e:
+                        errors = [f"Error generating module {module_name}: {e}"]
+                    collected += 1
+                    yield module_name, errors
+        except (OSError, NotImplementedError, ImportError, BrokenProcessPool, PicklingError) as e:
+            remaining = ordered[collected:]
+            print(f"⚠️ Process pool unavailable ({e}), generating {len(remaining)} module(s) sequentially")
+            for module_config in remaining:
+                # Erros já entram no relatório via _report_error
                 self.generate_module(module_config)
+                yield module_config.get('name', 'Unknown'), []
+
+    def _print_error_report(self):
+        """Print the merged per-module error report"""
+        if not self.errors:
+            return
+
+        print(f"\n⚠️ {sum(len(v) for v in self.errors.values())} problem(s) in {len(self.errors)} module(s):")
+        for module_name, errors in self.errors.items():
+            print(f"  {module_name}:")
+            for error in errors:
+                print(f"    - {error}")
 
     def generate_module(self, module_config):
         """Generate all files for a module"""
@@ -179,250 +219,192 @@ class ModelGenerator:
             print("Warning: Module config missing 'name' field.")
             return
 
-        # Convert module name to various cases
-        snake_case = self.case_converter.to_snake_case(module_name)
-        camel_case = self.case_converter.to_camel_case(module_name)
-        pascal_case = self.case_converter.to_pascal_case(module_name)
-
-        # Get relationships for this module
-        relationships = self.get_module_relationships(module_name)
-        related_imports = self.generate_relationship_imports(module_name)
+        # Nomes, relacionamentos e opções já compilados
+        module = self.ir.module_for(module_config)
+        snake_case = module.snake_name
+        pascal_case = module.pascal_name
+        pagination = module.pagination_options
+        search = module.search_options
+        includes = list(module.includes)
 
         # Create module directories
         module_dir = os.path.join(self.app_dir, 'lib', 'features', snake_case)
-        os.makedirs(os.path.join(module_dir, 'data', 'models'), exist_ok=True)
-        os.makedirs(os.path.join(module_dir, 'data', 'repositories'), exist_ok=True)
-        os.makedirs(os.path.join(module_dir, 'domain', 'entities'), exist_ok=True)
-        os.makedirs(os.path.join(module_dir, 'domain', 'repositories'), exist_ok=True)
-        os.makedirs(os.path.join(module_dir, 'domain', 'usecases'), exist_ok=True)
-        os.makedirs(os.path.join(module_dir, 'presentation', 'controllers'), exist_ok=True)
-        os.makedirs(os.path.join(module_dir, 'presentation', 'screens'), exist_ok=True)
-        os.makedirs(os.path.join(module_dir, 'presentation', 'widgets'), exist_ok=True)
+        self.file_manager.create_directory(os.path.join(module_dir, 'data', 'models'))
+        self.file_manager.create_directory(os.path.join(module_dir, 'data', 'repositories'))
+        self.file_manager.create_directory(os.path.join(module_dir, 'domain', 'entities'))
+        self.file_manager.create_directory(os.path.join(module_dir, 'domain', 'repositories'))
+        self.file_manager.create_directory(os.path.join(module_dir, 'domain', 'usecases'))
+        self.file_manager.create_directory(os.path.join(module_dir, 'presentation', 'controllers'))
+        self.file_manager.create_directory(os.path.join(module_dir, 'presentation', 'screens'))
+        self.file_manager.create_directory(os.path.join(module_dir, 'presentation', 'widgets'))
 
         # Generate entity with relationships
-        self._generate_entity(module_dir, module_name, pascal_case, module_config, relationships, related_imports)
+        self._generate_entity(module_dir, module)
 
         # Generate model with relationships
-        self._generate_model(module_dir, module_name, pascal_case, module_config, relationships, related_imports)
+        self._generate_model(module_dir, module)
 
         # Generate repository interface
-        self._generate_repository_interface(module_dir, module_name, pascal_case,
-                                            module_config.get('soft_delete', False))
+        self._generate_repository_interface(module_dir, module_name, pascal_case, module.soft_delete, pagination,
+                                            search, includes)
 
         # Generate repository implementation
-        self._generate_repository_implementation(module_dir, module_name, pascal_case, module_config)
+        self._generate_repository_implementation(module_dir, module, module_config, pagination, search, includes)
 
         # Generate usecases
-        self._generate_usecases(module_dir, module_name, pascal_case, module_config.get('soft_delete', False))
+        self._generate_usecases(module_dir, module_name, pascal_case, module.soft_delete, pagination, search)
 
         # Generate controller
-        self._generate_controller(module_dir, module_name, pascal_case, module_config.get('soft_delete', False))
+        self._generate_controller(module_dir, module_name, pascal_case, module.soft_delete, pagination)
 
         # Generate screens
-        self._generate_screens(module_dir, module_name, pascal_case, module_config)
+        self._generate_screens(module_dir, module)
 
         # Generate relationship helpers if needed
-        if relationships['direct'] or relationships['reverse']:
-            self._generate_relationship_helpers(module_dir, module_name, pascal_case, module_config, relationships)
+        if module.has_relationships:
+            self._generate_relationship_helpers(module_dir, module)
 
-    def _generate_entity(self, module_dir, module_name, pascal_case, module_config, relationships, related_imports):
+    def _generate_entity(self, module_dir, module):
         """Generate the entity class for the module with relationships"""
         try:
-
-            template = self.jinja_env.get_template('module/entity.dart.jinja')
-
-            # Processar relacionamentos reversos para evitar duplicação
-            processed_reverse = []
-            seen_combinations = set()
-
-            for rel in relationships['reverse']:
-                # Usar o reverse_name único que criamos
-                rel_copy = rel.copy()
-                rel_copy['property_name'] = self.case_converter.to_pascal_case(rel['reverse_name'])
-                rel_copy['camel_name'] = self.case_converter.to_camel_case(rel['reverse_name'])
-                processed_reverse.append(rel_copy)
-
-            adjusted_relationships = {
-                'direct': relationships['direct'],
-                'reverse': processed_reverse
-            }
-
-            output = template.render(
-                module_name=module_name,
-                title=module_config.get('title', 'name'),
-                pascal_case=pascal_case,
-                fields=module_config.get('fields', []),
-                soft_delete=module_config.get('soft_delete', False),
-                relationships=adjusted_relationships,
-                related_imports=related_imports,
-                has_relationships=len(relationships['direct']) > 0 or len(relationships['reverse']) > 0
+            output_path = os.path.join(module_dir, 'domain', 'entities', f'{module.snake_name}_entity.dart')
+            self.file_manager.render_template(
+                'module/entity.dart.jinja',
+                output_path,
+                module_name=module.name,
+                title=module.title_field,
+                pascal_case=module.pascal_name,
+                fields=module.fields,
+                soft_delete=module.soft_delete,
+                relationships=module.relationship_views['entity'],
+                related_imports=module.related_imports,
+                has_relationships=module.has_relationships
             )
-
-            output_path = os.path.join(module_dir, 'domain', 'entities',
-                                       f'{self.case_converter.to_snake_case(module_name)}_entity.dart')
-            with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-                f.write(output)
         except Exception as e:
-            print(f"Error generating entity for {module_name}: {e}")
+            self._report_error(module.name, f"Error generating entity for {module.name}: {e}")
 
-    def _generate_model(self, module_dir, module_name, pascal_case, module_config, relationships, related_imports):
+    def _generate_model(self, module_dir, module):
         """Generate the model class for the module with relationships"""
         try:
-            template = self.jinja_env.get_template('module/model.dart.jinja')
-
-            # Processar relacionamentos reversos com nomes únicos
-            processed_reverse = []
-            for rel in relationships['reverse']:
-                rel_copy = rel.copy()
-                rel_copy['property_name'] = self.case_converter.to_pascal_case(rel['reverse_name'])
-                rel_copy['camel_name'] = self.case_converter.to_camel_case(rel['reverse_name'])
-                processed_reverse.append(rel_copy)
-
-            adjusted_relationships = {
-                'direct': relationships['direct'],
-                'reverse': processed_reverse
-            }
-
-            output = template.render(
-                module_name=module_name,
-                snake_name=self.case_converter.to_snake_case(module_name),
-                pascal_case=pascal_case,
-                fields=module_config.get('fields', []),
-                soft_delete=module_config.get('soft_delete', False),
-                relationships=adjusted_relationships,
-                related_imports=related_imports,
-                has_relationships=len(relationships['direct']) > 0 or len(relationships['reverse']) > 0
+            output_path = os.path.join(module_dir, 'data', 'models', f'{module.snake_name}_model.dart')
+            self.file_manager.render_template(
+                'module/model.dart.jinja',
+                output_path,
+                module_name=module.name,
+                snake_name=module.snake_name,
+                pascal_case=module.pascal_name,
+                fields=module.fields,
+                soft_delete=module.soft_delete,
+                relationships=module.relationship_views['entity'],
+                related_imports=module.related_imports,
+                has_relationships=module.has_relationships
             )
-
-            output_path = os.path.join(module_dir, 'data', 'models',
-                                       f'{self.case_converter.to_snake_case(module_name)}_model.dart')
-            with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-                f.write(output)
         except Exception as e:
-            print(f"Error generating model for {module_name}: {e}")
+            self._report_error(module.name, f"Error generating model for {module.name}: {e}")
 
-    def _generate_repository_interface(self, module_dir, module_name, pascal_case, soft_delete):
+    def _generate_repository_interface(self, module_dir, module_name, pascal_case, soft_delete, pagination, search,
+                                       includes):
         """Generate the repository interface for the module"""
         try:
-            template = self.jinja_env.get_template('module/repository_interface.dart.jinja')
-            output = template.render(
+            output_path = os.path.join(module_dir, 'domain', 'repositories',
+                                       f'i_{self.case_converter.to_snake_case(module_name)}_repository.dart')
+            self.file_manager.render_template(
+                'module/repository_interface.dart.jinja',
+                output_path,
                 module_name=module_name,
                 snake_case=self.case_converter.to_snake_case(module_name),
                 pascal_case=pascal_case,
-                soft_delete=soft_delete
+                soft_delete=soft_delete,
+                pagination=pagination,
+                search=search,
+                includes=includes
             )
-
-            output_path = os.path.join(module_dir, 'domain', 'repositories',
-                                       f'i_{self.case_converter.to_snake_case(module_name)}_repository.dart')
-            with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-                f.write(output)
         except Exception as e:
-            print(f"Error generating repository interface for {module_name}: {e}")
+            self._report_error(module_name, f"Error generating repository interface for {module_name}: {e}")
 
-    def _generate_repository_implementation(self, module_dir, module_name, pascal_case, module_config):
+    def _generate_repository_implementation(self, module_dir, module, module_config, pagination, search, includes):
         """Generate the repository implementation for the module"""
         try:
-            relationships = self.get_module_relationships(module_name)
-            # Processar relacionamentos reversos com nomes únicos
-            processed_reverse = []
-            for rel in relationships['reverse']:
-                rel_copy = rel.copy()
-                rel_copy['pascal_name'] = self.case_converter.to_pascal_case(rel['reverse_name'])
-                rel_copy['camel_name'] = self.case_converter.to_camel_case(rel['reverse_name'])
-                processed_reverse.append(rel_copy)
-
-            adjusted_relationships = {
-                'direct': relationships['direct'],
-                'reverse': processed_reverse
-            }
+            relationships = module.relationship_views['repository']
 
             if self.use_sqlite:
-                from generators.sqlite_generator import SQLiteGenerator
-                sqlite_generator = SQLiteGenerator(self.app_dir, self.config)
-
                 output_dir = os.path.join(module_dir, 'data', 'repositories')
-                sqlite_generator.generate_repository_impl(module_config, output_dir, adjusted_relationships)
+                self._get_sqlite_generator().generate_repository_impl(module_config, output_dir, relationships,
+                                                                      pagination, search, includes)
             else:
-                template = self.jinja_env.get_template('module/repository_impl.dart.jinja')
-                output = template.render(
-                    module_name=module_name,
-                    pascal_case=pascal_case,
-                    persistence_type=module_config.get('persistence', {}).get('provider', 'sqlite'),
-                    soft_delete=module_config.get('soft_delete', False),
-                    relationships=adjusted_relationships
-                )
-
                 output_path = os.path.join(module_dir, 'data', 'repositories',
-                                           f'{self.case_converter.to_snake_case(module_name)}_repository_impl.dart')
-                with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-                    f.write(output)
+                                           f'{module.snake_name}_repository_impl.dart')
+                self.file_manager.render_template(
+                    'module/repository_impl.dart.jinja',
+                    output_path,
+                    module_name=module.name,
+                    pascal_case=module.pascal_name,
+                    persistence_type=module.get('persistence', {}).get('provider', 'sqlite'),
+                    soft_delete=module.soft_delete,
+                    relationships=relationships,
+                    pagination=pagination,
+                    search=search,
+                    includes=includes,
+                    isolate_threshold=module.isolate_threshold,
+                    cache=module.cache_options
+                )
         except Exception as e:
-            print(f"Error generating repository implementation for {module_name}: {e}")
+            self._report_error(module.name, f"Error generating repository implementation for {module.name}: {e}")
 
-    def _generate_usecases(self, module_dir, module_name, pascal_case, soft_delete):
+    def _generate_usecases(self, module_dir, module_name, pascal_case, soft_delete, pagination, search):
         """Generate the usecases for the module"""
         try:
-            usecases = ['create', 'delete', 'get_all', 'get_by_id', 'update']
+            usecases = ['create', 'delete', 'get_all', 'get_page', 'get_by_id', 'search', 'update']
 
             if soft_delete:
                 usecases = usecases + ['hard_delete', 'restore', 'get_all_with_deleted']
 
             for usecase in usecases:
-                template = self.jinja_env.get_template(f'module/usecases/{usecase}_usecase.dart.jinja')
-                output = template.render(
+                output_path = os.path.join(module_dir, 'domain', 'usecases',
+                                           f'{usecase}_{self.case_converter.to_snake_case(module_name)}_usecase.dart')
+                self.file_manager.render_template(
+                    f'module/usecases/{usecase}_usecase.dart.jinja',
+                    output_path,
                     module_name=module_name,
                     snake_name=self.case_converter.to_snake_case(module_name),
                     pascal_case=pascal_case,
-                    soft_delete=soft_delete
+                    soft_delete=soft_delete,
+                    pagination=pagination,
+                    search=search
                 )
-
-                output_path = os.path.join(module_dir, 'domain', 'usecases',
-                                           f'{usecase}_{self.case_converter.to_snake_case(module_name)}_usecase.dart')
-                with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-                    f.write(output)
         except Exception as e:
-            print(f"Error generating usecases for {module_name}: {e}")
+            self._report_error(module_name, f"Error generating usecases for {module_name}: {e}")
 
-    def _generate_controller(self, module_dir, module_name, pascal_case, soft_delete):
+    def _generate_controller(self, module_dir, module_name, pascal_case, soft_delete, pagination):
         """Generate the controller for the module"""
         try:
-            template = self.jinja_env.get_template('module/controller.dart.jinja')
-            output = template.render(
+            output_path = os.path.join(module_dir, 'presentation', 'controllers',
+                                       f'{self.case_converter.to_snake_case(module_name)}_controller.dart')
+            self.file_manager.render_template(
+                'module/controller.dart.jinja',
+                output_path,
                 module_name=module_name,
                 pascal_case=pascal_case,
                 snake_case=self.case_converter.to_snake_case(module_name),
-                soft_delete=soft_delete
+                soft_delete=soft_delete,
+                pagination=pagination
             )
-
-            output_path = os.path.join(module_dir, 'presentation', 'controllers',
-                                       f'{self.case_converter.to_snake_case(module_name)}_controller.dart')
-            with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-                f.write(output)
         except Exception as e:
-            print(f"Error generating controller for {module_name}: {e}")
+            self._report_error(module_name, f"Error generating controller for {module_name}: {e}")
 
-    def _generate_screens(self, module_dir, module_name, pascal_case, module_config):
+    def _generate_screens(self, module_dir, module):
         """Generate the screens for the module"""
         try:
-            has_export = (isinstance(module_config.get('export'), dict) and
-                          any(module_config['export'].get(fmt, False) for fmt in
-                              ['csv', 'xlsx', 'pdf'])) or module_config.get('export') is True
-
-            if has_export and self.use_sqlite:
-                from generators.sqlite_generator import SQLiteGenerator
-                sqlite_generator = SQLiteGenerator(self.app_dir, self.config)
-
-                screens_dir = os.path.join(module_dir, 'presentation', 'screens')
-                self._generate_standard_screens(module_dir, module_name, pascal_case, module_config)
-            else:
-                self._generate_standard_screens(module_dir, module_name, pascal_case, module_config)
+            self._generate_standard_screens(module_dir, module)
 
         except Exception as e:
-            print(f"Error generating screens for {module_name}: {e}")
-            self._generate_standard_screens(module_dir, module_name, pascal_case, module_config)
+            self._report_error(module.name, f"Error generating screens for {module.name}: {e}")
+            self._generate_standard_screens(module_dir, module)
 
-    def _generate_standard_screens(self, module_dir, module_name, pascal_case, module_config):
+    def _generate_standard_screens(self, module_dir, module):
         """Generate the standard screens for the module"""
+        module_name = module.name
+        pascal_case = module.pascal_name
         try:
             screens = [
                 ('list_screen.dart.jinja', 'list'),
@@ -430,52 +412,32 @@ class ModelGenerator:
                 ('form_screen.dart.jinja', 'form')
             ]
 
-            snake_case_name = self.case_converter.to_snake_case(module_name)
-            camel_name = self.case_converter.to_camel_case(module_name)
-
-            # Get relationships with adjusted names
-            relationships = self.get_module_relationships(module_name)
-            processed_reverse = []
-            for rel in relationships['reverse']:
-                rel_copy = rel.copy()
-                rel_copy['property_name'] = self.case_converter.to_pascal_case(rel['reverse_name'])
-                rel_copy['camel_property'] = self.case_converter.to_camel_case(rel['reverse_name'])
-                rel_copy['camel_name'] = self.case_converter.to_camel_case(rel['from_module'])
-                rel_copy['snake_name'] = self.case_converter.to_snake_case(rel['from_module'])
-                processed_reverse.append(rel_copy)
-
-            adjusted_relationships = {
-                'direct': relationships['direct'],
-                'reverse': processed_reverse
-            }
+            snake_case_name = module.snake_name
 
             for template_file, screen_type in screens:
                 try:
                     template_path = f'screens/{template_file}'
-                    template = self.jinja_env.get_template(template_path)
+                    output_path = os.path.join(module_dir, 'presentation', 'screens',
+                                               f'{snake_case_name}_{screen_type}_screen.dart')
 
-                    output = template.render(
+                    self.file_manager.render_template(
+                        template_path,
+                        output_path,
                         module_name=module_name,
                         pascal_case=pascal_case,
                         snake_case_name=snake_case_name,
                         entity_name=pascal_case,
-                        camel_name=camel_name,
-                        fields=module_config.get('fields', []),
-                        soft_delete=module_config.get('soft_delete', False),
-                        relationships=adjusted_relationships,
-                        has_relationships=len(relationships['direct']) > 0 or len(relationships['reverse']) > 0
+                        camel_name=module.camel_name,
+                        fields=module.fields,
+                        soft_delete=module.soft_delete,
+                        relationships=module.relationship_views['screen'],
+                        has_relationships=module.has_relationships
                     )
 
-                    output_path = os.path.join(module_dir, 'presentation', 'screens',
-                                               f'{snake_case_name}_{screen_type}_screen.dart')
-                    with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-                        f.write(output)
-
                     if screen_type == 'form':
                         create_path = os.path.join(module_dir, 'presentation', 'screens',
                                                    f'{snake_case_name}_create_screen.dart')
-                        with open(create_path, 'w', encoding='utf-8', newline='\n') as f:
-                            f.write(f"""import 'package:flutter/material.dart';
+                        self.file_manager.write_file(create_path, f"""import 'package:flutter/material.dart';
 import './{snake_case_name}_form_screen.dart';
 
 class {pascal_case}CreateScreen extends StatelessWidget {{
@@ -491,8 +453,7 @@ class {pascal_case}CreateScreen extends StatelessWidget {{
 
                         edit_path = os.path.join(module_dir, 'presentation', 'screens',
                                                  f'{snake_case_name}_edit_screen.dart')
-                        with open(edit_path, 'w', encoding='utf-8', newline='\n') as f:
-                            f.write(f"""import 'package:flutter/material.dart';
+                        self.file_manager.write_file(edit_path, f"""import 'package:flutter/material.dart';
 import '../../domain/entities/{snake_case_name}_entity.dart';
 import './{snake_case_name}_form_screen.dart';
 
@@ -511,99 +472,90 @@ class {pascal_case}EditScreen extends StatelessWidget {{
 }}""")
 
                 except jinja2_exceptions.TemplateNotFound:
-                    print(f"Warning: Template 'screens/{template_file}' not found, skipping")
+                    self._report_error(module_name, f"Warning: Template 'screens/{template_file}' not found, skipping")
                 except Exception as e:
-                    print(f"Error generating {screen_type} screen for {module_name}: {e}")
+                    self._report_error(module_name, f"Error generating {screen_type} screen for {module_name}: {e}")
 
         except Exception as e:
-            print(f"Error generating screens for {module_name}: {e}")
+            self._report_error(module_name, f"Error generating screens for {module_name}: {e}")
 
-    def _generate_relationship_helpers(self, module_dir, module_name, pascal_case, module_config, relationships):
+    def _generate_relationship_helpers(self, module_dir, module):
         """Gera arquivos auxiliares para gerenciar relacionamentos"""
         try:
-            snake_case = self.case_converter.to_snake_case(module_name)
-
             # Gerar service de relacionamentos
-            self._generate_relationship_service(module_dir, module_name, pascal_case, relationships)
+            self._generate_relationship_service(module_dir, module)
 
             # Gerar queries específicas de relacionamento para SQLite
             if self.use_sqlite:
-                self._generate_relationship_queries(module_dir, module_name, pascal_case, relationships)
+                self._generate_relationship_queries(module_dir, module)
 
         except Exception as e:
-            print(f"Error generating relationship helpers for {module_name}: {e}")
+            self._report_error(module.name, f"Error generating relationship helpers for {module.name}: {e}")
 
-    def _generate_relationship_service(self, module_dir, module_name, pascal_case, relationships):
+    def _generate_relationship_service(self, module_dir, module):
         """Gera service para operações com relacionamentos"""
         try:
-            template = self.jinja_env.get_template('module/relationship/relationship_service.dart.jinja')
-
-            # Processar relacionamentos reversos com nomes únicos
-            processed_reverse = []
-            for rel in relationships['reverse']:
-                rel_copy = rel.copy()
-                rel_copy['pascal_name'] = self.case_converter.to_pascal_case(rel['reverse_name'])
-                rel_copy['camel_name'] = self.case_converter.to_camel_case(rel['reverse_name'])
-                rel_copy['snake_name'] = self.case_converter.to_snake_case(rel['from_module'])
-                processed_reverse.append(rel_copy)
-
-            adjusted_relationships = {
-                'direct': relationships['direct'],
-                'reverse': processed_reverse
-            }
-
-            output = template.render(
-                snake_case=self.case_converter.to_snake_case(module_name),
-                module_name=module_name,
-                pascal_case=pascal_case,
-                snake_case_name=self.case_converter.to_snake_case(module_name),
-                relationships=adjusted_relationships
-            )
-
             service_dir = os.path.join(module_dir, 'data', 'services')
-            os.makedirs(service_dir, exist_ok=True)
-
-            output_path = os.path.join(service_dir,
-                                       f'{self.case_converter.to_snake_case(module_name)}_relationship_service.dart')
-            with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-                f.write(output)
+            output_path = os.path.join(service_dir, f'{module.snake_name}_relationship_service.dart')
+            self.file_manager.render_template(
+                'module/relationship/relationship_service.dart.jinja',
+                output_path,
+                snake_case=module.snake_name,
+                module_name=module.name,
+                pascal_case=module.pascal_name,
+                snake_case_name=module.snake_name,
+                relationships=module.relationship_views['service']
+            )
 
         except Exception as e:
-            print(f"Error generating relationship service for {module_name}: {e}")
+            self._report_error(module.name, f"Error generating relationship service for {module.name}: {e}")
 
-    def _generate_relationship_queries(self, module_dir, module_name, pascal_case, relationships):
+    def _generate_relationship_queries(self, module_dir, module):
         """Gera queries SQL específicas para relacionamentos"""
         try:
-            template = self.jinja_env.get_template('module/relationship/relationship_queries.dart.jinja')
-
-            # Processar relacionamentos reversos com nomes únicos
-            processed_reverse = []
-            for rel in relationships['reverse']:
-                rel_copy = rel.copy()
-                rel_copy['query_name'] = f"get{rel['reverse_name'].capitalize()}"
-                rel_copy['property_name'] = self.case_converter.to_pascal_case(rel['reverse_name'])
-                rel_copy['camel_name'] = self.case_converter.to_camel_case(rel['reverse_name'])
-                processed_reverse.append(rel_copy)
-
-            adjusted_relationships = {
-                'direct': relationships['direct'],
-                'reverse': processed_reverse
-            }
-
-            output = template.render(
-                module_name=module_name,
-                pascal_case=pascal_case,
-                snake_case_name=self.case_converter.to_snake_case(module_name),
-                relationships=adjusted_relationships
+            queries_dir = os.path.join(module_dir, 'data', 'queries')
+            output_path = os.path.join(queries_dir, f'{module.snake_name}_relationship_queries.dart')
+            self.file_manager.render_template(
+                'module/relationship/relationship_queries.dart.jinja',
+                output_path,
+                module_name=module.name,
+                pascal_case=module.pascal_name,
+                snake_case_name=module.snake_name,
+                relationships=module.relationship_views['queries']
             )
 
-            queries_dir = os.path.join(module_dir, 'data', 'queries')
-            os.makedirs(queries_dir, exist_ok=True)
+        except Exception as e:
+            self._report_error(module.name, f"Error generating relationship queries for {module.name}: {e}")
 
-            output_path = os.path.join(queries_dir,
-                                       f'{self.case_converter.to_snake_case(module_name)}_relationship_queries.dart')
-            with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-                f.write(output)
 
-        except Exception as e:
-            print(f"Error generating relationship queries for {module_name}: {e}")
\ No newline at end of file
+# Gerador usado por cada worker do pool (um por processo)
+_worker_generator = None
+
+
+def _pool_context():
+    """
+    Start method of the module pool: forkserver where available, spawn otherwise.
+
+    The pool is created from a TaskScheduler worker thread while other tasks
+    run (`flutter pub get`, console output); a plain fork could copy a lock
+    held by one of those threads into a worker, which would then hang.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+
+def _init_module_worker(app_dir, config, use_manifest=False, buffered=False):
+    """Create the ModelGenerator used by a pool worker"""
+    global _worker_generator
+    if multiprocessing.parent_process() is not None:
+        detach_output()
+    manifest = Manifest(app_dir) if use_manifest else None
+    _worker_generator = ModelGenerator(app_dir, config, FileManager(manifest, buffered=buffered))
+
+
+def _generate_module_in_worker(module_config):
+    """Generate one module inside a pool worker and return its error report and file state"""
+    module_name = module_config.get('name', 'Unknown')
+    _worker_generator.generate_module(module_config)
+    return (module_name, _worker_generator.errors.get(module_name, []),
+            _worker_generator.file_manager.drain_state())
@@ -0,0 +1,199 @@
+"""
+Module dependency graph for Flutter App Creator.
+
+A module depends on every module its reference fields point to. The graph is
+built once per configuration and everything is computed iteratively (no
+recursion limit on long reference chains):
+
+- strongly connected components (Tarjan), so circular references are found
+  as a whole and reported with an exact cycle path;
+- a deterministic cycle break: inside a component, modules keep their config
+  order and the edges pointing forward in that order are ignored;
+- topological levels (level 0 has no dependencies, level N only depends on
+  lower levels), which a parallel scheduler can use directly, and the flat
+  dependency order (levels in sequence, config order inside each level).
+"""
+
+
+class ModuleGraph:
+    """
+    Dependency graph of the configured modules.
+
+    Args:
+        module_configs (list): Module configurations (as in the YAML file).
+    """
+
+    def __init__(self, module_configs):
+        self.modules = []
+        self.position = {}
+        for module in module_configs:
+            name = module.get('name')
+            if name and name not in self.position:
+                self.position[name] = len(self.modules)
+                self.modules.append(name)
+
+        # Dependências (únicas, na ordem dos campos) e dependentes (módulo, campo), na ordem da configuração
+        self.dependencies = {name: [] for name in self.modules}
+        self.dependents = {name: [] for name in self.modules}
+        # Referências para módulos que não estão na configuração: (módulo, campo, referência)
+        self.missing = []
+
+        for module in module_configs:
+            name = module.get('name')
+            if name not in self.position:
+                continue
+            dependencies = self.dependencies[name]
+            for field in module.get('fields', []):
+                if field.get('type') != 'reference' or not field.get('reference'):
+                    continue
+                target = field['reference']
+                if target not in self.position:
+                    self.missing.append((name, field.get('name'), target))
+                    continue
+                if target not in dependencies:
+                    dependencies.append(target)
+                self.dependents[target].append((name, field))
+
+        self.components = self._strongly_connected_components()
+        self.component_of = {name: index for index, component in enumerate(self.components) for name in component}
+        self.cycles = [self._find_cycle(component) for component in self.components if self._is_cyclic(component)]
+        self.broken_edges = self._broken_edges()
+        self.levels = self._levels()
+        self.level_of = {name: level for level, names in enumerate(self.levels) for name in names}
+        self.order = [name for names in self.levels for name in names]
+
+    def __repr__(self):
+        return f"ModuleGraph({len(self.modules)} modules, {len(self.levels)} levels, {len(self.cycles)} cycles)"
+
+    def _strongly_connected_components(self):
+        """
+        Tarjan's algorithm with an explicit stack.
+
+        Components come out dependencies first; members are sorted by config order.
+        """
+        # Módulos como inteiros (posição na configuração): listas em vez de dicionários no laço
+        adjacency = [[self.position[dependency] for dependency in self.dependencies[name]] for name in self.modules]
+        count = len(adjacency)
+        index_of = [-1] * count
+        lowlink = [0] * count
+        on_stack = [False] * count
+        stack = []
+        components = []
+        counter = 0
+
+        for root in range(count):
+            if index_of[root] != -1:
+                continue
+
+            # Pilha de trabalho: (módulo, posição da próxima dependência a visitar)
+            work = [(root, 0)]
+            index_of[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+
+            while work:
+                node, next_edge = work[-1]
+                dependencies = adjacency[node]
+
+                if next_edge < len(dependencies):
+                    work[-1] = (node, next_edge + 1)
+                    dependency = dependencies[next_edge]
+                    if index_of[dependency] == -1:
+                        index_of[dependency] = lowlink[dependency] = counter
+                        counter += 1
+                        stack.append(dependency)
+                        on_stack[dependency] = True
+                        work.append((dependency, 0))
+                    elif on_stack[dependency] and index_of[dependency] < lowlink[node]:
+                        lowlink[node] = index_of[dependency]
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if lowlink[node] < lowlink[parent]:
+                        lowlink[parent] = lowlink[node]
+
+                if lowlink[node] == index_of[node]:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    component = [member]
+                    while member != node:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                    if len(component) > 1:
+                        component.sort()
+                    components.append([self.modules[member] for member in component])
+
+        return components
+
+    def _is_cyclic(self, component):
+        return len(component) > 1 or component[0] in self.dependencies[component[0]]
+
+    def _find_cycle(self, component):
+        """
+        One exact cycle of a component, closed on its first module (A → B → A).
+
+        Breadth-first search from the first module (in config order) back to
+        itself, restricted to the component, so the shortest cycle is reported.
+        """
+        start = component[0]
+        members = set(component)
+        previous = {}
+        queue = [start]
+
+        for node in queue:
+            for dependency in self.dependencies[node]:
+                if dependency not in members:
+                    continue
+                if dependency == start:
+                    path = [node]
+                    while path[-1] != start:
+                        path.append(previous[path[-1]])
+                    return [start] + path[::-1][1:] + [start] if len(path) > 1 else [start, start]
+                if dependency not in previous:
+                    previous[dependency] = node
+                    queue.append(dependency)
+
+        return [start, start]
+
+    def _broken_edges(self):
+        """Edges ignored to break the cycles: (module, dependency) where the dependency comes later in config order"""
+        broken = []
+        for component in self.components:
+            if not self._is_cyclic(component):
+                continue
+            for name in component:
+                for dependency in self.dependencies[name]:
+                    if self.component_of[dependency] == self.component_of[name] and \
+                            self.position[dependency] >= self.position[name]:
+                        broken.append((name, dependency))
+        return broken
+
+    def _levels(self):
+        """Topological levels of the components (a component's modules share its level)"""
+        component_of = self.component_of
+        level_of_component = []
+        for index, component in enumerate(self.components):
+            level = 0
+            for name in component:
+                for dependency in self.dependencies[name]:
+                    dependency_component = component_of[dependency]
+                    # Tarjan emite as dependências antes: o nível delas já é conhecido
+                    if dependency_component != index and level_of_component[dependency_component] >= level:
+                        level = level_of_component[dependency_component] + 1
+            level_of_component.append(level)
+
+        levels = [[] for _ in range(max(level_of_component, default=-1) + 1)]
+        for index, component in enumerate(self.components):
+            levels[level_of_component[index]].extend(component)
+        for names in levels:
+            if len(names) > 1:
+                names.sort(key=self.position.__getitem__)
+        return levels
+
+    def format_cycle(self, cycle):
+        """Cycle as printed in warnings (A → B → A)"""
+        return ' → '.join(cycle)
@@ -1,30 +1,37 @@
 import os
 import yaml
-from jinja2 import Environment, FileSystemLoader
+from collections.abc import Mapping
 from utils.case_converter import CaseConverter
+from utils.file_manager import FileManager
+from utils.template_registry import get_jinja_env
+from generators.config_compiler import compile_config
 
 
 class SQLiteGenerator:
-    def __init__(self, app_dir, config):
+    def __init__(self, app_dir, config, file_manager=None):
         self.app_dir = app_dir
         self.config = config
+        self.ir = compile_config(config)
         self.case_converter = CaseConverter()
+        self.file_manager = file_manager or FileManager()
+        self._table_indexes = None
+        self._search_indexes = None
+        self._schema = None
 
-        # Set up Jinja2 environment
-        template_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'templates')
-        self.jinja_env = Environment(loader=FileSystemLoader(template_dir))
+        # Shared Jinja2 environment (templates are compiled once per process)
+        self.jinja_env = get_jinja_env()
 
     def generate(self):
         """Generate SQLite infrastructure for the Flutter app"""
         # Verify that SQLite is the persistence provider
-        if self.config.get('persistence', {}).get('provider') != 'sqlite':
+        if not self.ir.use_sqlite:
             return
 
         print("🧩 Generating SQLite infrastructure...")
 
         # Create directories for SQLite files
         core_datasources_dir = os.path.join(self.app_dir, 'lib', 'core', 'data', 'datasources')
-        os.makedirs(core_datasources_dir, exist_ok=True)
+        self.file_manager.create_directory(core_datasources_dir)
 
         # Generate core SQLite services
         self._generate_sqlite_service(core_datasources_dir)
@@ -40,72 +47,102 @@ class SQLiteGenerator:
         if self._has_export_enabled():
             self._generate_export_service(core_datasources_dir)
 
+        # Generate entity cache if any module has a `cache:` block
+        if self._has_cache_enabled():
+            self._generate_entity_cache(core_datasources_dir)
+
         # Generate SQL migration file
         self._generate_sqlite_migrations()
 
     def _generate_sqlite_service(self, output_dir):
         """Generate SQLite service class"""
         try:
-            template = self.jinja_env.get_template('core/data/datasources/sqlite_service.dart.jinja')
-            output = template.render(
-                app_name=self.config['app']['name'],
-                modules=self.config.get('modules', [])
-            )
+            from generators.sqlite_schema_generator import generate_junction_indexes
 
+            snapshot = self._get_schema()['snapshot']
             output_path = os.path.join(output_dir, 'sqlite_service.dart')
-            with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-                f.write(output)
+            self.file_manager.render_template(
+                'core/data/datasources/sqlite_service.dart.jinja',
+                output_path,
+                app_name=self.ir.app_name,
+                modules=self.ir.modules,
+                create_tables={module.name: snapshot['tables'][module.table]['create'] for module in self.ir.modules},
+                junction_tables=list(snapshot['junction_tables'].values()),
+                junction_indexes=generate_junction_indexes(self.ir.modules),
+                table_indexes=self._get_table_indexes(),
+                search_indexes=self._get_search_indexes()
+            )
         except Exception as e:
             print(f"Error generating SQLite service: {e}")
 
+    def _get_schema(self):
+        """Versioned schema of the configuration (see sqlite_schema_compiler.compile_schema)"""
+        if self._schema is None:
+            from generators.sqlite_schema_compiler import compile_schema
+
+            self._schema = compile_schema(self.app_dir, self.ir.modules, self.file_manager)
+        return self._schema
+
+    def _get_table_indexes(self):
+        """CREATE INDEX statements of every module table, by module name"""
+        if self._table_indexes is None:
+            from generators.sqlite_schema_generator import generate_indexes
+
+            self._table_indexes = {module.name: generate_indexes(module) for module in self.ir.modules}
+        return self._table_indexes
+
+    def _get_search_indexes(self):
+        """FTS5 statements of every module with a `search:` block, by module name"""
+        if self._search_indexes is None:
+            from generators.sqlite_schema_generator import generate_search_index_statements
+
+            self._search_indexes = {}
+            for module in self.ir.modules:
+                statements = generate_search_index_statements(module, module.search_options)
+                if statements:
+                    self._search_indexes[module.name] = statements
+        return self._search_indexes
+
     def _generate_sqlite_helper(self, output_dir):
         """Generate SQLite helper class"""
         try:
-            template = self.jinja_env.get_template('core/data/datasources/sqlite_helper.dart.jinja')
-            output = template.render()
-
             output_path = os.path.join(output_dir, 'sqlite_helper.dart')
-            with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-                f.write(output)
+            self.file_manager.render_template('core/data/datasources/sqlite_helper.dart.jinja', output_path)
         except Exception as e:
             print(f"Error generating SQLite helper: {e}")
 
     def _generate_sqlite_relationship_helper(self, output_dir):
         """Generate SQLite relationship helper class"""
         try:
-            template = self.jinja_env.get_template('core/data/datasources/sqlite_relationship_helper.dart.jinja')
-            output = template.render()
-
             output_path = os.path.join(output_dir, 'sqlite_relationship_helper.dart')
-            with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-                f.write(output)
+            self.file_manager.render_template('core/data/datasources/sqlite_relationship_helper.dart.jinja', output_path)
         except Exception as e:
             print(f"Error generating SQLite relationship helper: {e}")
 
     def _generate_sqlite_schema(self, output_dir):
         """Generate SQLite schema utility class"""
         try:
-            template = self.jinja_env.get_template('core/data/datasources/sqlite_schema.dart.jinja')
-            output = template.render()
-
             output_path = os.path.join(output_dir, 'sqlite_schema.dart')
-            with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-                f.write(output)
+            self.file_manager.render_template(
+                'core/data/datasources/sqlite_schema.dart.jinja',
+                output_path,
+                table_indexes={self.ir.module(module_name).table: statements
+                               for module_name, statements in self._get_table_indexes().items() if statements}
+            )
         except Exception as e:
             print(f"Error generating SQLite schema utility: {e}")
 
     def _generate_sqlite_migration_manager(self, output_dir):
         """Generate SQLite migration manager class"""
         try:
-            template = self.jinja_env.get_template('core/data/datasources/sqlite_migration_manager.dart.jinja')
-            output = template.render(
-                app_name=self.config['app']['name'],
-                modules=self.config.get('modules', [])
-            )
-
             output_path = os.path.join(output_dir, 'sqlite_migration_manager.dart')
-            with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-                f.write(output)
+            self.file_manager.render_template(
+                'core/data/datasources/sqlite_migration_manager.dart.jinja',
+                output_path,
+                app_name=self.ir.app_name,
+                modules=self.ir.modules,
+                schema=self._get_schema()
+            )
         except Exception as e:
             print(f"Error generating SQLite migration manager: {e}")
 
@@ -113,29 +150,23 @@ class SQLiteGenerator:
         """Generate database initializer class"""
         try:
             output_dir = os.path.join(self.app_dir, 'lib', 'app')
-            os.makedirs(output_dir, exist_ok=True)
-
-            template = self.jinja_env.get_template('app/database_initializer.dart.jinja')
-            output = template.render(
-                app_name=self.config['app']['name'],
-                modules=self.config.get('modules', [])
-            )
+            self.file_manager.create_directory(output_dir)
 
             output_path = os.path.join(output_dir, 'database_initializer.dart')
-            with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-                f.write(output)
+            self.file_manager.render_template(
+                'app/database_initializer.dart.jinja',
+                output_path,
+                app_name=self.ir.app_name,
+                modules=self.ir.modules
+            )
         except Exception as e:
             print(f"Error generating database initializer: {e}")
 
     def _generate_export_service(self, output_dir):
         """Generate export service class for data export functionality"""
         try:
-            template = self.jinja_env.get_template('core/data/datasources/export_service.dart.jinja')
-            output = template.render()
-
             output_path = os.path.join(output_dir, 'export_service.dart')
-            with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-                f.write(output)
+            self.file_manager.render_template('core/data/datasources/export_service.dart.jinja', output_path)
         except Exception as e:
             print(f"Error generating export service: {e}")
 
@@ -143,76 +174,105 @@ class SQLiteGenerator:
         """Generate SQLite migrations file"""
         try:
             output_dir = os.path.join(self.app_dir, 'assets', 'db')
-            os.makedirs(output_dir, exist_ok=True)
+            self.file_manager.create_directory(output_dir)
 
             # Import the SQLite schema generator
-            from generators.sqlite_schema_generator import generate_create_table_statement, generate_indexes, \
-                generate_junction_tables
+            from generators.sqlite_schema_generator import generate_create_table_statement, generate_junction_tables, \
+                generate_junction_indexes, print_index_report
 
-            modules = self.config.get('modules', [])
+            modules = self.ir.modules
 
             # Generate table creation statements
             create_tables = []
             create_indexes = []
+            search_indexes = []
 
             for module in modules:
                 create_tables.append(generate_create_table_statement(module))
-                create_indexes.extend(generate_indexes(module))
+                create_indexes.extend(self._get_table_indexes().get(module.name, []))
+                search_indexes.extend(self._get_search_indexes().get(module.name, []))
 
             # Generate junction tables for many-to-many relationships
             junction_tables = generate_junction_tables(modules)
+            create_indexes.extend(generate_junction_indexes(modules))
+
+            # Build the migration file
+            sql = "-- Table creation\n"
+            for statement in create_tables:
+                sql += f"{statement}\n\n"
+
+            # Junction tables
+            if junction_tables:
+                sql += "-- Junction tables for many-to-many relationships\n"
+                for statement in junction_tables:
+                    sql += f"{statement}\n\n"
+
+            # Index creation statements
+            if create_indexes:
+                sql += "-- Index creation\n"
+                for statement in create_indexes:
+                    sql += f"{statement}\n\n"
+
+            # Full-text search indexes
+            if search_indexes:
+                sql += "-- Full-text search (FTS5)\n"
+                for statement in search_indexes:
+                    sql += f"{statement}\n\n"
 
-            # Write to migration file
             output_path = os.path.join(output_dir, 'sqlite_migrations.sql')
-            with open(output_path, 'w', encoding='utf-8', newline='\n') as file:
-                # Write table creation statements
-                file.write("-- Table creation\n")
-                for statement in create_tables:
-                    file.write(f"{statement}\n\n")
-
-                # Write junction tables
-                if junction_tables:
-                    file.write("-- Junction tables for many-to-many relationships\n")
-                    for statement in junction_tables:
-                        file.write(f"{statement}\n\n")
-
-                # Write index creation statements
-                if create_indexes:
-                    file.write("-- Index creation\n")
-                    for statement in create_indexes:
-                        file.write(f"{statement}\n\n")
+            self.file_manager.write_file(output_path, sql)
+
+            print_index_report(modules)
         except Exception as e:
             print(f"Error generating SQLite migrations file: {e}")
 
+    def _generate_entity_cache(self, output_dir):
+        """Generate the LRU entity cache used by repositories of modules with `cache:`"""
+        try:
+            output_path = os.path.join(output_dir, 'entity_cache.dart')
+            self.file_manager.render_template('core/data/datasources/entity_cache.dart.jinja', output_path)
+        except Exception as e:
+            print(f"Error generating entity cache: {e}")
+
+    def _has_cache_enabled(self):
+        """Check if any module has the entity cache enabled"""
+        return any(module.cache_options for module in self.ir.modules)
+
     def _has_export_enabled(self):
         """Check if any module has export functionality enabled"""
-        for module in self.config.get('modules', []):
-            if isinstance(module.get('export'), dict) and any(
-                    module['export'].get(fmt, False) for fmt in ['csv', 'xlsx', 'pdf']):
-                return True
-            if module.get('export') is True:
-                return True
-        return False
-
-    def generate_repository_impl(self, module_config, output_dir, relationships):
-        """Generate repository implementation with SQLite support for a module"""
+        return any(self._has_module_export_enabled(module) for module in self.ir.modules)
+
+    def generate_repository_impl(self, module_config, output_dir, relationships, pagination=None, search=None,
+                                 includes=None):
+        """
+        Generate repository implementation with SQLite support for a module.
+
+        `pagination` and `search` are the module options already read by the
+        caller; both come from the compiled module when `pagination` is None.
+        `includes` are the relationships `getAll(include: [...])` can load in
+        batch (see ModelGenerator.get_module_includes).
+        """
         try:
-            module_name = module_config['name']
-            pascal_case = self.case_converter.to_pascal_case(module_name)
-            snake_case = self.case_converter.to_snake_case(module_name)
-
-            template = self.jinja_env.get_template('module/repository_impl.dart.jinja')
-            output = template.render(
-                module_name=snake_case,
-                pascal_case=pascal_case,
-                fields=module_config.get('fields', []),
-                soft_delete=module_config.get('soft_delete', False),
-                relationships=relationships
+            module = self.ir.module_for(module_config)
+            if pagination is None:
+                pagination = module.pagination_options
+                search = module.search_options
+
+            output_path = os.path.join(output_dir, f'{module.snake_name}_repository_impl.dart')
+            self.file_manager.render_template(
+                'module/repository_impl.dart.jinja',
+                output_path,
+                module_name=module.snake_name,
+                pascal_case=module.pascal_name,
+                fields=module.fields,
+                soft_delete=module.soft_delete,
+                relationships=relationships,
+                pagination=pagination,
+                search=search,
+                includes=includes or [],
+                isolate_threshold=module.isolate_threshold,
+                cache=module.cache_options
             )
-
-            output_path = os.path.join(output_dir, f'{snake_case}_repository_impl.dart')
-            with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-                f.write(output)
         except Exception as e:
             print(f"Error generating SQLite repository implementation for {module_config.get('name', 'unknown')}: {e}")
 
@@ -230,17 +290,15 @@ class SQLiteGenerator:
             self._ensure_form_and_detail_screens(module_config, output_dir)
 
             # Passo 2: Agora gere a tela de listagem com exportação
-            template = self.jinja_env.get_template('screens/list_screen_with_export.dart.jinja')
-            output = template.render(
+            output_path = os.path.join(output_dir, f'{snake_case}_list_screen.dart')
+            self.file_manager.render_template(
+                'screens/list_screen_with_export.dart.jinja',
+                output_path,
                 entity_name=pascal_case,
                 snake_case_name=snake_case,
                 fields=module_config.get('fields', []),
                 export=module_config.get('export', {})
             )
-
-            output_path = os.path.join(output_dir, f'{snake_case}_list_screen.dart')
-            with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-                f.write(output)
             return True
         except Exception as e:
             print(f"Error generating list screen with export for {module_config.get('name', 'unknown')}: {e}")
@@ -256,8 +314,9 @@ class SQLiteGenerator:
         detail_screen_path = os.path.join(output_dir, f'{snake_case}_detail_screen.dart')
         if not os.path.exists(detail_screen_path):
             try:
-                template = self.jinja_env.get_template('screens/detail_screen.dart.jinja')
-                output = template.render(
+                self.file_manager.render_template(
+                    'screens/detail_screen.dart.jinja',
+                    detail_screen_path,
                     module_name=module_name,
                     pascal_case=pascal_case,
                     snake_case_name=snake_case,
@@ -265,9 +324,6 @@ class SQLiteGenerator:
                     fields=module_config.get('fields', []),
                     soft_delete=module_config.get('soft_delete', False)
                 )
-
-                with open(detail_screen_path, 'w', encoding='utf-8', newline='\n') as f:
-                    f.write(output)
             except Exception as e:
                 print(f"Error generating detail screen stub: {e}")
 
@@ -275,8 +331,9 @@ class SQLiteGenerator:
         form_screen_path = os.path.join(output_dir, f'{snake_case}_form_screen.dart')
         if not os.path.exists(form_screen_path):
             try:
-                template = self.jinja_env.get_template('screens/form_screen.dart.jinja')
-                output = template.render(
+                self.file_manager.render_template(
+                    'screens/form_screen.dart.jinja',
+                    form_screen_path,
                     module_name=module_name,
                     pascal_case=pascal_case,
                     snake_case_name=snake_case,
@@ -284,15 +341,12 @@ class SQLiteGenerator:
                     fields=module_config.get('fields', []),
                     soft_delete=module_config.get('soft_delete', False)
                 )
-
-                with open(form_screen_path, 'w', encoding='utf-8', newline='\n') as f:
-                    f.write(output)
             except Exception as e:
                 print(f"Error generating form screen stub: {e}")
 
     def _has_module_export_enabled(self, module_config):
         """Check if a specific module has export functionality enabled"""
-        if isinstance(module_config.get('export'), dict):
+        if isinstance(module_config.get('export'), Mapping):
             return any(module_config['export'].get(fmt, False) for fmt in ['csv', 'xlsx', 'pdf'])
         return module_config.get('export') is True
 
@@ -301,7 +355,7 @@ class SQLiteGenerator:
         try:
             # Create test directories
             test_core_dir = os.path.join(self.app_dir, 'test', 'core', 'data', 'datasources')
-            os.makedirs(test_core_dir, exist_ok=True)
+            self.file_manager.create_directory(test_core_dir)
 
             # Generate SQLite service test
             self._generate_sqlite_service_test(test_core_dir)
@@ -310,18 +364,16 @@ class SQLiteGenerator:
             self._generate_sqlite_helper_test(test_core_dir)
 
             # Generate repository tests for each module
-            for module in self.config.get('modules', []):
-                module_name = module['name']
-                snake_case = self.case_converter.to_snake_case(module_name)
+            for module in self.ir.modules:
                 module_test_dir = os.path.join(
                     self.app_dir,
                     'test',
                     'features',
-                    snake_case,
+                    module.snake_name,
                     'data',
                     'repositories'
                 )
-                os.makedirs(module_test_dir, exist_ok=True)
+                self.file_manager.create_directory(module_test_dir)
 
                 self._generate_repository_test(module_test_dir, module)
         except Exception as e:
@@ -330,47 +382,35 @@ class SQLiteGenerator:
     def _generate_sqlite_service_test(self, output_dir):
         """Generate test for SQLite service"""
         try:
-            template = self.jinja_env.get_template('test/core/data/datasources/sqlite_service_test.dart.jinja')
-            output = template.render(
-                app_name=self.config['app']['name'],
-            )
-
             output_path = os.path.join(output_dir, 'sqlite_service_test.dart')
-            with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-                f.write(output)
+            self.file_manager.render_template(
+                'test/core/data/datasources/sqlite_service_test.dart.jinja',
+                output_path,
+                app_name=self.ir.app_name,
+            )
         except Exception as e:
             print(f"Error generating SQLite service test: {e}")
 
     def _generate_sqlite_helper_test(self, output_dir):
         """Generate test for SQLite helper"""
         try:
-            template = self.jinja_env.get_template('test/core/data/datasources/sqlite_helper_test.dart.jinja')
-            output = template.render()
-
             output_path = os.path.join(output_dir, 'sqlite_helper_test.dart')
-            with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-                f.write(output)
+            self.file_manager.render_template('test/core/data/datasources/sqlite_helper_test.dart.jinja', output_path)
         except Exception as e:
             print(f"Error generating SQLite helper test: {e}")
 
-    def _generate_repository_test(self, output_dir, module_config):
-        """Generate test for repository implementation"""
+    def _generate_repository_test(self, output_dir, module):
+        """Generate test for repository implementation (`module` is a compiled ModuleIR)"""
         try:
-            module_name = module_config['name']
-            pascal_case = self.case_converter.to_pascal_case(module_name)
-            snake_case = self.case_converter.to_snake_case(module_name)
-
             # Corrigido: Usando o caminho sem [module_name]
-            template = self.jinja_env.get_template('test/features/repository_impl_test.dart.jinja')
-            output = template.render(
-                module_name=snake_case,
-                pascal_case=pascal_case,
-                fields=module_config.get('fields', []),
-                soft_delete=module_config.get('soft_delete', False)
+            output_path = os.path.join(output_dir, f'{module.snake_name}_repository_impl_test.dart')
+            self.file_manager.render_template(
+                'test/features/repository_impl_test.dart.jinja',
+                output_path,
+                module_name=module.snake_name,
+                pascal_case=module.pascal_name,
+                fields=module.fields,
+                soft_delete=module.soft_delete
             )
-
-            output_path = os.path.join(output_dir, f'{snake_case}_repository_impl_test.dart')
-            with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-                f.write(output)
         except Exception as e:
-            print(f"Error generating repository test for {module_config.get('name', 'unknown')}: {e}")
\ No newline at end of file
+            print(f"Error generating repository test for {module.name}: {e}")
\ No newline at end of file
@@ -0,0 +1,310 @@
+"""
+Versioned SQLite schema for Flutter App Creator.
+
+Every generation compiles the configuration into a schema snapshot: tables,
+columns, indexes, junction tables and FTS5 indexes, all built by the
+functions of sqlite_schema_generator (the same statements the SQL file and
+SQLiteService use). The snapshot is compared with the last one recorded in
+`<app>/.fac/schema_vN.json`. When they differ, version N+1 is recorded with
+the statements that upgrade a database of version N (ALTER TABLE ADD COLUMN,
+CREATE TABLE, CREATE/DROP INDEX, FTS5 re-creations), and SQLiteMigrationManager
+runs them from onUpgrade instead of recreating the database.
+"""
+
+import os
+import re
+import json
+from datetime import datetime
+
+from generators.sqlite_schema_generator import (
+    generate_column_type, generate_create_table_statement, generate_junction_tables, generate_junction_indexes,
+    generate_search_index_statements, get_column_name, derive_indexes, index_statement
+)
+from utils.module_options import get_search_options
+
+SCHEMA_DIR = '.fac'
+SCHEMA_FILE_PATTERN = re.compile(r'^schema_v(\d+)\.json$')
+
+# Bump when the snapshot layout changes
+SCHEMA_FORMAT = 1
+
+# Value given to existing rows when a required column is added
+_ZERO_VALUES = {'TEXT': "''", 'INTEGER': '0', 'REAL': '0'}
+
+# Value given to existing rows when a column is added, by Dart type: the generated
+# fromJson casts these types as non-nullable (`json['name'] as String`), so the rows
+# that existed before the migration cannot be left with NULL
+_FIELD_DEFAULTS = {
+    'String': "''",
+    'int': '0',
+    'double': '0.0',
+    'bool': '0',
+    'DateTime': "'1970-01-01T00:00:00.000'",
+}
+
+
+def schema_file_name(version):
+    """File name of a recorded schema version"""
+    return f"schema_v{version}.json"
+
+
+def _column(field):
+    """Snapshot entry of a field column"""
+    return {'type': generate_column_type(field), 'not_null': bool(field.get('required', False))}
+
+
+def build_schema(modules):
+    """
+    Compile the module configurations into a schema snapshot.
+
+    Args:
+        modules (list): Module configurations.
+
+    Returns:
+        dict: tables (create statement and columns), indexes (name -> statement),
+              junction_tables (name -> statement) and search (FTS table -> statements).
+    """
+    tables = {}
+    indexes = {}
+    search = {}
+
+    for module in modules:
+        if 'name' not in module:
+            continue
+        table = module['name'].lower()
+
+        columns = {'id': {'type': 'TEXT', 'not_null': True}}
+        for field in module.get('fields', []):
+            if 'name' in field:
+                columns[get_column_name(field)] = _column(field)
+        columns['createdAt'] = {'type': 'TEXT', 'not_null': True}
+        columns['updatedAt'] = {'type': 'TEXT', 'not_null': True}
+        if module.get('soft_delete', False):
+            columns['deletedAt'] = {'type': 'TEXT', 'not_null': False}
+
+        tables[table] = {
+            'create': generate_create_table_statement(module),
+            'columns': columns,
+        }
+
+        for index in derive_indexes(module):
+            indexes[index['name']] = index_statement(index)
+
+        search_options = get_search_options(module)
+        if search_options:
+            search[search_options['fts_table']] = generate_search_index_statements(module, search_options)
+
+    for statement in generate_junction_indexes(modules):
+        indexes[statement.split()[2]] = statement
+
+    junction_tables = {statement.split()[2]: statement for statement in generate_junction_tables(modules)}
+
+    return {
+        'tables': tables,
+        'indexes': indexes,
+        'junction_tables': junction_tables,
+        'search': search,
+    }
+
+
+def column_defaults(modules):
+    """
+    Default of the field columns read as non-nullable by the generated models.
+
+    Args:
+        modules (list): Module configurations.
+
+    Returns:
+        dict: (table, column) -> SQL literal. Nullable types, lists and
+              references are read with a null check and have no entry.
+    """
+    defaults = {}
+    for module in modules:
+        if 'name' not in module:
+            continue
+        table = module['name'].lower()
+        for field in module.get('fields', []):
+            default = _FIELD_DEFAULTS.get(field.get('type', 'String'))
+            if 'name' in field and default is not None:
+                defaults[(table, get_column_name(field))] = default
+    return defaults
+
+
+def diff_schema(old, new, defaults=None):
+    """
+    Statements that upgrade a database with schema `old` to schema `new`.
+
+    SQLite can only add columns to an existing table, so removed columns and
+    columns whose type changed are reported and left as they are (rebuilding
+    the table is a manual migration); removed tables are kept for the same
+    reason, their data is never dropped. Added columns get a DEFAULT (see
+    column_defaults), so existing rows can still be read by the new models.
+
+    Args:
+        old (dict): Schema of the database (see build_schema).
+        new (dict): Schema of the configuration.
+        defaults (dict, optional): (table, column) -> SQL literal, see column_defaults.
+
+    Returns:
+        tuple: (statements, search_statements, warnings). search_statements
+               create the FTS5 indexes, which may be unavailable on a platform.
+    """
+    defaults = defaults or {}
+    statements = []
+    search_statements = []
+    warnings = []
+
+    # Índices removidos ou alterados saem antes das mudanças nas tabelas
+    for name, statement in old['indexes'].items():
+        if new['indexes'].get(name) != statement:
+            statements.append(f"DROP INDEX IF EXISTS {name};")
+
+    for table, definition in new['tables'].items():
+        previous = old['tables'].get(table)
+        if previous is None:
+            statements.append(definition['create'])
+            continue
+
+        for column, spec in definition['columns'].items():
+            old_spec = previous['columns'].get(column)
+            if old_spec is None:
+                statement = f"ALTER TABLE {table} ADD COLUMN {column} {spec['type']}"
+                default = defaults.get((table, column))
+                if spec['not_null']:
+                    # SQLite needs a default to add a NOT NULL column to existing rows
+                    default = default or _ZERO_VALUES.get(spec['type'], "''")
+                    statement += f" NOT NULL DEFAULT {default}"
+                    warnings.append(f"{table}.{column} is required; existing rows get {default}")
+                elif default is not None:
+                    # Opcional na configuração, mas lido sem checagem de nulo pelo fromJson
+                    statement += f" DEFAULT {default}"
+                    warnings.append(f"{table}.{column} is added; existing rows get {default}")
+                elif column == 'deletedAt':
+                    statement += " DEFAULT NULL"
+                statements.append(statement + ';')
+            elif old_spec != spec:
+                warnings.append(f"{table}.{column} changed from {old_spec} to {spec}; "
+                                f"SQLite cannot alter columns, the table needs a manual migration")
+
+        for column in previous['columns']:
+            if column not in definition['columns']:
+                warnings.append(f"{table}.{column} was removed from the configuration; the column is kept")
+
+    for table in old['tables']:
+        if table not in new['tables']:
+            warnings.append(f"table {table} was removed from the configuration; the table is kept")
+
+    for name, statement in new['junction_tables'].items():
+        if name not in old['junction_tables']:
+            statements.append(statement)
+
+    for name, statement in new['indexes'].items():
+        if old['indexes'].get(name) != statement:
+            statements.append(statement)
+
+    # FTS5: índices alterados são recriados (o último comando os preenche a partir da tabela)
+    for fts_table, old_statements in old['search'].items():
+        if new['search'].get(fts_table) != old_statements:
+            search_statements.extend(_drop_search_index(fts_table))
+
+    for fts_table, fts_statements in new['search'].items():
+        if old['search'].get(fts_table) != fts_statements:
+            search_statements.extend(fts_statements)
+
+    return statements, search_statements, warnings
+
+
+def _drop_search_index(fts_table):
+    """Statements that remove an FTS5 table and its sync triggers"""
+    return [f"DROP TRIGGER IF EXISTS {fts_table}_{suffix};" for suffix in ('ai', 'ad', 'au')] + \
+        [f"DROP TABLE IF EXISTS {fts_table};"]
+
+
+def load_schema_versions(app_dir):
+    """
+    Load the schema versions recorded in `<app_dir>/.fac`.
+
+    Returns:
+        list: Recorded versions (dicts), oldest first. Unreadable files and
+              files of another snapshot format are ignored.
+    """
+    schema_dir = os.path.join(app_dir, SCHEMA_DIR)
+    try:
+        names = os.listdir(schema_dir)
+    except OSError:
+        return []
+
+    versions = []
+    for name in names:
+        match = SCHEMA_FILE_PATTERN.match(name)
+        if not match:
+            continue
+        try:
+            with open(os.path.join(schema_dir, name), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Ignoring unreadable schema snapshot {name}: {e}")
+            continue
+        if data.get('format') != SCHEMA_FORMAT or data.get('version') != int(match.group(1)):
+            print(f"⚠️ Ignoring schema snapshot {name} (unknown format)")
+            continue
+        versions.append(data)
+
+    return sorted(versions, key=lambda data: data['version'])
+
+
+def compile_schema(app_dir, modules, file_manager):
+    """
+    Compare the configuration schema with the last recorded version and record a new one if it changed.
+
+    The new snapshot is written through `file_manager`, so it is only saved
+    when the generation is flushed (never by `fac plan`); snapshots are kept
+    across runs and are not recorded in the manifest.
+
+    Args:
+        app_dir (str): Generated app directory.
+        modules (list): Module configurations.
+        file_manager (FileManager): File manager of the generation.
+
+    Returns:
+        dict: version (current schema version), migrations and search_migrations
+              (version -> statements, for every version after the first) and
+              snapshot (the current schema, see build_schema).
+    """
+    schema = build_schema(modules)
+    versions = load_schema_versions(app_dir)
+
+    if not versions or versions[-1]['schema'] != schema:
+        version = versions[-1]['version'] + 1 if versions else 1
+        if versions:
+            statements, search_statements, warnings = diff_schema(versions[-1]['schema'], schema,
+                                                                  column_defaults(modules))
+        else:
+            # Primeira versão: o banco é criado do zero pelo onCreate
+            statements, search_statements, warnings = [], [], []
+
+        for warning in warnings:
+            print(f"⚠️ Schema v{version}: {warning}")
+
+        record = {
+            'format': SCHEMA_FORMAT,
+            'version': version,
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'migration': statements,
+            'search_migration': search_statements,
+            'schema': schema,
+        }
+        file_manager.write_file(os.path.join(app_dir, SCHEMA_DIR, schema_file_name(version)),
+                                json.dumps(record, indent=2, ensure_ascii=False) + '\n', track=False)
+        versions.append(record)
+
+        if version > 1:
+            print(f"🧬 SQLite schema v{version}: {len(statements) + len(search_statements)} migration statement(s)")
+
+    return {
+        'version': versions[-1]['version'],
+        'migrations': {data['version']: data['migration'] for data in versions[1:]},
+        'search_migrations': {data['version']: data['search_migration']
+                              for data in versions[1:] if data['search_migration']},
+        'snapshot': schema,
+    }
@@ -6,7 +6,8 @@ This script generates SQLite table creation scripts based on module definitions.
 import yaml
 import os
 import re
-from jinja2 import Environment, FileSystemLoader
+from collections.abc import Mapping
+from utils.module_options import get_pagination_options, get_search_options, warn_once
 
 
 def snake_case(s):
@@ -69,30 +70,190 @@ def generate_create_table_statement(module):
     sql += "  createdAt TEXT NOT NULL,\n"
     sql += "  updatedAt TEXT NOT NULL"
 
-    # Add soft delete field if needed
+    # Add soft delete field if needed (same column the app schema and repositories use)
     if soft_delete:
-        sql += ",\n  deleted INTEGER DEFAULT 0"
+        sql += ",\n  deletedAt TEXT DEFAULT NULL"
 
     sql += "\n);"
 
     return sql
 
 
-def generate_indexes(module):
-    """Generate index creation statements for a module."""
-    module_name = module['name'].lower()
+def get_column_name(field):
+    """Column of a field in the CREATE TABLE statement (references are stored as <name>_id)"""
+    if field.get('type') == 'reference':
+        return f"{field['name']}_id"
+    return field['name']
+
+
+def _index_name(table, columns):
+    """Index name: idx_<table>_<columns> (the name unique indexes always had)"""
+    return f"idx_{table}_{'_'.join(columns)}"
+
+
+def derive_indexes(module):
+    """
+    Derive the indexes of a module table from its configuration.
+
+    - `unique: true` fields get a unique index.
+    - Reference (foreign key) columns, used by getBy<Ref>Id and the
+      relationship helpers, get a plain index.
+    - The pagination sort field gets a composite (sort field, id) index, so
+      keyset pages are read in index order (see get_pagination_options).
+    - `sortable: true` fields get a (field, id) index and `filterable: true`
+      fields an index on the field.
+    - Module-level `indexes:` declares composite indexes, either as a list of
+      fields or as {fields, unique}.
+
+    Sort and filter indexes of soft-delete modules are partial
+    (`WHERE deletedAt IS NULL`), matching the filter of the generated queries
+    and leaving deleted rows out of the index.
+
+    Args:
+        module (dict): Module configuration.
+
+    Returns:
+        list: Index specs (name, table, columns, unique, where, reason), without duplicates.
+    """
+    table = module['name'].lower()
     fields = module.get('fields', [])
+    fields_by_name = {field['name']: field for field in fields if 'name' in field}
+    live = 'deletedAt IS NULL' if module.get('soft_delete', False) else None
+
     indexes = []
+    seen = set()
+
+    def add(columns, reason, unique=False, where=None):
+        key = (tuple(columns), where)
+        # A unique or identical index on the same columns already serves the lookup
+        if key in seen or (tuple(columns), None) in seen:
+            return
+        seen.add(key)
+        indexes.append({
+            'name': _index_name(table, columns) + ('_live' if where else ''),
+            'table': table,
+            'columns': list(columns),
+            'unique': unique,
+            'where': where,
+            'reason': reason,
+        })
 
     for field in fields:
         if field.get('unique'):
-            field_name = field['name']
-            index_sql = f"CREATE UNIQUE INDEX idx_{module_name}_{field_name} ON {module_name}({field_name});"
-            indexes.append(index_sql)
+            add([field['name']], 'unique', unique=True)
+
+    for field in fields:
+        if field.get('type') == 'reference':
+            add([get_column_name(field)], 'reference')
+
+    sort_field = get_pagination_options(module)['sort_field']
+    add([sort_field, 'id'] if sort_field != 'id' else ['id'], 'sort', where=live)
+
+    for field in fields:
+        if field.get('type') == 'List' or str(field.get('type', '')).startswith('List'):
+            continue
+        if field.get('sortable'):
+            add([get_column_name(field), 'id'], 'sortable', where=live)
+        if field.get('filterable'):
+            add([get_column_name(field)], 'filterable', where=live)
+
+    for declared in module.get('indexes', []) or []:
+        spec = declared if isinstance(declared, Mapping) else {'fields': declared}
+        names = spec.get('fields') or []
+        if isinstance(names, str):
+            names = [names]
+        unknown = [name for name in names if name not in fields_by_name and name not in ('id', 'createdAt', 'updatedAt')]
+        if not names or unknown:
+            warn_once(module['name'], f"invalid index {names} (unknown fields: {unknown}), skipping")
+            continue
+        columns = [get_column_name(fields_by_name[name]) if name in fields_by_name else name for name in names]
+        unique = bool(spec.get('unique', False))
+        add(columns, 'composite', unique=unique, where=None if unique else live)
+
+    return indexes
+
+
+def index_statement(index):
+    """CREATE INDEX statement of an index spec"""
+    unique = 'UNIQUE ' if index['unique'] else ''
+    where = f" WHERE {index['where']}" if index['where'] else ''
+    return f"CREATE {unique}INDEX {index['name']} ON {index['table']}({', '.join(index['columns'])}){where};"
+
+
+def generate_indexes(module):
+    """Generate index creation statements for a module."""
+    return [index_statement(index) for index in derive_indexes(module)]
+
+
+def generate_junction_indexes(modules):
+    """
+    Generate indexes for the reverse side of many-to-many junction tables.
+
+    The primary key (source_id, target_id) already serves lookups by source;
+    lookups by target need their own index.
+    """
+    indexes = []
+
+    for module in modules:
+        module_name = module['name'].lower()
+        for field in module.get('fields', []):
+            if field.get('type') == 'List' and field.get('itemType') == 'reference' and field.get('reference'):
+                junction_table = f"{module_name}_{field['reference'].lower()}"
+                column = f"{field['reference'].lower()}_id"
+                indexes.append(f"CREATE INDEX idx_{junction_table}_{column} ON {junction_table}({column});")
 
     return indexes
 
 
+def print_index_report(modules):
+    """Print the indexes derived for every table"""
+    print("🗂️ SQLite indexes:")
+    for module in modules:
+        indexes = derive_indexes(module)
+        description = ', '.join(
+            f"{'+'.join(index['columns'])} ({index['reason']}{', live rows' if index['where'] else ''})"
+            for index in indexes
+        )
+        print(f"  {module['name'].lower():<24} {len(indexes):>2}  {description}")
+
+
+def generate_search_index_statements(module, search=None):
+    """
+    Generate the FTS5 table and sync triggers of a module with a `search:` block.
+
+    The FTS table stores its own copy of the text with the row `id`
+    (UNINDEXED) and search joins on `id`: module tables have a TEXT primary
+    key, so their rowid is not stable (VACUUM may renumber it) and cannot
+    link the index to the rows. The triggers keep the index in sync on
+    insert, update and delete; the last statement fills it from the rows
+    already in the table (none on a new database).
+    """
+    search = search or get_search_options(module)
+    if not search:
+        return []
+
+    table = search['table']
+    fts_table = search['fts_table']
+    columns = ', '.join(search['fields'])
+    new_values = ', '.join(f"new.{field}" for field in search['fields'])
+
+    return [
+        f"CREATE VIRTUAL TABLE {fts_table} USING fts5(id UNINDEXED, {columns}, "
+        f"tokenize='{search['tokenizer']}');",
+        f"CREATE TRIGGER {fts_table}_ai AFTER INSERT ON {table} BEGIN\n"
+        f"  INSERT INTO {fts_table}(id, {columns}) VALUES (new.id, {new_values});\n"
+        f"END;",
+        f"CREATE TRIGGER {fts_table}_ad AFTER DELETE ON {table} BEGIN\n"
+        f"  DELETE FROM {fts_table} WHERE id = old.id;\n"
+        f"END;",
+        f"CREATE TRIGGER {fts_table}_au AFTER UPDATE ON {table} BEGIN\n"
+        f"  DELETE FROM {fts_table} WHERE id = old.id;\n"
+        f"  INSERT INTO {fts_table}(id, {columns}) VALUES (new.id, {new_values});\n"
+        f"END;",
+        f"INSERT INTO {fts_table}(id, {columns}) SELECT id, {columns} FROM {table};",
+    ]
+
+
 def generate_junction_tables(modules):
     """Generate junction tables for many-to-many relationships."""
     junction_tables = []
@@ -138,13 +299,16 @@ def generate_sqlite_schema(config_path, output_dir):
     # Generate table creation statements
     create_tables = []
     create_indexes = []
+    search_indexes = []
 
     for module in modules:
         create_tables.append(generate_create_table_statement(module))
         create_indexes.extend(generate_indexes(module))
+        search_indexes.extend(generate_search_index_statements(module))
 
     # Generate junction tables for many-to-many relationships
     junction_tables = generate_junction_tables(modules)
+    create_indexes.extend(generate_junction_indexes(modules))
 
     # Write to migration file
     output_path = os.path.join(output_dir, 'sqlite_migrations.sql')
@@ -166,6 +330,12 @@ def generate_sqlite_schema(config_path, output_dir):
             for statement in create_indexes:
                 file.write(f"{statement}\n\n")
 
+        # Write full-text search indexes
+        if search_indexes:
+            file.write("-- Full-text search (FTS5)\n")
+            for statement in search_indexes:
+                file.write(f"{statement}\n\n")
+
     # Generate migration manager template parameters
     template_params = {
         'app_name': config.get('app', {}).get('name', 'MyApp'),
@@ -176,16 +346,18 @@ def generate_sqlite_schema(config_path, output_dir):
     templates_dir = os.path.join(output_dir, 'templates')
     os.makedirs(templates_dir, exist_ok=True)
 
-    # Initialize Jinja2 environment
-    env = Environment(loader=FileSystemLoader('templates'))
+    # Use the shared Jinja2 environment
+    from utils.template_registry import get_jinja_env
+    env = get_jinja_env()
 
     # Generate database initializer
-    template = env.get_template('database_initializer.dart.jinja')
+    template = env.get_template('app/database_initializer.dart.jinja')
     output = template.render(**template_params)
 
     with open(os.path.join(templates_dir, 'database_initializer.dart'), 'w') as file:
         file.write(output)
 
+    print_index_report(modules)
     print(f"SQLite schema generated successfully in {output_dir}")
 
 
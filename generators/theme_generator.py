@@ -1,22 +1,23 @@
 import os
-from jinja2 import Environment, FileSystemLoader
+from utils.file_manager import FileManager
+from utils.template_registry import get_jinja_env
 
 
 class ThemeGenerator:
-    def __init__(self, app_dir, config):
+    def __init__(self, app_dir, config, file_manager=None):
         self.app_dir = app_dir
         self.config = config
+        self.file_manager = file_manager or FileManager()
 
-        # Set up Jinja2 environment
-        template_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'templates')
-        self.jinja_env = Environment(loader=FileSystemLoader(template_dir))
+        # Shared Jinja2 environment (templates are compiled once per process)
+        self.jinja_env = get_jinja_env()
 
     def generate(self):
         """Generate theme files for the Flutter app"""
 
         # Create directory if it doesn't exist
         theme_dir = os.path.join(self.app_dir, 'lib', 'app', 'theme')
-        os.makedirs(theme_dir, exist_ok=True)
+        self.file_manager.create_directory(theme_dir)
 
         # Extract theme configuration
         theme_config = self.config.get('theme', {})
@@ -67,11 +68,6 @@ class ThemeGenerator:
     def _generate_file(self, template_path, output_path, context):
         """Generate a file from a template with the given context"""
         try:
-            template = self.jinja_env.get_template(template_path)
-            output = template.render(**context)
-
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
-                f.write(output)
+            self.file_manager.render_template(template_path, output_path, **context)
         except Exception as e:
             print(f"Error generating {output_path}: {e}")
\ No newline at end of file
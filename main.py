@@ -1,16 +1,28 @@
 #!/usr/bin/env python3
 
 import click
-from cli.commands import new_command, generate_command, firebase_command
+from cli.lazy_group import LazyGroup
 
-@click.group()
+# Subcomandos importados só quando chamados: `fac --help` não carrega os geradores
+COMMANDS = {
+    'new': ('cli.commands.new_command:new',
+            'Create a new Flutter application based on a YAML configuration'),
+    'generate': ('cli.commands.generate_command:generate',
+                 'Generate components for an existing Flutter app'),
+    'firebase': ('cli.commands.firebase_command:firebase',
+                 'Firebase related commands'),
+    'regenerate': ('cli.commands.regenerate_command:regenerate',
+                   'Re-render an existing application, touching only outputs whose inputs changed'),
+    'deps': ('cli.commands.deps_command:deps',
+             'Dependency profile commands'),
+    'plan': ('cli.commands.plan_command:plan',
+             "Show what 'fac new' would generate, without writing files or running Flutter"),
+}
+
+@click.group(cls=LazyGroup, lazy_subcommands=COMMANDS)
 def cli():
     """Flutter App Creator (FAC) - Generate full-featured Flutter applications from YAML"""
     pass
 
-cli.add_command(new_command.new)
-cli.add_command(generate_command.generate)
-cli.add_command(firebase_command.firebase)
-
 if __name__ == "__main__":
     cli()
\ No newline at end of file
@@ -0,0 +1,29 @@
+import os
+import platform
+
+
+def get_cache_dir(*parts):
+    """
+    Return (and create) a directory inside the FAC user cache.
+
+    The root can be overridden with the FAC_CACHE_DIR environment variable.
+    Defaults to %LOCALAPPDATA%\\fac on Windows and ~/.cache/fac elsewhere.
+
+    Args:
+        *parts (str): Sub-directories inside the cache root.
+
+    Returns:
+        str: Absolute path to the cache directory.
+    """
+    root = os.environ.get('FAC_CACHE_DIR')
+
+    if not root:
+        if platform.system() == 'Windows' and os.environ.get('LOCALAPPDATA'):
+            root = os.path.join(os.environ['LOCALAPPDATA'], 'fac')
+        else:
+            xdg_cache = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+            root = os.path.join(xdg_cache, 'fac')
+
+    path = os.path.join(root, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
@@ -1,7 +1,73 @@
 import re
+from functools import lru_cache
+
+# Padrões compilados uma única vez (to_snake_case roda para cada nome de módulo e campo)
+_LOWER_UPPER = re.compile(r'([a-z])([A-Z])')
+_ACRONYM = re.compile(r'([A-Z]+)([A-Z][a-z])')
+_SPECIAL = re.compile(r'[^a-zA-Z0-9\s_]')
+_SPACES = re.compile(r'\s+')
+_UNDERSCORES = re.compile(r'_+')
+
+# Resultados guardados por conversão (nomes distintos de uma configuração grande cabem com folga)
+CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _snake_case(text):
+    # First, handle the transition from lowercase to uppercase (camelCase/PascalCase)
+    text = _LOWER_UPPER.sub(r'\1_\2', text)
+    # Handle multiple uppercase letters followed by lowercase (e.g., "XMLParser" -> "XML_Parser")
+    text = _ACRONYM.sub(r'\1_\2', text)
+    # Remove special characters
+    text = _SPECIAL.sub('', text)
+    # Replace spaces with underscores
+    text = _SPACES.sub('_', text)
+    # Convert to lowercase
+    text = text.lower()
+    # Remove multiple underscores
+    text = _UNDERSCORES.sub('_', text)
+    # Remove leading/trailing underscores
+    text = text.strip('_')
+
+    # Ensure name doesn't start with a digit
+    if text and text[0].isdigit():
+        text = 'app_' + text
+
+    return text
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _camel_case(text):
+    components = _snake_case(text).split('_')
+    return components[0] + ''.join(x.title() for x in components[1:])
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _pascal_case(text):
+    return ''.join(x.title() for x in _snake_case(text).split('_'))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _kebab_case(text):
+    return _snake_case(text).replace('_', '-')
+
+
+_CONVERSIONS = {
+    'snake': _snake_case,
+    'camel': _camel_case,
+    'pascal': _pascal_case,
+    'kebab': _kebab_case,
+}
 
 
 class CaseConverter:
+    """
+    Identifier case conversions.
+
+    Results are memoized in bounded LRU caches shared by every instance, so a
+    name converted by one generator is free for the others.
+    """
+
     def to_snake_case(self, text):
         """
         Convert a string to snake_case.
@@ -12,41 +78,44 @@ class CaseConverter:
         Returns:
             str: The converted string in snake_case.
         """
-        # First, handle the transition from lowercase to uppercase (camelCase/PascalCase)
-        text = re.sub(r'([a-z])([A-Z])', r'\1_\2', text)
-        # Handle multiple uppercase letters followed by lowercase (e.g., "XMLParser" -> "XML_Parser")
-        text = re.sub(r'([A-Z]+)([A-Z][a-z])', r'\1_\2', text)
-        # Remove special characters
-        text = re.sub(r'[^a-zA-Z0-9\s_]', '', text)
-        # Replace spaces with underscores
-        text = re.sub(r'\s+', '_', text)
-        # Convert to lowercase
-        text = text.lower()
-        # Remove multiple underscores
-        text = re.sub(r'_+', '_', text)
-        # Remove leading/trailing underscores
-        text = text.strip('_')
-
-        # Ensure name doesn't start with a digit
-        if text and text[0].isdigit():
-            text = 'app_' + text
-
-        return text
+        return _snake_case(text)
 
     def to_camel_case(self, text):
         """Convert text to camelCase"""
-        # First convert to snake_case to normalize
-        snake = self.to_snake_case(text)
-        components = snake.split('_')
-        return components[0] + ''.join(x.title() for x in components[1:])
+        return _camel_case(text)
 
     def to_pascal_case(self, text):
         """Convert text to PascalCase"""
-        # First convert to snake_case to normalize
-        snake = self.to_snake_case(text)
-        components = snake.split('_')
-        return ''.join(x.title() for x in components)
+        return _pascal_case(text)
 
     def to_kebab_case(self, text):
         """Convert text to kebab-case"""
-        return self.to_snake_case(text).replace('_', '-')
\ No newline at end of file
+        return _kebab_case(text)
+
+    def convert_many(self, texts, case='snake'):
+        """
+        Convert a list of identifiers in one call.
+
+        Args:
+            texts (Iterable[str]): Identifiers to convert.
+            case (str): 'snake', 'camel', 'pascal' or 'kebab'.
+
+        Returns:
+            list: The converted identifiers, in the same order.
+        """
+        try:
+            convert = _CONVERSIONS[case]
+        except KeyError:
+            raise ValueError(f"Unknown case '{case}' (expected one of: {', '.join(_CONVERSIONS)})")
+        return [convert(text) for text in texts]
+
+    @staticmethod
+    def cache_info():
+        """Hits, misses and size of each conversion cache"""
+        return {case: convert.cache_info() for case, convert in _CONVERSIONS.items()}
+
+    @staticmethod
+    def clear_cache():
+        """Empty every conversion cache"""
+        for convert in _CONVERSIONS.values():
+            convert.cache_clear()
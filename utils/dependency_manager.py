@@ -1,5 +1,8 @@
+import os
 import re
-from typing import List, Dict, Set
+import yaml
+from typing import List, Dict, Set, Optional
+from utils.deps_profile import parse_locked_versions
 
 class DependencyManager:
     """
@@ -22,7 +25,7 @@ class DependencyManager:
                 'equatable',  # Value equality
                 'shared_preferences',  # Local storage
                 # 'flutter_localizations --sdk=flutter',  # Internationalization
-                # 'intl',  # Internationalization
+                'intl',  # Internationalization
             ],
 
             # Dependências para SQLite
@@ -167,6 +170,152 @@ class DependencyManager:
                 # Tenta adicionar uma por vez se falhar em batch
                 self._install_individually(project_dir, required_deps['dev_dependencies'], dev=True)
 
+    def plan_dependencies(self, extra_dependencies: Optional[List[str]] = None) -> Dict[str, List[str]]:
+        """
+        Calcula o conjunto completo de dependências da aplicação.
+
+        Args:
+            extra_dependencies (List[str], optional): Dependências adicionais (ex.: Firebase)
+
+        Returns:
+            Dict com 'dependencies' e 'dev_dependencies' ordenadas
+        """
+        required_deps = self.get_required_dependencies()
+        dependencies = set(required_deps['dependencies']) | set(extra_dependencies or [])
+        dev_dependencies = set(required_deps['dev_dependencies']) - dependencies
+
+        return {
+            'dependencies': sorted(dependencies),
+            'dev_dependencies': sorted(dev_dependencies)
+        }
+
+    def write_pubspec(self, project_dir: str, file_manager, plan: Dict[str, List[str]],
+                      versions: Optional[Dict[str, str]] = None, exact: bool = False):
+        """
+        Escreve o pubspec.yaml completo a partir de templates/app/pubspec.yaml.jinja.
+
+        Metadados (nome, descrição, versão, SDK) e restrições já existentes são
+        preservados do pubspec atual. Pacotes com versão conhecida recebem `^versão`,
+        os demais `any` (a versão é escolhida pela resolução).
+
+        Args:
+            project_dir (str): Diretório do projeto Flutter
+            file_manager (FileManager): Gerenciador de arquivos usado para escrever o pubspec
+            plan (Dict): Resultado de plan_dependencies()
+            versions (Dict[str, str], optional): Versões resolvidas por pacote
+            exact (bool): Usa a versão exata em vez de `^versão`
+        """
+        pubspec_path = os.path.join(project_dir, 'pubspec.yaml')
+        versions = versions or {}
+
+        try:
+            with open(pubspec_path, 'r', encoding='utf-8') as f:
+                current = yaml.safe_load(f) or {}
+        except (OSError, yaml.YAMLError):
+            current = {}
+
+        def constraints(section: str, packages: List[str]):
+            existing = {
+                name: constraint for name, constraint in (current.get(section) or {}).items()
+                if isinstance(constraint, str) and constraint != 'any'
+            }
+            names = sorted(set(packages) | set(existing))
+            return [
+                {
+                    'name': name,
+                    'constraint': (versions[name] if exact else f"^{versions[name]}") if name in versions
+                    else existing.get(name, 'any'),
+                }
+                for name in names
+            ]
+
+        file_manager.render_template(
+            'app/pubspec.yaml.jinja',
+            pubspec_path,
+            name=current.get('name') or os.path.basename(os.path.abspath(project_dir)),
+            description=current.get('description') or 'A new Flutter project.',
+            version=current.get('version') or '1.0.0+1',
+            sdk_constraint=(current.get('environment') or {}).get('sdk') or '^3.5.0',
+            dependencies=constraints('dependencies', plan['dependencies']),
+            dev_dependencies=constraints('dev_dependencies', plan['dev_dependencies']),
+            sqlite_enabled=self.config.get('persistence', {}).get('provider') == 'sqlite',
+        )
+
+    def resolve_dependencies(self, project_dir: str, file_manager,
+                             extra_dependencies: Optional[List[str]] = None, profile=None) -> int:
+        """
+        Escreve todas as dependências no pubspec.yaml e resolve uma única vez.
+
+        Substitui as chamadas sucessivas de `flutter pub add`: o pubspec é gerado
+        com o conjunto completo de pacotes, `flutter pub get` roda uma vez e as
+        versões resolvidas são fixadas como `^versão` (como o `pub add` faria).
+
+        Args:
+            project_dir (str): Diretório do projeto Flutter
+            file_manager (FileManager): Gerenciador de arquivos usado para escrever o pubspec
+            extra_dependencies (List[str], optional): Dependências adicionais (ex.: Firebase)
+            profile (DepsProfile, optional): Perfil com versões fixas; a resolução é feita offline
+
+        Returns:
+            int: Número de subprocessos do Flutter executados
+        """
+        plan = self.plan_dependencies(extra_dependencies)
+
+        if profile is not None:
+            return self._resolve_from_profile(project_dir, file_manager, plan, profile)
+
+        self.write_pubspec(project_dir, file_manager, plan)
+        file_manager.flush()
+        self.flutter_cli.pub_get(project_dir)
+
+        # Fixa as versões resolvidas sem uma nova resolução
+        versions = self.get_locked_versions(project_dir)
+        if versions:
+            self.write_pubspec(project_dir, file_manager, plan, versions)
+            file_manager.flush()
+
+        return 1
+
+    def _resolve_from_profile(self, project_dir: str, file_manager, plan: Dict[str, List[str]], profile) -> int:
+        """
+        Escreve as versões exatas de um perfil e resolve offline.
+
+        O pubspec.lock do perfil é restaurado antes da resolução, então as
+        dependências transitivas também ficam nas mesmas versões.
+        """
+        missing = [
+            name for name in plan['dependencies'] + plan['dev_dependencies']
+            if name not in profile.packages
+        ]
+        if missing:
+            print(f"⚠️ Not pinned in profile '{profile.name}' (resolved from the local pub cache): "
+                  f"{', '.join(missing)}")
+
+        self.write_pubspec(project_dir, file_manager, plan, profile.packages, exact=True)
+        file_manager.flush()
+        if profile.lockfile:
+            with open(os.path.join(project_dir, 'pubspec.lock'), 'w', encoding='utf-8', newline='\n') as f:
+                f.write(profile.lockfile)
+
+        self.flutter_cli.pub_get(project_dir, offline=True)
+        return 1
+
+    def get_locked_versions(self, project_dir: str) -> Dict[str, str]:
+        """
+        Lê as versões das dependências diretas do pubspec.lock.
+
+        Args:
+            project_dir (str): Diretório do projeto Flutter
+
+        Returns:
+            Dict mapeando pacote -> versão resolvida
+        """
+        try:
+            with open(os.path.join(project_dir, 'pubspec.lock'), 'r', encoding='utf-8') as f:
+                return parse_locked_versions(f.read())
+        except OSError:
+            return {}
+
     def _install_individually(self, project_dir: str, packages: List[str], dev: bool = False):
         """
         Instala dependências uma por vez quando a instalação em batch falha.
@@ -0,0 +1,125 @@
+import os
+import re
+import json
+import yaml
+from datetime import datetime
+from typing import Dict, List, Optional
+from utils.cache_paths import get_cache_dir
+
+
+PROFILE_NAME_PATTERN = re.compile(r'^[A-Za-z0-9_.-]+$')
+
+
+def parse_locked_versions(lockfile: str) -> Dict[str, str]:
+    """
+    Versions of the direct hosted dependencies listed in a pubspec.lock.
+
+    Args:
+        lockfile (str): Content of the pubspec.lock file.
+
+    Returns:
+        Dict[str, str]: Package name -> resolved version.
+    """
+    try:
+        lock = yaml.safe_load(lockfile) or {}
+    except yaml.YAMLError:
+        return {}
+
+    return {
+        package: str(info['version'])
+        for package, info in (lock.get('packages') or {}).items()
+        if str(info.get('dependency', '')).startswith('direct') and info.get('source') == 'hosted'
+    }
+
+
+class DepsProfile:
+    """
+    Pinned dependency versions captured from a generated app (`fac deps lock`).
+
+    A profile stores the exact version of every direct dependency and a copy of
+    the app's pubspec.lock. `fac new --deps-profile <name>` writes those versions
+    into pubspec.yaml, restores the lockfile and resolves with `--offline`, so
+    generation only needs the local pub cache and always picks the same versions.
+    """
+
+    def __init__(self, name: str, packages: Dict[str, str], lockfile: str, created_from: Optional[str] = None,
+                 created_at: Optional[str] = None):
+        self.name = name
+        self.packages = packages
+        self.lockfile = lockfile
+        self.created_from = created_from
+        self.created_at = created_at
+
+    @staticmethod
+    def get_path(name: str) -> str:
+        """Path of the profile file inside the FAC user cache"""
+        if not PROFILE_NAME_PATTERN.match(name):
+            raise ValueError(f"Invalid profile name '{name}': use letters, numbers, '.', '-' and '_'")
+        return os.path.join(get_cache_dir('deps_profiles'), f"{name}.json")
+
+    @staticmethod
+    def list_profiles() -> List[str]:
+        """Names of the saved profiles"""
+        return sorted(
+            file_name[:-len('.json')] for file_name in os.listdir(get_cache_dir('deps_profiles'))
+            if file_name.endswith('.json')
+        )
+
+    @classmethod
+    def from_project(cls, name: str, project_dir: str) -> 'DepsProfile':
+        """
+        Capture the resolved versions of a Flutter project.
+
+        Args:
+            name (str): Name of the profile.
+            project_dir (str): Flutter project with a pubspec.lock.
+
+        Raises:
+            FileNotFoundError: If the project has no pubspec.lock.
+        """
+        lock_path = os.path.join(project_dir, 'pubspec.lock')
+        if not os.path.isfile(lock_path):
+            raise FileNotFoundError(f"pubspec.lock not found in {project_dir}. Run 'flutter pub get' first.")
+
+        with open(lock_path, 'r', encoding='utf-8') as f:
+            lockfile = f.read()
+
+        packages = parse_locked_versions(lockfile)
+
+        return cls(name, dict(sorted(packages.items())), lockfile,
+                   created_from=os.path.abspath(project_dir),
+                   created_at=datetime.now().isoformat(timespec='seconds'))
+
+    @classmethod
+    def load(cls, name: str) -> 'DepsProfile':
+        """
+        Load a saved profile.
+
+        Raises:
+            FileNotFoundError: If no profile with this name exists.
+        """
+        path = cls.get_path(name)
+        if not os.path.isfile(path):
+            available = ', '.join(cls.list_profiles()) or 'none'
+            raise FileNotFoundError(f"Dependency profile '{name}' not found (available: {available})")
+
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        return cls(data['name'], data.get('packages', {}), data.get('lockfile', ''),
+                   created_from=data.get('created_from'), created_at=data.get('created_at'))
+
+    def save(self) -> str:
+        """Write the profile to the FAC user cache and return its path"""
+        path = self.get_path(self.name)
+        data = {
+            'name': self.name,
+            'created_from': self.created_from,
+            'created_at': self.created_at,
+            'packages': self.packages,
+            'lockfile': self.lockfile,
+        }
+        with open(path, 'w', encoding='utf-8', newline='\n') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+        return path
@@ -1,23 +1,204 @@
 import os
 import shutil
+import tempfile
+import threading
+from typing import Dict
+from utils.manifest import Manifest, hash_bytes
+
+# Bytes written to disk per thread: concurrent generation tasks each see only their own writes
+_written = threading.local()
+
+
+def thread_bytes_written():
+    """Bytes written to disk by every FileManager on the current thread"""
+    return getattr(_written, 'bytes', 0)
+
+
+def _count_written(count):
+    _written.bytes = thread_bytes_written() + count
 
 
 class FileManager:
 
+    def __init__(self, manifest: Manifest = None, buffered: bool = False):
+        """
+        Args:
+            manifest (Manifest, optional): When given, rendered outputs whose inputs did not
+                change are skipped and every write is recorded in the manifest.
+            buffered (bool, optional): Keep written files and created directories in memory
+                (a virtual output tree) until flush() is called.
+        """
+        self.manifest = manifest
+        self.buffered = buffered
+        self.stats = {'rendered': 0, 'skipped': 0, 'written': 0, 'unchanged': 0, 'bytes': 0}
+
+        # Virtual output tree (buffered mode): absolute path -> bytes, and directories to create
+        self.pending: Dict[str, bytes] = {}
+        self.directories = set()
+
     def ensure_directory_exists(path):
         """Garante que um diretório existe, criando-o se necessário."""
         if not os.path.exists(path):
             os.makedirs(path)
 
     def create_directory(self, path):
-        """Create a directory if it doesn't exist"""
+        """Create a directory if it doesn't exist (deferred until flush() in buffered mode)"""
+        if self.buffered:
+            self.directories.add(os.path.abspath(path))
+            return
         os.makedirs(path, exist_ok=True)
 
-    def write_file(self, path, content):
-        """Write content to a file, creating directories as needed"""
+    def render_template(self, template_name, output_path, **context):
+        """
+        Render a template into `output_path`.
+
+        When a manifest is attached and the template source, the context and the
+        generator version are the same as in the last run (and the file was not
+        modified since), rendering is skipped entirely.
+
+        Returns:
+            bool: True if the template was rendered, False if it was skipped.
+        """
+        inputs_hash = None
+        if self.manifest is not None:
+            inputs_hash = self.manifest.inputs_hash(template_name, context)
+            if self.manifest.is_fresh(output_path, inputs_hash):
+                self.stats['skipped'] += 1
+                return False
+
+        from utils.template_registry import get_jinja_env
+        output = get_jinja_env().get_template(template_name).render(**context)
+        self.stats['rendered'] += 1
+
+        self.write_file(output_path, output, inputs_hash=inputs_hash, template_name=template_name)
+        return True
+
+    def write_file(self, path, content, inputs_hash=None, template_name=None, track=True):
+        """
+        Write content to a file, creating directories as needed.
+
+        The file is left untouched (mtime included) when it already holds the
+        same bytes. Files written with `track=False` are not recorded in the
+        manifest, so they are not reported as stale when a later run does not
+        write them again (schema snapshots, for instance).
+
+        Returns:
+            bool: True if the file was written, False if it was already up to date.
+        """
+        data = content.encode('utf-8')
+        output_hash = hash_bytes(data)
+
+        if self.manifest is not None and track:
+            self.manifest.record(path, inputs_hash or output_hash, output_hash, template_name)
+
+        if self._has_same_bytes(path, data):
+            self.stats['unchanged'] += 1
+            return False
+
+        if self.buffered:
+            # Replaces any earlier pending version: the file is counted once
+            if os.path.abspath(path) not in self.pending:
+                self.stats['written'] += 1
+            self.pending[os.path.abspath(path)] = data
+            return True
+
         os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, 'w', encoding='utf-8', newline='\n') as f:
-            f.write(content)
+        with open(path, 'wb') as f:
+            f.write(data)
+        self.stats['written'] += 1
+        self.stats['bytes'] += len(data)
+        _count_written(len(data))
+        return True
+
+    def flush(self):
+        """
+        Write the virtual output tree to disk in one batched pass.
+
+        Every directory is created once. Files are first written to a staging
+        directory next to the output and only renamed into place after all of
+        them were written successfully, so a failure while writing leaves the
+        existing tree untouched.
+
+        Returns:
+            int: Number of files written.
+        """
+        if not self.buffered or (not self.pending and not self.directories):
+            return 0
+
+        pending, self.pending = self.pending, {}
+        directories = self.directories | {os.path.dirname(path) for path in pending}
+        self.directories = set()
+
+        for directory in sorted(directories):
+            os.makedirs(directory, exist_ok=True)
+
+        if not pending:
+            return 0
+
+        # Stage next to the outputs (same filesystem, so os.replace is an atomic rename)
+        staging_root = os.path.commonpath(list(directories))
+        staging_dir = tempfile.mkdtemp(prefix='.fac-staging-', dir=staging_root)
+        try:
+            staged = []
+            for index, (path, data) in enumerate(pending.items()):
+                staged_path = os.path.join(staging_dir, str(index))
+                with open(staged_path, 'wb') as f:
+                    f.write(data)
+                staged.append((staged_path, path))
+
+            for staged_path, path in staged:
+                os.replace(staged_path, path)
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+        # Bytes are counted once they are on disk (not when buffered)
+        written = sum(len(data) for data in pending.values())
+        self.stats['bytes'] += written
+        _count_written(written)
+
+        return len(pending)
+
+    def _has_same_bytes(self, path, data):
+        """Check if `path` (or its pending version) already contains exactly `data`"""
+        if self.buffered and os.path.abspath(path) in self.pending:
+            return self.pending[os.path.abspath(path)] == data
+
+        try:
+            if os.path.getsize(path) != len(data):
+                return False
+            with open(path, 'rb') as f:
+                return f.read() == data
+        except OSError:
+            return False
+
+    def drain_state(self):
+        """
+        Return the state produced since the last call and reset it.
+
+        Used by worker processes to hand their stats and manifest entries
+        back to the parent FileManager (see merge_state).
+        """
+        state = {
+            'stats': dict(self.stats),
+            'manifest': self.manifest.export_entries() if self.manifest is not None else {},
+            'files': self.pending,
+            'directories': self.directories,
+        }
+        self.stats = {key: 0 for key in self.stats}
+        self.pending = {}
+        self.directories = set()
+        if self.manifest is not None:
+            self.manifest.touched.clear()
+        return state
+
+    def merge_state(self, state):
+        """Merge the state drained from a worker's FileManager"""
+        for key, value in state.get('stats', {}).items():
+            self.stats[key] = self.stats.get(key, 0) + value
+        if self.manifest is not None and state.get('manifest'):
+            self.manifest.merge_entries(state['manifest'])
+        self.pending.update(state.get('files', {}))
+        self.directories.update(state.get('directories', set()))
 
     def copy_file(self, src, dest):
         """Copy a file from source to destination"""
@@ -25,5 +206,5 @@ class FileManager:
         shutil.copy2(src, dest)
 
     def file_exists(self, path):
-        """Check if a file exists"""
-        return os.path.isfile(path)
\ No newline at end of file
+        """Check if a file exists (including files pending in the virtual output tree)"""
+        return os.path.abspath(path) in self.pending or os.path.isfile(path)
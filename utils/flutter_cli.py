@@ -6,6 +6,7 @@ import shutil
 import yaml
 from pathlib import Path
 from typing import List, Dict, Optional
+from utils.skeleton_cache import SkeletonCache
 
 
 class FlutterCLI:
@@ -19,6 +20,9 @@ class FlutterCLI:
         """
         self.flutter_path = flutter_path
 
+        # Optional utils.profiler.Profiler recording every subprocess call
+        self.profiler = None
+
         if not self.flutter_path:
             # Try to find flutter in PATH
             self.flutter_path = self._find_flutter()
@@ -30,6 +34,14 @@ class FlutterCLI:
                 "Flutter executable when initializing FlutterCLI."
             )
 
+    def _run(self, cmd, **kwargs):
+        """Run a subprocess (recorded in the profiler, when one is attached)"""
+        if self.profiler is None:
+            return subprocess.run(cmd, **kwargs)
+
+        with self.profiler.subprocess(cmd, cwd=kwargs.get('cwd')):
+            return subprocess.run(cmd, **kwargs)
+
     def _find_flutter(self):
         """
         Find the Flutter executable in the PATH.
@@ -83,7 +95,7 @@ class FlutterCLI:
 
         return None
 
-    def create_project(self, name, org, output_dir='.'):
+    def create_project(self, name, org, output_dir='.', use_skeleton_cache=False, platforms=None):
         """
         Create a new Flutter project.
 
@@ -91,6 +103,9 @@ class FlutterCLI:
             name (str): Name of the project.
             org (str): Organization domain name (e.g., com.example).
             output_dir (str, optional): Directory to create the project in. Default is current directory.
+            use_skeleton_cache (bool, optional): Copy a cached `flutter create` skeleton instead of
+                running `flutter create` (see SkeletonCache). Default is False.
+            platforms (List[str], optional): Platforms to create. Default is Flutter's default set.
         """
         # Ensure the name is valid
         if not re.match(r'^[a-z][a-z0-9_]*$', name):
@@ -100,18 +115,33 @@ class FlutterCLI:
                 "and should start with a letter."
             )
 
+        project_dir = os.path.join(output_dir, name)
+
+        # The skeleton is only copied into new (or empty) directories;
+        # `flutter create` is still used to complete existing projects.
+        if use_skeleton_cache and not (os.path.isdir(project_dir) and os.listdir(project_dir)):
+            try:
+                SkeletonCache(self.flutter_path, run=self._run).create_project(name, org, project_dir, platforms)
+                print(f"Successfully created Flutter project '{name}' in {output_dir} (from skeleton cache)")
+                return
+            except (OSError, ValueError, subprocess.CalledProcessError) as e:
+                print(f"⚠️ Skeleton cache unavailable, falling back to 'flutter create': {e}")
+                shutil.rmtree(project_dir, ignore_errors=True)
+
         cmd = [
             self.flutter_path,
             'create',
             '--org', org,
             '--project-name', name,
-            os.path.join(output_dir, name)
         ]
+        if platforms:
+            cmd.extend(['--platforms', ','.join(platforms)])
+        cmd.append(project_dir)
 
         # print(f"Executing: {' '.join(cmd)}")
 
         try:
-            subprocess.run(cmd, check=True)
+            self._run(cmd, check=True)
             print(f"Successfully created Flutter project '{name}' in {output_dir}")
         except subprocess.CalledProcessError as e:
             print(f"Error creating Flutter project: {e}")
@@ -146,7 +176,7 @@ class FlutterCLI:
         # print(f"Executing: {' '.join(cmd)} in {project_dir}")
 
         try:
-            result = subprocess.run(cmd, cwd=project_dir, check=True,
+            result = self._run(cmd, cwd=project_dir, check=True,
                                     capture_output=True, text=True)
             # print(f"Successfully added packages: {', '.join(packages)}")
             return result
@@ -174,7 +204,7 @@ class FlutterCLI:
         # print(f"Executing: {' '.join(cmd)} in {project_dir}")
 
         try:
-            result = subprocess.run(cmd, cwd=project_dir, check=True,
+            result = self._run(cmd, cwd=project_dir, check=True,
                                     capture_output=True, text=True)
             print(f"Successfully removed packages: {', '.join(packages)}")
             return result
@@ -182,19 +212,23 @@ class FlutterCLI:
             print(f"Error removing packages {packages}: {e}")
             raise
 
-    def pub_get(self, project_dir: str):
+    def pub_get(self, project_dir: str, offline: bool = False):
         """
         Run 'flutter pub get' in the specified project directory.
 
         Args:
             project_dir (str): Path to the Flutter project directory.
+            offline (bool, optional): Resolve using only the local pub cache. Default is False.
         """
         cmd = [self.flutter_path, 'pub', 'get']
 
+        if offline:
+            cmd.append('--offline')
+
         # print(f"Executing: {' '.join(cmd)} in {project_dir}")
 
         try:
-            result = subprocess.run(cmd, cwd=project_dir, check=True,
+            result = self._run(cmd, cwd=project_dir, check=True,
                                     capture_output=True, text=True)
             return result
         except subprocess.CalledProcessError as e:
@@ -220,7 +254,7 @@ class FlutterCLI:
         # print(f"Executing: {' '.join(cmd)} in {project_dir}")
 
         try:
-            result = subprocess.run(cmd, cwd=project_dir, check=True,
+            result = self._run(cmd, cwd=project_dir, check=True,
                                     capture_output=True, text=True)
             print("Successfully upgraded packages")
             return result
@@ -249,7 +283,7 @@ class FlutterCLI:
                 env['PYTHONIOENCODING'] = 'utf-8'
                 env['CHCP'] = '65001'  # UTF-8 code page
 
-            result = subprocess.run(
+            result = self._run(
                 cmd,
                 cwd=project_dir,
                 check=True,
@@ -362,7 +396,7 @@ class FlutterCLI:
         print(f"Executing: {' '.join(cmd)} in {project_dir}")
 
         try:
-            result = subprocess.run(cmd, cwd=project_dir, check=True,
+            result = self._run(cmd, cwd=project_dir, check=True,
                                     capture_output=True, text=True)
             # print("Successfully generated l10n files")
             return result
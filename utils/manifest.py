@@ -0,0 +1,149 @@
+import os
+import json
+import hashlib
+from typing import Dict, Mapping, Optional
+
+
+# Bump when generator changes must invalidate every recorded output
+GENERATOR_VERSION = '0.1.0'
+
+MANIFEST_PATH = os.path.join('.fac', 'manifest.json')
+
+
+def _json_default(value):
+    """Serialize compiled config nodes and read-only mappings by content (anything else by str)"""
+    if hasattr(value, 'as_dict'):
+        return value.as_dict()
+    if isinstance(value, Mapping):
+        return dict(value)
+    return str(value)
+
+
+def hash_bytes(data: bytes) -> str:
+    """Return the SHA-256 hex digest of `data`."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path: str) -> Optional[str]:
+    """Return the SHA-256 hex digest of a file, or None if it cannot be read."""
+    try:
+        with open(path, 'rb') as f:
+            return hash_bytes(f.read())
+    except OSError:
+        return None
+
+
+class Manifest:
+    """
+    Content-hash manifest of generated outputs (`.fac/manifest.json`).
+
+    For every output path it records the hash of the inputs that produced it
+    (template source, render context and generator version) and the hash of
+    the bytes written. An output whose inputs hash is unchanged and whose file
+    still matches the recorded output hash does not need to be rendered again.
+    """
+
+    def __init__(self, app_dir: str):
+        self.app_dir = app_dir
+        self.path = os.path.join(app_dir, MANIFEST_PATH)
+        self.entries: Dict[str, Dict] = {}
+        self.touched = set()
+        self._template_hashes: Dict[str, str] = {}
+        self._load()
+
+    def _load(self):
+        """Load the manifest from disk, ignoring it if unreadable or from another generator version"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if data.get('generator_version') != GENERATOR_VERSION:
+            return
+
+        self.entries = data.get('outputs', {})
+
+    def _key(self, path: str) -> str:
+        """Manifest key for an output path (relative to the app, POSIX separators)"""
+        return os.path.relpath(os.path.abspath(path), os.path.abspath(self.app_dir)).replace(os.sep, '/')
+
+    def template_hash(self, template_name: str) -> str:
+        """Hash of a template source, computed once per template"""
+        if template_name not in self._template_hashes:
+            from utils.template_registry import get_jinja_env
+            env = get_jinja_env()
+            source, _, _ = env.loader.get_source(env, template_name)
+            self._template_hashes[template_name] = hash_bytes(source.encode('utf-8'))
+        return self._template_hashes[template_name]
+
+    def inputs_hash(self, template_name: Optional[str], context: Dict) -> str:
+        """
+        Hash everything an output depends on.
+
+        Args:
+            template_name (str, optional): Template used to render the output, if any.
+            context (Dict): Render context (the config slice the output is built from).
+
+        Returns:
+            str: Hex digest identifying the inputs.
+        """
+        payload = json.dumps(context, sort_keys=True, default=_json_default, ensure_ascii=False)
+        parts = [GENERATOR_VERSION, template_name or '', self.template_hash(template_name) if template_name else '',
+                 payload]
+        return hash_bytes('\0'.join(parts).encode('utf-8'))
+
+    def is_fresh(self, path: str, inputs_hash: str) -> bool:
+        """Check if `path` was produced from the same inputs and was not modified since"""
+        key = self._key(path)
+        entry = self.entries.get(key)
+        if not entry or entry.get('inputs') != inputs_hash:
+            return False
+
+        if hash_file(path) != entry.get('output'):
+            return False
+
+        self.touched.add(key)
+        return True
+
+    def record(self, path: str, inputs_hash: str, output_hash: str, template_name: Optional[str] = None):
+        """Record the inputs and output hashes of a generated file"""
+        key = self._key(path)
+        self.entries[key] = {
+            'template': template_name,
+            'inputs': inputs_hash,
+            'output': output_hash,
+        }
+        self.touched.add(key)
+
+    def export_entries(self) -> Dict[str, Dict]:
+        """Entries touched in this run (used to merge results from worker processes)"""
+        return {key: self.entries[key] for key in self.touched if key in self.entries}
+
+    def merge_entries(self, entries: Dict[str, Dict]):
+        """Merge entries exported by another Manifest instance"""
+        self.entries.update(entries)
+        self.touched.update(entries)
+
+    def stale_outputs(self):
+        """Outputs recorded by a previous run that were not produced by this one"""
+        return sorted(key for key in self.entries if key not in self.touched)
+
+    def save(self, prune: bool = False):
+        """
+        Write the manifest to disk.
+
+        Args:
+            prune (bool): Drop entries for outputs not produced in this run.
+        """
+        if prune:
+            self.entries = {key: value for key, value in self.entries.items() if key in self.touched}
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        data = {
+            'generator_version': GENERATOR_VERSION,
+            'outputs': dict(sorted(self.entries.items())),
+        }
+        with open(self.path, 'w', encoding='utf-8', newline='\n') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.write('\n')
@@ -0,0 +1,227 @@
+"""
+Per-module generation options read from the module YAML.
+
+Every option has a default, so modules that do not declare it keep
+generating the same code as before.
+"""
+
+from collections.abc import Mapping
+
+DEFAULT_PAGE_SIZE = 20
+DEFAULT_SORT_FIELD = 'updatedAt'
+
+# Columns every generated table has, besides the module fields
+BUILTIN_SORT_FIELDS = ('updatedAt', 'createdAt', 'id')
+
+# Warnings already printed (options are read by several generators)
+_warned = set()
+
+
+def warn_once(module_name, message):
+    """Print a configuration warning once per module"""
+    if (module_name, message) not in _warned:
+        _warned.add((module_name, message))
+        print(f"⚠️ {module_name}: {message}")
+
+
+def get_pagination_options(module_config):
+    """
+    Keyset pagination settings of a module.
+
+    Example (module YAML):
+
+        pagination:
+          page_size: 50
+          sort_field: updatedAt   # or any field of the module
+          descending: true
+
+    Pages are ordered by (sort_field, id), so the last row of a page is the
+    cursor of the next one and no OFFSET scan is needed.
+
+    Args:
+        module_config (dict): Module configuration.
+
+    Returns:
+        dict: page_size (int), sort_field (str) and descending (bool).
+    """
+    module_name = module_config.get('name', 'unknown')
+    options = module_config.get('pagination') or {}
+    if not isinstance(options, Mapping):
+        warn_once(module_name, "'pagination' must be a mapping, using the defaults")
+        options = {}
+
+    page_size = options.get('page_size', DEFAULT_PAGE_SIZE)
+    if not isinstance(page_size, int) or isinstance(page_size, bool) or page_size <= 0:
+        warn_once(module_name, f"invalid pagination.page_size '{page_size}', using {DEFAULT_PAGE_SIZE}")
+        page_size = DEFAULT_PAGE_SIZE
+
+    sort_field = options.get('sort_field', DEFAULT_SORT_FIELD)
+    fields = {field.get('name'): field for field in module_config.get('fields', [])}
+    if sort_field not in BUILTIN_SORT_FIELDS:
+        field = fields.get(sort_field)
+        if field is None or field.get('type') in ('reference', 'List') or str(field.get('type', '')).startswith('List'):
+            warn_once(module_name, f"pagination.sort_field '{sort_field}' is not a scalar field, "
+                                   f"using {DEFAULT_SORT_FIELD}")
+            sort_field = DEFAULT_SORT_FIELD
+        elif not field.get('required', False):
+            # Keyset comparisons never match NULL, so those rows would be skipped
+            warn_once(module_name, f"pagination.sort_field '{sort_field}' is optional; "
+                                   f"rows without a value are not paginated")
+
+    return {
+        'page_size': page_size,
+        'sort_field': sort_field,
+        'descending': bool(options.get('descending', True)),
+    }
+
+
+DEFAULT_SEARCH_LIMIT = 50
+DEFAULT_SEARCH_TOKENIZER = 'unicode61 remove_diacritics 2'
+
+
+def get_search_options(module_config):
+    """
+    Full-text search settings of a module, or None when it has no `search:` block.
+
+    Example (module YAML):
+
+        search:
+          fields: [name, description]   # default: every String field
+          prefix: true                  # "rall" also matches "rally"
+          limit: 50                     # maximum number of results
+          tokenizer: unicode61 remove_diacritics 2
+
+    `search: true` enables it with the defaults. The module gets an FTS5 table
+    (`<table>_fts`) kept in sync with triggers.
+
+    Args:
+        module_config (dict): Module configuration.
+
+    Returns:
+        dict or None: fields, prefix, limit, tokenizer, table and fts_table.
+    """
+    options = module_config.get('search')
+    if not options:
+        return None
+
+    module_name = module_config.get('name', 'unknown')
+    if options is True:
+        options = {}
+    elif not isinstance(options, Mapping):
+        warn_once(module_name, "'search' must be a mapping or true, search index disabled")
+        return None
+
+    string_fields = [field['name'] for field in module_config.get('fields', [])
+                     if field.get('type') == 'String' and field.get('name')]
+
+    fields = options.get('fields') or string_fields
+    unknown = [name for name in fields if name not in string_fields]
+    if unknown:
+        warn_once(module_name, f"search.fields {unknown} are not String fields, ignoring them")
+        fields = [name for name in fields if name in string_fields]
+
+    if not fields:
+        warn_once(module_name, "no String fields to index, search index disabled")
+        return None
+
+    limit = options.get('limit', DEFAULT_SEARCH_LIMIT)
+    if not isinstance(limit, int) or isinstance(limit, bool) or limit <= 0:
+        warn_once(module_name, f"invalid search.limit '{limit}', using {DEFAULT_SEARCH_LIMIT}")
+        limit = DEFAULT_SEARCH_LIMIT
+
+    # Same table name as the CREATE TABLE statements
+    table = module_config['name'].lower()
+    return {
+        'fields': fields,
+        'prefix': bool(options.get('prefix', True)),
+        'limit': limit,
+        'tokenizer': options.get('tokenizer', DEFAULT_SEARCH_TOKENIZER),
+        'table': table,
+        'fts_table': f"{table}_fts",
+    }
+
+
+def get_isolate_threshold(module_config):
+    """
+    Row count from which a module decodes lists in the background worker isolate.
+
+    Example (module YAML):
+
+        isolate_threshold: 2000
+
+    Results with at least this many rows are converted to entities (and the
+    controller's list transforms run) in a long-lived worker isolate instead
+    of the UI isolate. Disabled when the option is absent.
+
+    Args:
+        module_config (dict): Module configuration.
+
+    Returns:
+        int or None: The threshold, or None when disabled.
+    """
+    threshold = module_config.get('isolate_threshold')
+    if threshold is None or threshold is False:
+        return None
+
+    if not isinstance(threshold, int) or isinstance(threshold, bool) or threshold <= 0:
+        warn_once(module_config.get('name', 'unknown'),
+                  f"invalid isolate_threshold '{threshold}', decoding stays on the UI isolate")
+        return None
+
+    return threshold
+
+
+def uses_background_worker(modules):
+    """True when any module has an isolate_threshold (the worker isolate service is generated)"""
+    return any(get_isolate_threshold(module) for module in modules)
+
+
+DEFAULT_CACHE_MAX_ENTRIES = 500
+
+
+def get_cache_options(module_config):
+    """
+    In-memory entity cache settings of a module, or None when it has no `cache:` block.
+
+    Example (module YAML):
+
+        cache:
+          max_entries: 500    # LRU size
+          ttl_seconds: 300    # default: entries do not expire
+
+    `cache: true` enables it with the defaults. Meant for small, frequently
+    read tables (categories, statuses); the repository invalidates entries
+    on every write it makes.
+
+    Args:
+        module_config (dict): Module configuration.
+
+    Returns:
+        dict or None: max_entries (int) and ttl_seconds (int or None).
+    """
+    options = module_config.get('cache')
+    if not options:
+        return None
+
+    module_name = module_config.get('name', 'unknown')
+    if options is True:
+        options = {}
+    elif not isinstance(options, Mapping):
+        warn_once(module_name, "'cache' must be a mapping or true, cache disabled")
+        return None
+
+    max_entries = options.get('max_entries', DEFAULT_CACHE_MAX_ENTRIES)
+    if not isinstance(max_entries, int) or isinstance(max_entries, bool) or max_entries <= 0:
+        warn_once(module_name, f"invalid cache.max_entries '{max_entries}', using {DEFAULT_CACHE_MAX_ENTRIES}")
+        max_entries = DEFAULT_CACHE_MAX_ENTRIES
+
+    ttl_seconds = options.get('ttl_seconds')
+    if ttl_seconds is not None and (not isinstance(ttl_seconds, int) or isinstance(ttl_seconds, bool)
+                                    or ttl_seconds <= 0):
+        warn_once(module_name, f"invalid cache.ttl_seconds '{ttl_seconds}', entries will not expire")
+        ttl_seconds = None
+
+    return {
+        'max_entries': max_entries,
+        'ttl_seconds': ttl_seconds,
+    }
@@ -0,0 +1,202 @@
+import os
+import json
+import time
+import cProfile
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+
+class Profiler:
+    """
+    Records the wall time, CPU time and bytes written of generation phases
+    and subprocess calls.
+
+    Spans can be nested (a phase containing subprocess calls or other phases)
+    and are exported as a Chrome trace (chrome://tracing, Perfetto), which is
+    plain JSON with an extra per-phase summary.
+
+    Spans of concurrent tasks may overlap, so every figure is taken from the
+    thread that runs the span: CPU time is the thread's own, and bytes come
+    from a per-thread counter (bytes are counted when they reach the disk, so
+    the bytes of a buffered FileManager go to the span that flushes it). Child
+    CPU time is only recorded on subprocess spans; it is process-wide and
+    includes any child reaped meanwhile (module generation workers, for instance).
+    """
+
+    def __init__(self, bytes_written: Optional[Callable[[], int]] = None):
+        """
+        Args:
+            bytes_written (Callable, optional): Returns the number of bytes written so far by
+                the current thread (e.g. file_manager.thread_bytes_written); used to attribute
+                bytes to each span.
+        """
+        self.bytes_written = bytes_written or (lambda: 0)
+        # Set by run_profiled while cProfile runs: it only traces the thread that enabled it,
+        # so generation tasks must run on the calling thread (see TaskScheduler `inline`)
+        self.python_profiling = False
+        self.events: List[Dict] = []
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, category: str = 'phase', **args):
+        """Record a span around the body of the `with` block"""
+        start = time.perf_counter()
+        thread_cpu = time.thread_time()
+        times = os.times()
+        bytes_before = self.bytes_written()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            end_thread_cpu = time.thread_time()
+            end_times = os.times()
+            event = {
+                'name': name,
+                'category': category,
+                'start': start - self._origin,
+                'wall': end - start,
+                'cpu': end_thread_cpu - thread_cpu,
+                'child_cpu': ((end_times.children_user - times.children_user) +
+                              (end_times.children_system - times.children_system)
+                              if category == 'subprocess' else 0.0),
+                'bytes_written': self.bytes_written() - bytes_before,
+                'thread': threading.get_ident(),
+                'args': args,
+            }
+            with self._lock:
+                self.events.append(event)
+
+    def phase(self, name: str):
+        """Record a generation phase"""
+        return self.span(name, 'phase')
+
+    def subprocess(self, cmd: List[str], cwd: Optional[str] = None):
+        """Record a subprocess call"""
+        name = ' '.join(os.path.basename(part) if i == 0 else part for i, part in enumerate(cmd[:3]))
+        return self.span(name, 'subprocess', command=' '.join(cmd), cwd=cwd)
+
+    def phase_totals(self) -> Dict[str, float]:
+        """Wall time per phase name, in the order phases first started"""
+        totals = {}
+        for event in sorted(self.events, key=lambda e: e['start']):
+            if event['category'] == 'phase':
+                totals[event['name']] = totals.get(event['name'], 0.0) + event['wall']
+        return totals
+
+    def count(self, category: str, since: int = 0, thread: Optional[int] = None) -> int:
+        """Spans of `category` recorded after the first `since` events (optionally by one thread only)"""
+        with self._lock:
+            events = self.events[since:]
+        return sum(1 for event in events
+                   if event['category'] == category and (thread is None or event['thread'] == thread))
+
+    def summary(self) -> List[Dict]:
+        """Aggregated wall time, CPU time, bytes and call count per (category, name)"""
+        rows = {}
+        for event in sorted(self.events, key=lambda e: e['start']):
+            row = rows.setdefault((event['category'], event['name']), {
+                'name': event['name'],
+                'category': event['category'],
+                'calls': 0,
+                'wall': 0.0,
+                'cpu': 0.0,
+                'child_cpu': 0.0,
+                'bytes_written': 0,
+            })
+            row['calls'] += 1
+            for key in ('wall', 'cpu', 'child_cpu', 'bytes_written'):
+                row[key] += event[key]
+        return list(rows.values())
+
+    def print_summary(self):
+        """Print the per-phase and per-subprocess table"""
+        rows = self.summary()
+        if not rows:
+            return
+
+        print(f"\n⏱️ Profile:")
+        print(f"  {'phase / subprocess':<40} {'calls':>5} {'wall':>9} {'cpu':>9} {'child cpu':>9} {'bytes':>11}")
+        for row in rows:
+            name = row['name'] if row['category'] == 'phase' else f"$ {row['name']}"
+            print(f"  {name[:40]:<40} {row['calls']:>5} {row['wall']:>8.3f}s {row['cpu']:>8.3f}s "
+                  f"{row['child_cpu']:>8.3f}s {row['bytes_written']:>11}")
+
+    def save_trace(self, path: str):
+        """
+        Write the recorded spans as a Chrome trace (JSON object format).
+
+        Args:
+            path (str): Output file.
+        """
+        pid = os.getpid()
+        threads = {}
+        trace_events = []
+        for event in sorted(self.events, key=lambda e: e['start']):
+            tid = threads.setdefault(event['thread'], len(threads) + 1)
+            trace_events.append({
+                'name': event['name'],
+                'cat': event['category'],
+                'ph': 'X',
+                'ts': round(event['start'] * 1e6, 3),
+                'dur': round(event['wall'] * 1e6, 3),
+                'pid': pid,
+                'tid': tid,
+                'args': {
+                    'cpu_ms': round(event['cpu'] * 1e3, 3),
+                    'child_cpu_ms': round(event['child_cpu'] * 1e3, 3),
+                    'bytes_written': event['bytes_written'],
+                    **event['args'],
+                },
+            })
+
+        _ensure_parent_dir(path)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'traceEvents': trace_events,
+                'displayTimeUnit': 'ms',
+                'summary': self.summary(),
+            }, f, indent=2)
+
+
+def _ensure_parent_dir(path: str):
+    """Create the directory of an output file if needed"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+
+def run_profiled(func: Callable, profiler: Profiler, trace_path: Optional[str] = None,
+                 pstats_path: Optional[str] = None):
+    """
+    Run `func`, then write the requested profiling outputs.
+
+    Args:
+        func (Callable): Function to run (e.g. AppGenerator.generate).
+        profiler (Profiler): Profiler the function records its spans in.
+        trace_path (str, optional): Where to write the JSON/Chrome trace.
+        pstats_path (str, optional): Where to dump the cProfile statistics of the Python side.
+
+    Returns:
+        The return value of `func`.
+    """
+    python_profile = cProfile.Profile() if pstats_path else None
+    if python_profile:
+        profiler.python_profiling = True
+        python_profile.enable()
+
+    try:
+        return func()
+    finally:
+        if python_profile:
+            python_profile.disable()
+            profiler.python_profiling = False
+            _ensure_parent_dir(pstats_path)
+            python_profile.dump_stats(pstats_path)
+            print(f"📊 Python profile written to {pstats_path} (python -m pstats {pstats_path})")
+
+        if trace_path:
+            profiler.print_summary()
+            profiler.save_trace(trace_path)
+            print(f"📊 Trace written to {trace_path} (open in chrome://tracing or ui.perfetto.dev)")
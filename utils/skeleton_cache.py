@@ -0,0 +1,225 @@
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+import subprocess
+from typing import List, Optional
+from utils.cache_paths import get_cache_dir
+
+
+# Bump when the way skeletons are created or patched changes
+SKELETON_FORMAT = '1'
+
+# Placeholders used when creating the cached skeleton. They are unique enough
+# to be replaced verbatim in every file produced by `flutter create`.
+PLACEHOLDER_NAME = 'fac_skeleton_app'
+PLACEHOLDER_CAMEL = 'facSkeletonApp'
+PLACEHOLDER_TITLE = 'Fac Skeleton App'
+PLACEHOLDER_ORG = 'com.facskeleton.org'
+
+# Generated artifacts that must not be copied into new projects
+EXCLUDED_ENTRIES = {'.dart_tool', 'build', '.flutter-plugins', '.flutter-plugins-dependencies', 'pubspec.lock'}
+
+
+class SkeletonCache:
+    """
+    Local cache of `flutter create` output.
+
+    The skeleton is created once per Flutter SDK version and platform set with
+    placeholder names, stored in the FAC user cache and then copied into every
+    new project, patching the project name and package identifiers. This avoids
+    running `flutter create` (the slowest single step of `fac new`) on every run.
+    """
+
+    def __init__(self, flutter_path: str, run=None):
+        """
+        Args:
+            flutter_path (str): Path to the Flutter executable.
+            run (Callable, optional): Replacement for subprocess.run (e.g. FlutterCLI._run).
+        """
+        self.flutter_path = flutter_path
+        self._run = run or subprocess.run
+        self._flutter_version = None
+
+    def get_flutter_version(self) -> str:
+        """
+        Return the Flutter SDK version (framework revision when available).
+
+        The version files of the SDK are read directly; `flutter --version`
+        is only run when they cannot be found.
+        """
+        if self._flutter_version:
+            return self._flutter_version
+
+        flutter_root = os.path.dirname(os.path.dirname(os.path.realpath(self.flutter_path)))
+        version = None
+
+        try:
+            with open(os.path.join(flutter_root, 'bin', 'cache', 'flutter.version.json'), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            version = f"{data.get('frameworkVersion')}-{data.get('frameworkRevision')}"
+        except (OSError, ValueError):
+            pass
+
+        if not version:
+            try:
+                with open(os.path.join(flutter_root, 'version'), 'r', encoding='utf-8') as f:
+                    version = f.read().strip()
+            except OSError:
+                pass
+
+        if not version:
+            result = self._run([self.flutter_path, '--version', '--machine'],
+                               check=True, capture_output=True, text=True)
+            data = json.loads(result.stdout[result.stdout.index('{'):])
+            version = f"{data.get('frameworkVersion')}-{data.get('frameworkRevision')}"
+
+        self._flutter_version = version
+        return version
+
+    def get_key(self, platforms: Optional[List[str]] = None) -> str:
+        """Cache key for a skeleton (Flutter version, platforms and skeleton format)"""
+        parts = [
+            SKELETON_FORMAT,
+            self.get_flutter_version(),
+            ','.join(sorted(platforms)) if platforms else 'default',
+            PLACEHOLDER_ORG,
+        ]
+        return hashlib.sha256('\0'.join(parts).encode('utf-8')).hexdigest()[:16]
+
+    def get_skeleton(self, platforms: Optional[List[str]] = None) -> str:
+        """
+        Return the path of the cached skeleton, creating it if needed.
+
+        Args:
+            platforms (List[str], optional): Platforms passed to `flutter create --platforms`.
+
+        Returns:
+            str: Path to the skeleton project directory.
+        """
+        skeleton_dir = os.path.join(get_cache_dir('skeletons'), self.get_key(platforms))
+        if os.path.isdir(skeleton_dir):
+            return skeleton_dir
+
+        print("🦴 Creating Flutter skeleton cache (only on the first run for this Flutter version)...")
+        work_dir = tempfile.mkdtemp(prefix='skeleton-', dir=get_cache_dir('skeletons'))
+        try:
+            project_dir = os.path.join(work_dir, PLACEHOLDER_NAME)
+            cmd = [
+                self.flutter_path,
+                'create',
+                '--no-pub',
+                '--org', PLACEHOLDER_ORG,
+                '--project-name', PLACEHOLDER_NAME,
+            ]
+            if platforms:
+                cmd.extend(['--platforms', ','.join(platforms)])
+            cmd.append(project_dir)
+
+            self._run(cmd, check=True, capture_output=True, text=True)
+
+            for entry in EXCLUDED_ENTRIES:
+                path = os.path.join(project_dir, entry)
+                if os.path.isdir(path):
+                    shutil.rmtree(path)
+                elif os.path.exists(path):
+                    os.remove(path)
+
+            # Publish atomically: another process may have created it meanwhile
+            try:
+                os.rename(project_dir, skeleton_dir)
+            except OSError:
+                if not os.path.isdir(skeleton_dir):
+                    raise
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+        return skeleton_dir
+
+    def create_project(self, name: str, org: str, project_dir: str, platforms: Optional[List[str]] = None):
+        """
+        Create a project by copying the cached skeleton and patching its identifiers.
+
+        Args:
+            name (str): Dart package name of the project.
+            org (str): Organization domain name (e.g., com.example).
+            project_dir (str): Directory of the new project (must not exist or be empty).
+            platforms (List[str], optional): Platforms of the skeleton.
+        """
+        skeleton_dir = self.get_skeleton(platforms)
+
+        # Files are copied (not hardlinked): generators rewrite them in place,
+        # which would otherwise corrupt the cached skeleton.
+        shutil.copytree(skeleton_dir, project_dir, dirs_exist_ok=True)
+
+        replacements = [
+            (PLACEHOLDER_ORG, org),
+            (PLACEHOLDER_NAME, name),
+            (PLACEHOLDER_CAMEL, self._to_camel_case(name)),
+            (PLACEHOLDER_TITLE, self._to_title_case(name)),
+        ]
+
+        self._move_package_dirs(project_dir, org, name)
+        self._rename_paths(project_dir, name)
+
+        for root, _, files in os.walk(project_dir):
+            for file_name in files:
+                self._patch_file(os.path.join(root, file_name), replacements)
+
+    def _move_package_dirs(self, project_dir: str, org: str, name: str):
+        """Move the Android source package (com/facskeleton/org/fac_skeleton_app) to the project package"""
+        old_parts = PLACEHOLDER_ORG.split('.') + [PLACEHOLDER_NAME]
+        new_parts = org.split('.') + [name]
+
+        for language in ('kotlin', 'java'):
+            source_root = os.path.join(project_dir, 'android', 'app', 'src', 'main', language)
+            old_dir = os.path.join(source_root, *old_parts)
+            if not os.path.isdir(old_dir):
+                continue
+
+            new_dir = os.path.join(source_root, *new_parts)
+            os.makedirs(os.path.dirname(new_dir), exist_ok=True)
+            shutil.move(old_dir, new_dir)
+
+            # Remove the now empty placeholder directories
+            for depth in range(len(old_parts) - 1, 0, -1):
+                path = os.path.join(source_root, *old_parts[:depth])
+                if os.path.isdir(path) and not os.listdir(path):
+                    os.rmdir(path)
+
+    def _rename_paths(self, project_dir: str, name: str):
+        """Rename files and directories named after the placeholder (e.g. fac_skeleton_app.iml)"""
+        for root, dirs, files in os.walk(project_dir, topdown=False):
+            for entry in files + dirs:
+                if PLACEHOLDER_NAME in entry:
+                    os.rename(os.path.join(root, entry),
+                              os.path.join(root, entry.replace(PLACEHOLDER_NAME, name)))
+
+    def _patch_file(self, path: str, replacements):
+        """Replace the placeholders in a text file (binary files are left untouched)"""
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            content = data.decode('utf-8')
+        except (OSError, UnicodeDecodeError):
+            return
+
+        patched = content
+        for old, new in replacements:
+            patched = patched.replace(old, new)
+
+        if patched != content:
+            with open(path, 'wb') as f:
+                f.write(patched.encode('utf-8'))
+
+    @staticmethod
+    def _to_camel_case(name: str) -> str:
+        """Same camel case `flutter create` uses for iOS/macOS bundle identifiers"""
+        words = name.split('_')
+        return words[0] + ''.join(word.capitalize() for word in words[1:])
+
+    @staticmethod
+    def _to_title_case(name: str) -> str:
+        """Same title case `flutter create` uses for display names"""
+        return ' '.join(word.capitalize() for word in name.split('_') if word)
@@ -0,0 +1,276 @@
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Dict, Iterable, List, Optional
+
+# Failure policies
+FAIL = 'fail'                        # abort the run: the error is raised once the running tasks finish
+CONTINUE = 'continue'                # report the error and keep going (dependents still run)
+SKIP_DEPENDENTS = 'skip-dependents'  # report the error and skip every task that depends on this one
+
+# Resource tags: CPU-bound rendering (one at a time, it holds the GIL) and external processes
+CPU = 'cpu'
+SUBPROCESS = 'subprocess'
+
+DEFAULT_RESOURCES = {CPU: 1, SUBPROCESS: 1}
+
+
+class Task:
+    """
+    A unit of work of a generation run.
+
+    Args:
+        name (str): Task name, also the profiler phase name.
+        func (Callable): Work to do (no arguments).
+        deps (Iterable[str]): Tasks that must finish before this one starts. Unknown names are ignored
+            (tasks disabled for this configuration are simply not declared).
+        resource (str): CPU for rendering, SUBPROCESS for Flutter/Firebase commands.
+        on_failure (str): FAIL, CONTINUE or SKIP_DEPENDENTS.
+        error (str): Message printed on failure, formatted with `error` (the exception).
+        hints (Iterable[str]): Extra lines printed after the error message.
+    """
+
+    def __init__(self, name: str, func: Callable[[], None], deps: Iterable[str] = (), resource: str = CPU,
+                 on_failure: str = CONTINUE, error: Optional[str] = None, hints: Iterable[str] = ()):
+        if on_failure not in (FAIL, CONTINUE, SKIP_DEPENDENTS):
+            raise ValueError(f"Unknown failure policy '{on_failure}' for task '{name}'")
+        self.name = name
+        self.func = func
+        self.deps = list(deps)
+        self.resource = resource
+        self.on_failure = on_failure
+        self.error = error or f"❌ Error in {name}: {{error}}"
+        self.hints = list(hints)
+
+    def __repr__(self):
+        return f"Task({self.name!r}, deps={self.deps}, resource={self.resource!r})"
+
+
+class _OrderedOutput:
+    """
+    stdout replacement that keeps the output of concurrent tasks in declaration order.
+
+    The earliest unfinished task writes through; later tasks are buffered and
+    their output is released, in order, as the tasks before them finish.
+    """
+
+    def __init__(self, stream, count: int):
+        self.stream = stream
+        self._count = count
+        self._buffers: List[List[str]] = [[] for _ in range(count)]
+        self._finished = set()
+        self._head = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def bind(self, index: Optional[int]):
+        """Attribute what the current thread prints to task `index` (None: write through)"""
+        self._local.index = index
+
+    def write(self, text: str) -> int:
+        index = getattr(self._local, 'index', None)
+        with self._lock:
+            if index is None or index == self._head:
+                self.stream.write(text)
+            else:
+                self._buffers[index].append(text)
+        return len(text)
+
+    def write_for(self, index: int, text: str):
+        """Write on behalf of task `index` (messages printed by the scheduler itself)"""
+        with self._lock:
+            if index == self._head:
+                self.stream.write(text)
+            else:
+                self._buffers[index].append(text)
+
+    def finish(self, index: int):
+        """Mark task `index` as finished and release the buffered output that is now in order"""
+        with self._lock:
+            self._finished.add(index)
+            while self._head in self._finished:
+                self._head += 1
+                if self._head < self._count:
+                    self.stream.write(''.join(self._buffers[self._head]))
+                    self._buffers[self._head] = []
+
+    def flush(self):
+        self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+def detach_output():
+    """
+    Restore the stdout replaced by a running scheduler.
+
+    Called by processes forked while a scheduler runs (module generation
+    workers), which print straight to their inherited stream.
+    """
+    if isinstance(sys.stdout, _OrderedOutput):
+        sys.stdout = sys.stdout.stream
+
+
+class TaskScheduler:
+    """
+    Runs a DAG of tasks, overlapping independent work.
+
+    A task starts once its dependencies finished and a slot of its resource is
+    free, so CPU rendering overlaps with subprocesses (templates render while
+    `flutter pub get` runs) while rendering itself stays sequential. Ready tasks
+    start in declaration order and their output is printed in declaration
+    order, so logs are the same from one run to the next.
+
+    With `inline`, tasks run one at a time on the calling thread, in
+    declaration order (a valid topological order): cProfile only traces the
+    thread that enabled it, so `--cprofile` runs need every task there.
+    """
+
+    def __init__(self, tasks: List[Task], resources: Optional[Dict[str, int]] = None, profiler=None,
+                 inline: bool = False):
+        """
+        Args:
+            tasks (List[Task]): Tasks in declaration (output) order.
+            resources (Dict[str, int], optional): Concurrent slots per resource tag.
+            profiler (Profiler, optional): Records each task as a phase.
+            inline (bool, optional): Run the tasks sequentially on the calling thread.
+        """
+        names = [task.name for task in tasks]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate task names: {', '.join(duplicates)}")
+
+        self.tasks = tasks
+        self.resources = dict(DEFAULT_RESOURCES, **(resources or {}))
+        self.profiler = profiler
+        self.inline = inline
+
+        index = {task.name: i for i, task in enumerate(tasks)}
+        self._deps = [[index[dep] for dep in task.deps if dep in index] for task in tasks]
+        for i, deps in enumerate(self._deps):
+            if any(dep >= i for dep in deps):
+                # Declaração em ordem topológica: garante que não há ciclos
+                raise ValueError(f"Task '{tasks[i].name}' must be declared after its dependencies")
+
+    def run(self) -> Dict[str, str]:
+        """
+        Run every task.
+
+        Returns:
+            Dict[str, str]: Task name -> 'done', 'failed' or 'skipped'.
+
+        Raises:
+            Exception: The error of the first task with the FAIL policy that failed.
+        """
+        status: Dict[str, str] = {}
+        if not self.tasks:
+            return status
+        if self.inline:
+            return self._run_inline(status)
+
+        output = _OrderedOutput(sys.stdout, len(self.tasks))
+        pending = list(range(len(self.tasks)))
+        running = {}
+        busy = {resource: 0 for resource in self.resources}
+        blocked = set()
+        fatal = None
+
+        previous_stdout, sys.stdout = sys.stdout, output
+        try:
+            with ThreadPoolExecutor(max_workers=sum(self.resources.values())) as executor:
+                while pending or running:
+                    if fatal is None:
+                        for i in list(pending):
+                            task = self.tasks[i]
+                            if any(dep in blocked for dep in self._deps[i]):
+                                pending.remove(i)
+                                blocked.add(i)
+                                status[task.name] = 'skipped'
+                                skipped = ', '.join(self.tasks[dep].name for dep in self._deps[i] if dep in blocked)
+                                output.write_for(i, f"⏭️ Skipping {task.name} (depends on {skipped})\n")
+                                output.finish(i)
+                                continue
+                            if any(self.tasks[dep].name not in status for dep in self._deps[i]):
+                                continue
+                            if busy.get(task.resource, 0) >= self.resources.get(task.resource, 1):
+                                continue
+                            pending.remove(i)
+                            busy[task.resource] = busy.get(task.resource, 0) + 1
+                            running[executor.submit(self._run_task, i, output)] = i
+                    elif pending:
+                        # Execução abortada: as tarefas que não começaram não rodam mais
+                        for i in pending:
+                            status[self.tasks[i].name] = 'skipped'
+                            output.finish(i)
+                        pending = []
+
+                    if not running:
+                        if pending and fatal is None:
+                            names = ', '.join(self.tasks[i].name for i in pending)
+                            raise RuntimeError(f"Tasks cannot be scheduled (no free '{self.tasks[pending[0]].resource}' "
+                                               f"slot): {names}")
+                        continue
+
+                    finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in sorted(finished, key=running.get):
+                        i = running.pop(future)
+                        task = self.tasks[i]
+                        busy[task.resource] -= 1
+                        error = future.result()
+                        status[task.name] = 'failed' if error is not None else 'done'
+                        if error is not None:
+                            if task.on_failure == FAIL and fatal is None:
+                                fatal = error
+                            elif task.on_failure == SKIP_DEPENDENTS:
+                                blocked.add(i)
+                        output.finish(i)
+        finally:
+            sys.stdout = previous_stdout
+
+        if fatal is not None:
+            raise fatal
+        return status
+
+    def _run_inline(self, status: Dict[str, str]) -> Dict[str, str]:
+        """Run every task on the calling thread, in declaration order (same policies as run())"""
+        blocked = set()
+        for i, task in enumerate(self.tasks):
+            failed_deps = [dep for dep in self._deps[i] if dep in blocked]
+            if failed_deps:
+                blocked.add(i)
+                status[task.name] = 'skipped'
+                print(f"⏭️ Skipping {task.name} (depends on {', '.join(self.tasks[dep].name for dep in failed_deps)})")
+                continue
+
+            error = self._run_task(i)
+            status[task.name] = 'failed' if error is not None else 'done'
+            if error is not None:
+                if task.on_failure == FAIL:
+                    for later in self.tasks[i + 1:]:
+                        status[later.name] = 'skipped'
+                    raise error
+                if task.on_failure == SKIP_DEPENDENTS:
+                    blocked.add(i)
+        return status
+
+    def _run_task(self, index: int, output: Optional[_OrderedOutput] = None):
+        """Run one task (on a worker thread, or inline without `output`); returns its exception, if any"""
+        task = self.tasks[index]
+        if output is not None:
+            output.bind(index)
+        try:
+            if self.profiler is not None:
+                with self.profiler.phase(task.name):
+                    task.func()
+            else:
+                task.func()
+            return None
+        except Exception as e:
+            print(task.error.format(error=e))
+            for hint in task.hints:
+                print(hint)
+            return e
+        finally:
+            if output is not None:
+                output.bind(None)
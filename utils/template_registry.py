@@ -0,0 +1,61 @@
+import os
+import threading
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
+from utils.cache_paths import get_cache_dir
+
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'templates')
+
+
+class TemplateRegistry:
+    """
+    Process-wide registry of Jinja2 templates shared by every generator.
+
+    Templates are loaded and compiled once per process (unbounded environment
+    cache, no auto reload) and the compiled bytecode is persisted on disk, so
+    later `fac` runs skip Jinja compilation entirely. Each bytecode bucket is
+    validated against the checksum of the template source, so editing a
+    template invalidates only its own entry.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self, template_dir: str = TEMPLATE_DIR, use_bytecode_cache: bool = True):
+        self.template_dir = template_dir
+
+        bytecode_cache = None
+        if use_bytecode_cache and not os.environ.get('FAC_NO_BYTECODE_CACHE'):
+            try:
+                bytecode_cache = FileSystemBytecodeCache(get_cache_dir('jinja'), '%s.cache')
+            except OSError as e:
+                print(f"⚠️ Template bytecode cache disabled: {e}")
+
+        self.environment = Environment(
+            loader=FileSystemLoader(template_dir),
+            bytecode_cache=bytecode_cache,
+            auto_reload=False,
+            cache_size=-1,
+        )
+
+    @classmethod
+    def instance(cls) -> 'TemplateRegistry':
+        """Return the shared registry, creating it on first use."""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def get_template(self, name: str):
+        """Return the compiled template registered under `name`."""
+        return self.environment.get_template(name)
+
+    def render(self, name: str, **context) -> str:
+        """Render the template `name` with the given context."""
+        return self.get_template(name).render(**context)
+
+
+def get_jinja_env() -> Environment:
+    """Return the shared Jinja2 environment used by all generators."""
+    return TemplateRegistry.instance().environment
@@ -1,23 +1,62 @@
-import inflect
-from inflector import Inflector
+from functools import lru_cache
+
+# Resultados de flexão guardados por (idioma, operação, palavra)
+CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=None)
+def _engine(language):
+    """
+    Inflection engine of a language, built on first use and shared.
+
+    inflect and inflector are imported here, so importing this module (and
+    `fac --help`) does not load them.
+    """
+    if language == 'en':
+        import inflect
+        return inflect.engine()
+    if language == 'pt':
+        from inflector import Inflector
+        return Inflector('pt')
+    return None
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _pluralize(language, word):
+    if language == 'en':
+        return _engine(language).plural(word)
+    elif language == 'pt':
+        return _engine(language).pluralize(word)
+    return word
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _singularize(language, word):
+    if language == 'en':
+        singular = _engine(language).singular_noun(word)
+        return singular if singular else word
+    elif language == 'pt':
+        return _engine(language).singularize(word)
+    return word
 
 
 class WordProcessor:
     def __init__(self, language='en'):
         """
         Initialize the WordInflector with a specific language.
+
+        The inflection engine is only created when a word is first processed,
+        and results are memoized in bounded LRU caches shared by every
+        instance.
         Args:
             language (str): Language code ('en' for English, 'pt' for Portuguese).
         """
         self.language = language
 
-        # Initialize inflection engines based on language
-        if language == 'en':
-            self.engine = inflect.engine()
-        elif language == 'pt':
-            self.engine = Inflector('pt')
-        else:
-            self.engine = None
+    @property
+    def engine(self):
+        """Inflection engine of the language (None for unsupported languages)"""
+        return _engine(self.language)
 
     def pluralize(self, word):
         """
@@ -27,12 +66,7 @@ class WordProcessor:
         Returns:
             str: The pluralized word.
         """
-        if self.language == 'en':
-            return self.engine.plural(word)
-        elif self.language == 'pt':
-            return self.engine.pluralize(word)
-        else:
-            return word
+        return _pluralize(self.language, word)
 
     def singularize(self, word):
         """
@@ -42,13 +76,7 @@ class WordProcessor:
         Returns:
             str: The singular form of the word.
         """
-        if self.language == 'en':
-            singular = self.engine.singular_noun(word)
-            return singular if singular else word
-        elif self.language == 'pt':
-            return self.engine.singularize(word)
-        else:
-            return word
+        return _singularize(self.language, word)
 
     def is_plural(self, word):
         """
@@ -62,7 +90,7 @@ class WordProcessor:
             singular = self.engine.singular_noun(word)
             return bool(singular)
         elif self.language == 'pt':
-            return word != self.engine.singularize(word)
+            return word != _singularize(self.language, word)
         else:
             return False
 
@@ -108,4 +136,30 @@ class WordProcessor:
         if count == 1:
             return self.singularize(noun)
         else:
-            return self.pluralize(noun)
\ No newline at end of file
+            return self.pluralize(noun)
+
+    def pluralize_many(self, words):
+        """
+        Convert a list of words to their plural forms in one call.
+        Args:
+            words (Iterable[str]): The words to pluralize.
+        Returns:
+            list: The pluralized words, in the same order.
+        """
+        return [_pluralize(self.language, word) for word in words]
+
+    def singularize_many(self, words):
+        """
+        Convert a list of words to their singular forms in one call.
+        Args:
+            words (Iterable[str]): The words to singularize.
+        Returns:
+            list: The singular forms, in the same order.
+        """
+        return [_singularize(self.language, word) for word in words]
+
+    @staticmethod
+    def clear_cache():
+        """Empty the inflection caches (the engines are kept)"""
+        _pluralize.cache_clear()
+        _singularize.cache_clear()